@@ -0,0 +1,236 @@
+"""
+Batch mode for the World-Space Conversion tool. It applies or cleans up setups across many scene files at once, through mayapy with no UI.
+
+Description - A job spec is a JSON file that lists the scene files and what to do with them. The files are handed out to a pool of worker
+processes, every worker starts its own Maya session and works through the files one at a time - open, apply or delete, save. Every file gets an
+entry in the result manifest with the locators it made or removed and every error and warning, so one bad file never stops the others. A file
+that has an error is left as it was on disk.
+
+The job spec -
+    {
+        "operation": "apply",                                       "apply" OR "delete"
+        "files": ["shotA.ma", {"file": "shotB.ma", "ranges": []}],  A FILE CAN OVERRIDE ANY OF THE KEYS HERE. RELATIVE PATHS START AT THE JOB FILE
+        "controls": ["arm_L_ctrl", "arm_R_ctrl"],                   A DELETE WITHOUT CONTROLS REMOVES EVERY SETUP IN THE SCENE
+        "ranges": [[10, 40], [60, 90]],                             ONE PARTIAL-RANGE SETUP PER RANGE, WITHOUT RANGES IT'S ONE OVER THE WHOLE PLAYBACK RANGE
+        "constraintType": "parent",                                 "parent", "orient" OR "point"
+        "entries": [["foot_L_ctrl", 12, 30, "parent"], ...],        INSTEAD OF controls AND ranges, EVERY CONTROL OVER ITS OWN RANGE (SEE applyEntries() IN THE TOOL)
+        "settings": {"smartBake": true},                            ANY OF THE TOOL'S DEFAULT_BAKE_SETTINGS
+        "output": "{dir}/converted/{name}{ext}"                     WHERE TO SAVE, WITHOUT IT THE FILE IS SAVED OVER
+    }
+
+With --backend fake the workers run on the headless stand-in from benchmarks/fakeMaya.py instead of Maya, where a scene file is JSON, so a job
+can be checked anywhere Python runs.
+
+Usage - mayapy World_Space_Conversion_Batch.py job.json [--workers N] [--manifest manifest.json] [--backend maya|fake]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+import multiprocessing
+
+
+OPERATIONS = ["apply", "delete"]
+#THE KEYS A FILE ENTRY CAN OVERRIDE
+TASK_KEYS = ["operation", "controls", "ranges", "entries", "constraintType", "settings", "output"]
+
+#THE TOOL AS THIS WORKER IMPORTED IT, SET BY startWorker() ONCE THE WORKER'S MAYA SESSION IS UP
+tool = None
+
+
+def startWorker(backend):
+    #RUNS ONCE IN EVERY WORKER PROCESS, SO EVERY WORKER PAYS FOR STARTING MAYA ONCE AND NOT ONCE PER FILE
+    global tool
+    root = os.path.dirname(os.path.abspath(__file__))
+    if backend == "fake":
+        sys.path.insert(0, os.path.join(root, "benchmarks"))
+        import fakeMaya
+        tool = fakeMaya.loadTool()[0]
+    else:
+        import maya.standalone
+        maya.standalone.initialize(name="python")
+        sys.path.insert(0, root)
+        import World_Space_Conversion_UI
+        tool = World_Space_Conversion_UI
+
+
+def readJob(jobPath):
+    #TURNS THE JOB SPEC INTO ONE TASK PER FILE, WITH THE FILE'S OWN KEYS LAID OVER THE JOB'S
+    with open(jobPath) as jobFile:
+        job = json.load(jobFile)
+    root = os.path.dirname(os.path.abspath(jobPath))
+    tasks = []
+    for entry in job.get("files", []):
+        if not isinstance(entry, dict):
+            entry = {"file": entry}
+        task = {"operation": "apply", "controls": None, "ranges": None, "entries": None, "constraintType": "parent", "settings": {}, "output": None}
+        task.update(dict([(key, job[key]) for key in TASK_KEYS if key in job]))
+        task.update(entry)
+        task["file"] = os.path.join(root, task["file"])
+        tasks.append(task)
+    return tasks
+
+
+def checkTask(task):
+    #CHECKS A TASK BEFORE IT'S SENT TO A WORKER, SO A TYPO IN THE JOB SPEC DOESN'T COST A MAYA SESSION. THE CONTROLS AND CONSTRAINT TYPE ARE CHECKED AGAINST THE SCENE ONCE IT'S OPEN
+    errors = []
+    if task["operation"] not in OPERATIONS:
+        errors.append("Unknown operation '{0}', it has to be one of {1}".format(task["operation"], ", ".join(OPERATIONS)))
+    if not os.path.isfile(task["file"]):
+        errors.append("The scene file doesn't exist - {0}".format(task["file"]))
+    if task["operation"] == "apply" and not task["controls"] and not task["entries"]:
+        errors.append("An apply needs at least one control or entry")
+    for timeRange in task["ranges"] or []:
+        if len(timeRange) != 2 or timeRange[0] < 0 or timeRange[0] > timeRange[1]:
+            errors.append("A range has to be [start, end], with 0 <= start <= end - {0}".format(timeRange))
+    return errors
+
+
+def getOutputPath(task):
+    #THE OUTPUT PATTERN CAN USE THE {dir}, {name} AND {ext} OF THE SCENE FILE
+    if task["output"] == None:
+        return task["file"]
+    directory, fileName = os.path.split(task["file"])
+    name, ext = os.path.splitext(fileName)
+    return os.path.abspath(task["output"].format(dir=directory, name=name, ext=ext))
+
+
+def getResult(task):
+    return {"file": task["file"], "output": None, "operation": task["operation"], "status": "failed", "locators": [], "deleted": [], "errors": [], "warnings": [], "seconds": 0.0}
+
+
+def applyTask(task, settings, result):
+    #PLANS AND CONVERTS EVERY RANGE THE SAME WAY THE APPLY BUTTONS DO, AND STOPS AT THE FIRST RANGE THAT HAS AN ERROR. ENTRIES ARE PLANNED AND BAKED ALL TOGETHER
+    cmds = tool.cmds
+    if task["entries"]:
+        result["locators"], result["errors"], result["warnings"] = tool.applyEntries(task["entries"], settings, task["constraintType"])
+        return
+
+    if task["ranges"]:
+        ranges = [(float(timelineStart), float(timelineEnd), True) for timelineStart, timelineEnd in task["ranges"]]
+    else:
+        ranges = [(cmds.playbackOptions(min=True, q=True), cmds.playbackOptions(max=True, q=True), False)]
+
+    for timelineStart, timelineEnd, specificTimelineMode in ranges:
+        plan, errors, warnings = tool.planConversion(task["controls"], task["constraintType"], timelineStart, timelineEnd, specificTimelineMode, settings["matrixDriver"])
+        result["warnings"] += warnings
+        if len(errors) != 0:
+            result["errors"] += ["{0}-{1}: {2}".format(timelineStart, timelineEnd, error) for error in errors]
+            return
+        tempControls, savedEvaluations = tool.convertControls(plan, task["constraintType"], timelineStart, timelineEnd, specificTimelineMode, settings)
+        result["locators"] += tempControls
+
+
+def deleteTask(task, settings, result):
+    #BAKES DOWN AND REMOVES THE SETUPS OF THE GIVEN CONTROLS, OR EVERY SETUP IN THE SCENE
+    if task["controls"]:
+        locators = []
+        for control in task["controls"]:
+            records = tool.setupRegistry.getSetups(control)
+            if len(records) == 0:
+                result["warnings"].append("This control has no locator setups - {0}".format(control))
+            locators += [record["locator"] for record in records]
+    else:
+        locators = [record["locator"] for record in tool.setupRegistry.getAllSetups()]
+    result["deleted"], skippedObjects = tool.deleteSetups(locators, settings)
+
+
+def processFile(task):
+    #OPENS ONE SCENE, RUNS ITS TASK AS ONE SCENE OPERATION AND SAVES IT. WHATEVER HAPPENS, IT COMES BACK AS THE FILE'S ENTRY IN THE MANIFEST
+    cmds = tool.cmds
+    result = getResult(task)
+    started = time.time()
+    try:
+        cmds.file(task["file"], open=True, force=True)
+        #THE REGISTRY'S CALLBACKS NOTICE THE NEW SCENE IN MAYA, THE BATCH DOESN'T COUNT ON THEM
+        tool.setupRegistry.invalidate()
+
+        missingControls = [control for control in task["controls"] or [] if not cmds.objExists(control)]
+        result["errors"] += ["The control doesn't exist in this scene - {0}".format(control) for control in missingControls]
+        if task["constraintType"] not in tool.CONSTRAINT_TYPES:
+            result["errors"].append("Unknown constraint type '{0}', it has to be one of {1}".format(task["constraintType"], ", ".join(tool.CONSTRAINT_TYPES)))
+        unknownSettings = [key for key in task["settings"] if key not in tool.DEFAULT_BAKE_SETTINGS]
+        result["errors"] += ["Unknown bake setting - {0}".format(key) for key in unknownSettings]
+        settings = dict(tool.DEFAULT_BAKE_SETTINGS)
+        settings.update(task["settings"])
+
+        if len(result["errors"]) == 0:
+            #AN OPERATION THAT ABORTS THROUGH assistMessage() IS UNDONE AND STOPS QUIETLY INSIDE THE SCENE OPERATION, SO WE CHECK THAT IT GOT TO THE END
+            finished = False
+            with tool.SceneOperation("World-Space Batch {0}".format(task["operation"].capitalize())):
+                if task["operation"] == "apply":
+                    applyTask(task, settings, result)
+                else:
+                    deleteTask(task, settings, result)
+                finished = True
+            if not finished:
+                result["errors"].append("The operation was aborted, nothing was changed. Its message is in the Maya output")
+
+        if len(result["errors"]) == 0:
+            output = getOutputPath(task)
+            if not os.path.isdir(os.path.dirname(output)):
+                os.makedirs(os.path.dirname(output))
+            cmds.file(rename=output)
+            cmds.file(save=True, force=True, type="mayaBinary" if output.lower().endswith(".mb") else "mayaAscii")
+            result["output"] = output
+            result["status"] = "done"
+    except (Exception, SystemExit):
+        result["errors"].append(traceback.format_exc())
+    if result["status"] != "done":
+        result["locators"] = []
+        result["deleted"] = []
+    result["seconds"] = time.time() - started
+    return result
+
+
+def runJob(jobPath, workers=None, manifestPath=None, backend="maya"):
+    #RUNS EVERY FILE OF THE JOB AND WRITES THE MANIFEST. RETURNS THE MANIFEST
+    started = time.time()
+    tasks = readJob(jobPath)
+    results = [None] * len(tasks)
+    pending = []
+    for index, task in enumerate(tasks):
+        errors = checkTask(task)
+        if len(errors) != 0:
+            results[index] = getResult(task)
+            results[index]["errors"] = errors
+        else:
+            pending.append(index)
+
+    if len(pending) != 0:
+        workers = max(1, min(workers or multiprocessing.cpu_count(), len(pending)))
+        pool = multiprocessing.Pool(workers, startWorker, (backend,))
+        try:
+            for count, (index, result) in enumerate(zip(pending, pool.imap(processFile, [tasks[index] for index in pending]))):
+                results[index] = result
+                print("[{0}/{1}] {2} - {3} ({4:.1f}s)".format(count + 1, len(pending), result["file"], result["status"], result["seconds"]))
+        finally:
+            pool.close()
+            pool.join()
+
+    manifest = {"job": os.path.abspath(jobPath), "backend": backend, "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+                "seconds": time.time() - started, "failed": len([result for result in results if result["status"] != "done"]), "files": results}
+    manifestPath = manifestPath or os.path.splitext(jobPath)[0] + "_manifest.json"
+    with open(manifestPath, "w") as manifestFile:
+        json.dump(manifest, manifestFile, indent=4, sort_keys=True)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply or clean up World-Space Conversion setups across many scene files.")
+    parser.add_argument("job", help="the JSON job spec")
+    parser.add_argument("--workers", type=int, default=None, help="how many Maya sessions to run at once, one per CPU by default")
+    parser.add_argument("--manifest", default=None, help="where to write the result manifest, next to the job spec by default")
+    parser.add_argument("--backend", choices=["maya", "fake"], default="maya")
+    args = parser.parse_args()
+
+    manifest = runJob(args.job, args.workers, args.manifest, args.backend)
+    print("{0} files, {1} failed, {2:.1f}s".format(len(manifest["files"]), manifest["failed"], manifest["seconds"]))
+    return 1 if manifest["failed"] != 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
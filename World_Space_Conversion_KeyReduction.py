@@ -0,0 +1,99 @@
+"""
+Key reduction for the World-Space Conversion tool. It's plain Python with no Maya imports, so it can be run and checked outside of Maya.
+
+Description - Takes densely sampled channels (one key per baked frame) and returns a reduced set of keys, with the slope of every key, that stays
+within a maximum error of every sample. Keys are added one at a time where the error is the largest, until the whole curve is within the tolerance.
+That's a greedy search, so the set is small but not always the smallest one there is. The slopes follow the way Maya's auto tangents work, and the
+error is only guaranteed with those exact slopes, so they're meant to be written onto the kept keys as fixed tangents.
+"""
+
+import heapq
+import bisect
+
+
+def getAutoSlope(times, values, keys, position):
+    #WORKS OUT THE SLOPE MAYA'S AUTO TANGENTS WOULD GIVE A KEY - A SMOOTH SLOPE THROUGH ITS NEIGHBOURS, FLAT ON THE ENDS AND ON PEAKS, AND CLAMPED SO THE CURVE DOESN'T OVERSHOOT
+    if position == 0 or position == len(keys) - 1:
+        return 0.0
+    previous, key, next = keys[position - 1], keys[position], keys[position + 1]
+    leftSecant = (values[key] - values[previous]) / (times[key] - times[previous])
+    rightSecant = (values[next] - values[key]) / (times[next] - times[key])
+    if leftSecant * rightSecant <= 0:
+        return 0.0
+    slope = (values[next] - values[previous]) / (times[next] - times[previous])
+    limit = 3 * min(abs(leftSecant), abs(rightSecant))
+    return max(-limit, min(limit, slope))
+
+
+def getAutoSlopes(times, values, keys):
+    return [getAutoSlope(times, values, keys, position) for position in range(len(keys))]
+
+
+def evaluateSegment(times, values, startKey, endKey, startSlope, endSlope, sample):
+    #EVALUATES THE CURVE BETWEEN TWO KEYS AT A SAMPLE'S TIME, THE SAME WAY A NON-WEIGHTED ANIM CURVE DOES IT
+    span = times[endKey] - times[startKey]
+    s = (times[sample] - times[startKey]) / span
+    return ((2 * s ** 3 - 3 * s ** 2 + 1) * values[startKey] + (s ** 3 - 2 * s ** 2 + s) * span * startSlope
+            + (-2 * s ** 3 + 3 * s ** 2) * values[endKey] + (s ** 3 - s ** 2) * span * endSlope)
+
+
+def getSegmentError(times, values, startKey, endKey, startSlope, endSlope):
+    #RETURNS THE LARGEST ERROR BETWEEN TWO KEYS, AND THE SAMPLE IT HAPPENS ON
+    worstError = 0.0
+    worstSample = None
+    for sample in range(startKey + 1, endKey):
+        error = abs(evaluateSegment(times, values, startKey, endKey, startSlope, endSlope, sample) - values[sample])
+        if error > worstError:
+            worstError = error
+            worstSample = sample
+    return worstError, worstSample
+
+
+def reduceChannel(times, values, tolerance):
+    #RETURNS THE INDEXES OF THE SAMPLES THAT STAY KEYED SO THE CHANNEL NEVER MOVES MORE THAN THE TOLERANCE AWAY FROM ITS SAMPLES, AND THE SLOPE OF EVERY ONE OF THEM
+    if len(times) <= 2:
+        keys = list(range(len(times)))
+        return keys, getAutoSlopes(times, values, keys)
+
+    keys = [0, len(times) - 1]
+    slopes = {0: 0.0, len(times) - 1: 0.0}
+    #EVERY SEGMENT IS STORED UNDER ITS START KEY. THE HEAP MIGHT STILL HOLD SEGMENTS THAT WERE SPLIT SINCE, THOSE ARE SKIPPED WHEN THEY COME UP
+    segments = {}
+    heap = []
+
+    def measure(startKey, endKey):
+        error, sample = getSegmentError(times, values, startKey, endKey, slopes[startKey], slopes[endKey])
+        segments[startKey] = (endKey, error, sample)
+        heapq.heappush(heap, (-error, startKey, endKey))
+
+    measure(0, len(times) - 1)
+    while len(heap) != 0:
+        error, startKey, endKey = heapq.heappop(heap)
+        segment = segments.get(startKey)
+        if segment == None or segment[0] != endKey or segment[1] != -error:
+            continue
+        if -error <= tolerance:
+            break
+
+        #ADDING A KEY CHANGES THE AUTO SLOPE OF THE KEYS NEXT TO IT AS WELL, SO THE SEGMENTS AROUND THEM ARE MEASURED AGAIN
+        position = bisect.bisect_left(keys, segment[2])
+        keys.insert(position, segment[2])
+        for neighbour in range(max(position - 1, 0), min(position + 2, len(keys))):
+            slopes[keys[neighbour]] = getAutoSlope(times, values, keys, neighbour)
+        for neighbour in range(max(position - 2, 0), min(position + 2, len(keys) - 1)):
+            measure(keys[neighbour], keys[neighbour + 1])
+    return keys, [slopes[key] for key in keys]
+
+
+def reduceChannels(channels, tolerances):
+    #REDUCES MANY CHANNELS IN ONE CALL - EVERY CHANNEL IS A (TIMES, VALUES) PAIR, AND GETS ITS OWN TOLERANCE SO TRANSLATE AND ROTATE CAN BE MEASURED IN THEIR OWN UNITS
+    #EVERY CHANNEL COMES BACK AS A (KEYS, SLOPES) PAIR, THE SLOPES ARE IN VALUE UNITS PER UNIT OF TIME
+    return [reduceChannel(times, values, tolerance) for (times, values), tolerance in zip(channels, tolerances)]
+
+
+def getMaxError(times, values, keys, slopes):
+    #MEASURES HOW FAR A REDUCED CHANNEL GOES FROM ITS SAMPLES WITH THE GIVEN SLOPES, SO A REDUCTION CAN BE CHECKED AGAINST ITS TOLERANCE
+    worstError = 0.0
+    for position in range(len(keys) - 1):
+        worstError = max(worstError, getSegmentError(times, values, keys[position], keys[position + 1], slopes[position], slopes[position + 1])[0])
+    return worstError
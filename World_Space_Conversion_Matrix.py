@@ -0,0 +1,227 @@
+"""
+Matrix math for the World-Space Conversion tool. It's plain Python with no Maya imports, so it can be run and checked outside of Maya.
+
+Description - Matrices follow Maya's layout - 16 doubles, row by row, with the translation on the last row, and points are multiplied as row vectors.
+Rotations follow Maya's rotate orders, so "xyz" means X is applied first, then Y, then Z. Angles are in radians and distances in centimeters,
+the same internal units the API uses.
+"""
+
+import math
+
+
+ROTATE_ORDERS = ["xyz", "yzx", "zxy", "xzy", "yxz", "zyx"]
+
+
+def getAxisRotation(axis, angle):
+    #3x3 ROTATION AROUND A SINGLE AXIS, WRITTEN FOR ROW VECTORS THE WAY MAYA DOES IT
+    c = math.cos(angle)
+    s = math.sin(angle)
+    if axis == 0:
+        return [[1.0, 0.0, 0.0], [0.0, c, s], [0.0, -s, c]]
+    if axis == 1:
+        return [[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]]
+    return [[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]]
+
+
+def multiply3(a, b):
+    return [[sum(a[row][index] * b[index][column] for index in range(3)) for column in range(3)] for row in range(3)]
+
+
+def composeRotation(rotate, rotateOrder):
+    #BUILDS THE 3x3 ROTATION FOR A SET OF EULER ANGLES. THE FIRST AXIS OF THE ROTATE ORDER IS APPLIED FIRST, SO WITH ROW VECTORS IT COMES FIRST IN THE PRODUCT
+    result = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    for axisName in ROTATE_ORDERS[rotateOrder]:
+        axis = "xyz".index(axisName)
+        result = multiply3(result, getAxisRotation(axis, rotate[axis]))
+    return result
+
+
+def composeMatrix(translate, rotate, rotateOrder, scale=(1.0, 1.0, 1.0)):
+    #BUILDS A FLAT 16 DOUBLE MATRIX FROM TRANSLATE, ROTATE AND SCALE, THE SAME WAY A TRANSFORM WITH NO PIVOTS DOES IT
+    rotation = composeRotation(rotate, rotateOrder)
+    matrix = []
+    for row in range(3):
+        matrix += [rotation[row][column] * scale[row] for column in range(3)] + [0.0]
+    return matrix + [translate[0], translate[1], translate[2], 1.0]
+
+
+def multiplyMatrices(a, b):
+    return [sum(a[row * 4 + index] * b[index * 4 + column] for index in range(4)) for row in range(4) for column in range(4)]
+
+
+def premultiplySamples(samples, matrixIndex, targetIndex, nodeCount, frameIndexes):
+    #MULTIPLIES THE SAMPLED MATRIX OF ONE NODE IN FRONT OF ANOTHER NODE'S ON EVERY FRAME, IN PLACE. THAT'S HOW A TRANSFORM'S offsetParentMatrix AND PARENT MATRIX COMBINE INTO THE SPACE ITS CHANNELS ARE IN
+    #FRAMES WHERE THE FIRST MATRIX IS THE IDENTITY ARE LEFT ALONE, WHICH IS EVERY FRAME FOR MOST CONTROLS
+    identity = [1.0 if row == column else 0.0 for row in range(4) for column in range(4)]
+    for frameIndex in frameIndexes:
+        matrixOffset = (frameIndex * nodeCount + matrixIndex) * 16
+        targetOffset = (frameIndex * nodeCount + targetIndex) * 16
+        matrix = list(samples[matrixOffset:matrixOffset + 16])
+        if matrix == identity:
+            continue
+        product = multiplyMatrices(matrix, list(samples[targetOffset:targetOffset + 16]))
+        for index in range(16):
+            samples[targetOffset + index] = product[index]
+
+
+def inverseMatrix(matrix):
+    #INVERTS A TRANSFORM MATRIX (THE LAST COLUMN IS ALWAYS 0, 0, 0, 1) - THE 3x3 PART IS INVERTED WITH ITS COFACTORS, AND THE TRANSLATION IS MOVED BACK THROUGH IT
+    a, b, c = matrix[0], matrix[1], matrix[2]
+    d, e, f = matrix[4], matrix[5], matrix[6]
+    g, h, i = matrix[8], matrix[9], matrix[10]
+    determinant = a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+    inverse = [(e * i - f * h) / determinant, (c * h - b * i) / determinant, (b * f - c * e) / determinant,
+               (f * g - d * i) / determinant, (a * i - c * g) / determinant, (c * d - a * f) / determinant,
+               (d * h - e * g) / determinant, (b * g - a * h) / determinant, (a * e - b * d) / determinant]
+    translate = [-sum(matrix[12 + index] * inverse[index * 3 + column] for index in range(3)) for column in range(3)]
+    return inverse[0:3] + [0.0] + inverse[3:6] + [0.0] + inverse[6:9] + [0.0] + translate + [1.0]
+
+
+def getRotationPart(matrix, offset=0):
+    #TAKES THE UPPER 3x3 OUT OF A FLAT MATRIX AND REMOVES ITS SCALE, SO ONLY THE ROTATION IS LEFT
+    rows = [[matrix[offset + row * 4 + column] for column in range(3)] for row in range(3)]
+    for row in rows:
+        length = math.sqrt(row[0] ** 2 + row[1] ** 2 + row[2] ** 2)
+        if length > 1e-12:
+            row[0], row[1], row[2] = row[0] / length, row[1] / length, row[2] / length
+    #A NEGATIVE SCALE MIRRORS THE MATRIX, FLIPPING EVERY AXIS BRINGS IT BACK TO A PURE ROTATION
+    determinant = (rows[0][0] * (rows[1][1] * rows[2][2] - rows[1][2] * rows[2][1]) - rows[0][1] * (rows[1][0] * rows[2][2] - rows[1][2] * rows[2][0])
+                   + rows[0][2] * (rows[1][0] * rows[2][1] - rows[1][1] * rows[2][0]))
+    if determinant < 0:
+        rows = [[-value for value in row] for row in rows]
+    return rows
+
+
+def decomposeRotation(rotation, rotateOrder):
+    #FINDS THE EULER ANGLES OF A 3x3 ROTATION FOR A ROTATE ORDER. WITH ROW VECTORS, ORDER i, j, k GIVES R = Ri * Rj * Rk, WHICH IS WHAT'S SOLVED HERE
+    i, j, k = ["xyz".index(axisName) for axisName in ROTATE_ORDERS[rotateOrder]]
+    #EVEN ORDERS (xyz, yzx, zxy) AND ODD ORDERS (xzy, yxz, zyx) ONLY DIFFER BY THE SIGN OF A FEW TERMS
+    sign = 1.0 if (j - i) % 3 == 1 else -1.0
+    angles = [0.0, 0.0, 0.0]
+
+    sinMiddle = max(-1.0, min(1.0, -sign * rotation[i][k]))
+    angles[j] = math.asin(sinMiddle)
+    if abs(sinMiddle) < 1.0 - 1e-12:
+        angles[i] = math.atan2(sign * rotation[j][k], rotation[k][k])
+        angles[k] = math.atan2(sign * rotation[i][j], rotation[i][i])
+    else:
+        #GIMBAL LOCK - THE FIRST AND LAST AXIS LINE UP, SO ALL OF THEIR ROTATION GOES ON THE FIRST ONE
+        angles[i] = math.atan2(-sign * rotation[k][j], rotation[j][j])
+        angles[k] = 0.0
+    return angles
+
+
+def getClosestAngle(angle, previous):
+    return angle + 2 * math.pi * round((previous - angle) / (2 * math.pi))
+
+
+def getClosestSolution(angles, previous, rotateOrder):
+    #EVERY ROTATION HAS TWO EULER SOLUTIONS, AND EVERY ANGLE CAN BE SHIFTED BY FULL TURNS. WE PICK WHICHEVER ONE IS CLOSEST TO THE PREVIOUS FRAME SO THE CURVES STAY CONTINUOUS
+    i, j, k = ["xyz".index(axisName) for axisName in ROTATE_ORDERS[rotateOrder]]
+    alternative = list(angles)
+    alternative[i] = angles[i] + math.pi
+    alternative[j] = math.pi - angles[j]
+    alternative[k] = angles[k] + math.pi
+
+    best = None
+    for candidate in [angles, alternative]:
+        candidate = [getClosestAngle(candidate[axis], previous[axis]) for axis in range(3)]
+        distance = sum(abs(candidate[axis] - previous[axis]) for axis in range(3))
+        if best == None or distance < best[0]:
+            best = (distance, candidate)
+    return best[1]
+
+
+def unwrapAngles(angles):
+    #MOVES EVERY ANGLE BY FULL TURNS SO IT'S THE CLOSEST IT CAN BE TO THE ONE BEFORE IT
+    unwrapped = []
+    for angle in angles:
+        if len(unwrapped) != 0:
+            angle = getClosestAngle(angle, unwrapped[-1])
+        unwrapped.append(angle)
+    return unwrapped
+
+
+def filterEuler(rotate, rotateOrder):
+    #EULER FILTER FOR THREE ROTATE CHANNELS KEYED ON THE SAME FRAMES. THE FIRST KEY STAYS AS IT IS, AND EVERY KEY AFTER IT IS MOVED TO THE SOLUTION CLOSEST TO THE KEY BEFORE IT
+    filtered = [[], [], []]
+    previous = None
+    for angles in zip(rotate[0], rotate[1], rotate[2]):
+        angles = list(angles)
+        if previous != None:
+            angles = getClosestSolution(angles, previous, rotateOrder)
+        previous = angles
+        for axis in range(3):
+            filtered[axis].append(angles[axis])
+    return filtered
+
+
+def filterEulerChannels(channels, rotateOrders):
+    #FILTERS THE ROTATE CHANNELS OF MANY NODES IN ONE CALL. EVERY NODE IS ([X, Y, Z TIMES], [X, Y, Z VALUES]) IN RADIANS, AND COMES BACK AS ITS FILTERED X, Y AND Z VALUES
+    #WHEN ALL THREE CHANNELS ARE KEYED ON THE SAME FRAMES (LIKE AFTER A BAKE), THE FILTER CAN ALSO FIX GIMBAL FLIPS, OTHERWISE EVERY CHANNEL IS ONLY UNWRAPPED ON ITS OWN
+    filtered = []
+    for (times, values), rotateOrder in zip(channels, rotateOrders):
+        if len(times[0]) != 0 and times[0] == times[1] == times[2]:
+            filtered.append(filterEuler(values, rotateOrder))
+        else:
+            filtered.append([unwrapAngles(channelValues) for channelValues in values])
+    return filtered
+
+
+def decomposeMatrices(samples, nodeIndex, nodeCount, frameIndexes, rotateOrder):
+    #TURNS THE SAMPLED MATRICES OF ONE NODE INTO TRANSLATE AND ROTATE CHANNELS, ONE LIST PER AXIS. THE SAMPLES ARE LAID OUT FRAMES x NODES x 16
+    #EVERY ROTATION IS KEPT CLOSEST TO THE ONE BEFORE IT, SO THE ROTATE CHANNELS COME OUT UNWRAPPED AND DON'T FLIP
+    translate = [[], [], []]
+    rotate = [[], [], []]
+    previous = None
+    for frameIndex in frameIndexes:
+        offset = (frameIndex * nodeCount + nodeIndex) * 16
+        angles = decomposeRotation(getRotationPart(samples, offset), rotateOrder)
+        if previous != None:
+            angles = getClosestSolution(angles, previous, rotateOrder)
+        previous = angles
+        for axis in range(3):
+            translate[axis].append(samples[offset + 12 + axis])
+            rotate[axis].append(angles[axis])
+    return translate, rotate
+
+
+def composePivotMatrix(translate, rotate, rotateOrder, rotatePivot=(0.0, 0.0, 0.0), rotatePivotTranslate=(0.0, 0.0, 0.0), jointOrient=None):
+    #THE OPPOSITE OF getConstrainedChannels() - BUILDS THE MATRIX OF A NODE'S ROTATE PIVOT IN ITS PARENT'S SPACE FROM ITS CHANNELS, WHICH IS WHERE A CONSTRAINED LOCATOR ENDS UP
+    #LIKE THERE, THE JOINT ORIENT IS PART OF THE ROTATION, AND SCALE AND ROTATE AXIS ARE LEFT OUT
+    rotation = composeRotation(rotate, rotateOrder)
+    if jointOrient != None:
+        rotation = multiply3(rotation, composeRotation(jointOrient, 0))
+    matrix = []
+    for row in range(3):
+        matrix += rotation[row] + [0.0]
+    return matrix + [translate[axis] + rotatePivot[axis] + rotatePivotTranslate[axis] for axis in range(3)] + [1.0]
+
+
+def getConstrainedChannels(samples, targetIndex, parentIndex, nodeCount, frameIndexes, rotateOrder, rotatePivot=(0.0, 0.0, 0.0), rotatePivotTranslate=(0.0, 0.0, 0.0), jointOrient=None):
+    #WORKS OUT THE TRANSLATE AND ROTATE THAT A CONSTRAINT WITH NO OFFSET GIVES A NODE, FROM THE TARGET'S WORLD MATRIX AND THE NODE'S PARENT MATRIX, BOTH SAMPLED IN THE SAME ARRAY
+    #THE TRANSLATE PUTS THE NODE'S ROTATE PIVOT ON THE TARGET, AND ON JOINTS THE JOINT ORIENT IS TAKEN BACK OUT OF THE ROTATION. LIKE THE CONSTRAINTS, THE ROTATE AXIS IS LEFT OUT
+    inverseOrient = None
+    if jointOrient != None:
+        orient = composeRotation(jointOrient, 0)
+        inverseOrient = [[orient[column][row] for column in range(3)] for row in range(3)]
+
+    translate = [[], [], []]
+    rotate = [[], [], []]
+    previous = None
+    for frameIndex in frameIndexes:
+        targetOffset = (frameIndex * nodeCount + targetIndex) * 16
+        parentOffset = (frameIndex * nodeCount + parentIndex) * 16
+        local = multiplyMatrices(list(samples[targetOffset:targetOffset + 16]), inverseMatrix(samples[parentOffset:parentOffset + 16]))
+
+        rotation = getRotationPart(local)
+        if inverseOrient != None:
+            rotation = multiply3(rotation, inverseOrient)
+        angles = decomposeRotation(rotation, rotateOrder)
+        if previous != None:
+            angles = getClosestSolution(angles, previous, rotateOrder)
+        previous = angles
+        for axis in range(3):
+            translate[axis].append(local[12 + axis] - rotatePivot[axis] - rotatePivotTranslate[axis])
+            rotate[axis].append(angles[axis])
+    return translate, rotate
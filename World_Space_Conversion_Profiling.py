@@ -0,0 +1,134 @@
+"""
+Profiling for the World-Space Conversion tool. It's plain Python with no Maya imports, so it can be run and checked outside of Maya.
+
+Description - A Profiler times one operation of the tool (apply, delete, refresh...) stage by stage. Every stage records its elapsed time and how
+many Maya commands it called, per control. Stages can be nested, and every stage only counts the time and commands that weren't spent in the stages
+inside it, so all of them add up to the whole operation. When the operation is done, the profiler turns everything into a summary dictionary that
+can be written to a log file as one line of JSON, shown as a one-line report, and handed to any hooks the studio has added for its own telemetry.
+"""
+
+import json
+import time
+
+
+#PYTHON 2 (MAYA 2020 AND OLDER) HAS NO perf_counter
+clock = getattr(time, "perf_counter", time.time)
+
+#FUNCTIONS THAT GET THE SUMMARY OF EVERY PROFILED OPERATION, ADDED WITH addHook()
+hooks = []
+
+
+class CommandCounter(object):
+    #WRAPS THE maya.cmds MODULE AND COUNTS EVERY COMMAND THAT'S CALLED THROUGH IT. THE TOOL ONLY PUTS IT IN PLACE OF maya.cmds WHILE AN OPERATION IS BEING PROFILED
+    #EVERY COMMAND IS WRAPPED THE FIRST TIME IT'S LOOKED UP AND KEPT ON THE COUNTER, SO FROM THEN ON IT'S A PLAIN ATTRIBUTE AND ONLY THE CALL ITSELF COSTS ANYTHING EXTRA
+    def __init__(self, module):
+        self._module = module
+        self._calls = 0
+
+    def __getattr__(self, name):
+        command = getattr(self._module, name)
+        if not callable(command):
+            return command
+
+        def countedCommand(*args, **kwargs):
+            self._calls += 1
+            return command(*args, **kwargs)
+        setattr(self, name, countedCommand)
+        return countedCommand
+
+
+class NullProfiler(object):
+    #WHAT THE PROFILER IS WHEN NOTHING IS BEING PROFILED, SO THE STAGES IN THE TOOL CAN STAY IN PLACE AND COST NOTHING
+    def openStage(self, name, control=None):
+        pass
+
+    def closeStage(self):
+        pass
+
+
+class Profiler(object):
+    #TIMES ONE OPERATION. THE TOOL OPENS AND CLOSES ITS STAGES, AND CALLS finish() WHEN THE OPERATION IS OVER
+    def __init__(self, operation, commandCounter):
+        self.operation = operation
+        self.commandCounter = commandCounter
+        self.started = time.time()
+        #THE OPERATION ITSELF IS THE OUTERMOST STAGE, WHATEVER ISN'T SPENT IN ANY OTHER STAGE GETS REPORTED AS "other"
+        #AN OPEN STAGE IS [NAME, CONTROL, START TIME, START COMMAND COUNT, TIME IN CHILD STAGES, COMMANDS IN CHILD STAGES]
+        self.openStages = [["other", None, clock(), commandCounter._calls, 0.0, 0]]
+        self.stages = {}
+
+    def openStage(self, name, control=None):
+        #A STAGE WITHOUT A CONTROL BELONGS TO THE CONTROL OF THE STAGE IT'S IN. STAGES THAT WORK ON ALL THE CONTROLS AT ONCE (LIKE THE BAKE) ARE LEFT WITHOUT ONE
+        if control == None:
+            control = self.openStages[-1][1]
+        self.openStages.append([name, control, clock(), self.commandCounter._calls, 0.0, 0])
+
+    def closeStage(self):
+        name, control, started, startCalls, childSeconds, childCalls = self.openStages.pop()
+        seconds = clock() - started
+        calls = self.commandCounter._calls - startCalls
+        self.openStages[-1][4] += seconds
+        self.openStages[-1][5] += calls
+        self.record(name, control, seconds - childSeconds, calls - childCalls)
+
+    def record(self, name, control, seconds, calls):
+        entry = self.stages.setdefault((name, control), {"stage": name, "control": control, "seconds": 0.0, "commands": 0, "calls": 0})
+        entry["seconds"] += seconds
+        entry["commands"] += calls
+        entry["calls"] += 1
+
+    def finish(self, failed=False):
+        #CLOSES WHATEVER IS STILL OPEN AND RETURNS THE SUMMARY OF THE WHOLE OPERATION
+        while len(self.openStages) > 1:
+            self.closeStage()
+        name, control, started, startCalls, childSeconds, childCalls = self.openStages[0]
+        seconds = clock() - started
+        calls = self.commandCounter._calls - startCalls
+        self.record(name, control, seconds - childSeconds, calls - childCalls)
+
+        totals = {}
+        for entry in self.stages.values():
+            total = totals.setdefault(entry["stage"], {"seconds": 0.0, "commands": 0, "calls": 0})
+            for key in ["seconds", "commands", "calls"]:
+                total[key] += entry[key]
+        summary = {"operation": self.operation, "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)), "failed": failed,
+                   "seconds": seconds, "commands": calls, "stages": list(self.stages.values()), "totals": totals}
+        return summary
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def formatSummary(summary, stageCount=4):
+    #A ONE-LINE REPORT OF THE SLOWEST STAGES, SHORT ENOUGH FOR AN IN-VIEW MESSAGE
+    stages = sorted(summary["totals"].items(), key=lambda item: item[1]["seconds"], reverse=True)[:stageCount]
+    stageReport = ", ".join("{0} {1:.2f}s".format(stage, total["seconds"]) for stage, total in stages)
+    return "{0} - {1:.2f}s, {2} commands ({3})".format(summary["operation"], summary["seconds"], summary["commands"], stageReport)
+
+
+def writeLog(summary, path):
+    #EVERY OPERATION IS ONE LINE OF JSON, SO THE LOG CAN KEEP GROWING AND STILL BE READ A LINE AT A TIME
+    with open(path, "a") as logFile:
+        logFile.write(json.dumps(summary, sort_keys=True) + "\n")
+
+
+def addHook(hook):
+    #A HOOK IS A FUNCTION THAT TAKES THE SUMMARY DICTIONARY. WHILE THERE'S AT LEAST ONE, EVERY OPERATION IS PROFILED EVEN IF DEBUG MODE IS OFF
+    if hook not in hooks:
+        hooks.append(hook)
+
+
+def removeHook(hook):
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+def publish(summary):
+    #HANDS THE SUMMARY TO EVERY HOOK. A HOOK THAT FAILS DOESN'T STOP THE OTHERS, ITS ERROR IS RETURNED SO THE TOOL CAN REPORT IT
+    errors = []
+    for hook in list(hooks):
+        try:
+            hook(summary)
+        except Exception as error:
+            errors.append((hook, error))
+    return errors
@@ -1,601 +1,2141 @@
-"""
-This script is part of my space-switching series, inspired by Richard Lico's animation sherpa course, where he goes over the space-switching approach to animating - https://www.animationsherpa.com/
-You can use this script for any commercial or non-commercial projects. You're not allowed to sell this script. 
-Author - Petar3D
-Initial Release Date - 18.07.2023
-Version - 1.0
-
-Description - Tool that allows you to apply a temporary locator setup on top of any selection, and it turns it into world-space. The perk of this tool is that you can apply it on a specific range in the timeline, and it 
-preserves the original control's animation data.
-"""
-
-
-import maya.cmds as cmds
-import maya.mel as mel
-from sys import exit
-
-cmds.cycleCheck(e=False)
-
-def formLayout(name, topCoordinates, leftCoordinates):
-    #ADJUSTS THE POSITION OF THE UI FEATURES
-    cmds.formLayout("formLayout", edit=True, attachForm=[(name, "top",topCoordinates), (name, "left",leftCoordinates)])    
-
-#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-#FUNCTIONS
-def assistMessage(message, time, toExit):
-    #POPS UP A MESSAGE ON THE USER'S SCREEN TO INFORM THEM OF SOMETHING
-    cmds.inViewMessage(amg=message, pos='midCenter', fade=True, fst=time, ck=True)
-    if toExit == True:
-        exit()
-        
-def documentation():
-    cmds.showHelp("https://petarpehchevski3d.gumroad.com/l/worldspaceconversion", a=True)
-            
-def hideAttributes(type, *controls):
-#HIDES UNNECESSARY ATTRIBUTES ON THE CONTROLS        
-    for item in controls:
-        for attr in ["." + type + "X", "." + type + "Y", "." + type + "Z"]:
-            cmds.setAttr(item + attr, k=False, cb=False)
-    
-
-
-def setConstraint(constraintType, parent, child, translateCurves, rotateCurves):
-    #CONSTRAINT FUNCTION
-    if constraintType == "parent":
-        constraint = cmds.parentConstraint(parent, child, skipTranslate = translateCurves, skipRotate = rotateCurves)[0]
-    elif constraintType == "orient":
-        constraint = cmds.orientConstraint(parent, child, skip = rotateCurves)[0]
-    elif constraintType == "point":
-        constraint = cmds.pointConstraint(parent, child, skip = translateCurves)[0]
-    
-    return constraint
-
-
-
-#CHECKS FOR WHAT TYPE OF CONSTRAINT DID THE SELECTED CONTROL APPLY ON THE ORIGINAL CONTROL. THEN WE STORE THE TYPE IN VARIABLE, AS WELL AS THE BLEND INDEX
-def getBlendIndex(object, blendIndexControl, constraintType):
-    for item in cmds.listConnections(object, c=True, type="constraint"):  
-        if blendIndexControl + "_" + constraintType + "Constraint" in item:
-            tempBlendIndex = item[-1:]
-                
-            return tempBlendIndex
-            
-
-def getConstraintAttribute(constraintType):
-    #SETS A KEY ON THE START AND END OF THE TIMELINE, SO THAT WE ENSURE THERE'S A BLEND NODE ALL THE TIME. IF THERE'S NO KEY BEFORE ADDING THE SETUP, THE SCRIPT WON'T APPLY A SWITCH ON THE BLEND NODE
-    tempAttribute = []
-    if constraintType == "orient":
-        tempAttribute = "rotate"
-    elif constraintType == "point":
-        tempAttribute = "translate"
-    elif constraintType == "parent":
-        tempAttribute = ["translate", "rotate"]
-    return tempAttribute
-        
-def getLockedCurves(obj, attribute):
-    #GETS A LIST OF THE LOCKED CURVES FOR EITHER TRANSLATE, ROTATE OR SCALE, SO THE CONSTRAINTS KNOW WHICH CURVES TO AVOID
-    curves = {".{0}X".format(attribute):"x", ".{0}Y".format(attribute):"y", ".{0}Z".format(attribute):"z"}
-    for curve in curves.copy():
-        if cmds.getAttr(obj+curve, l=True) == False:
-            curves.pop(curve)
-    curves = list(curves.values())
-    return curves
-            
-def setup(obj, tempControl, constraintType, timelineStart, timelineEnd, translateCurves, rotateCurves):
-    bakeInterval = cmds.intFieldGrp("BakeInterval_IntField", q=True, v1=True)
-    smartBake = cmds.checkBoxGrp("SmartBake_CheckBox", q=True, v1=True)
-    smartBakeIntensity = cmds.floatFieldGrp("Intensity_FloatField", q=True, v1=True)
-    
-    #ADDS A LOCATORS ONTO EVERY SELECTION AND SWITCHES IT TO WORLD SPACE BY REVERSING THE CONSTRAINTS
-    cmds.currentTime(timelineStart)
-    cmds.matchTransform(tempControl, obj)
-    original_RO = cmds.getAttr(obj + ".rotateOrder")  #STORES THE ROTATION ORDER OF THE CURRENT CONTROL, TO BE ASSIGNED TO THE TEMP CONTROLS
-    cmds.setAttr(tempControl + ".rotateOrder", original_RO)
-    matchScale(obj, tempControl)
-    setConstraint(constraintType, obj, tempControl, translateCurves, rotateCurves)
-    cmds.select(tempControl)
-    cmds.bakeResults(t=(timelineStart, timelineEnd), pok=True, simulation=False, sr = [smartBake,smartBakeIntensity], sampleBy=bakeInterval)
-    if smartBake == True:
-        cmds.keyTangent(tempControl, e=True, itt="auto", ott="auto", t=(timelineStart, timelineEnd))
-    cmds.filterCurve(tempControl + ".translate", tempControl + ".rotate")
-    cmds.delete(cmds.listRelatives(type="constraint"))
-    
-
-def pseudoSmartBake(originalControl, bakeAttribute, timelineStart, timelineEnd):
-    attributes = []
-    if len(bakeAttribute) == 2:
-        for curve in ["X", "Y", "Z"]:
-            for attr in bakeAttribute:
-                attributes.append(attr + curve)    
-    else:
-        for curve in ["X", "Y", "Z"]:
-            attributes.append(bakeAttribute + curve)
-            
-    attributesKeyframes = {}
-    for attr in attributes:
-        attributesKeyframes[attr] = cmds.keyframe(originalControl, t=(timelineStart,timelineEnd), q=True, at=attr)
-
-    cmds.undo()
-    cmds.undo()
-    cmds.select(originalControl)
-    cmds.bakeResults(originalControl, t = (timelineStart, timelineEnd), pok=True)
-
-    frameRange = []
-    #CREATES A LIST OF THE TIMELINE RANGE
-    for i in range(int(timelineStart),int(timelineEnd)):
-        frameRange.append(i)
-    
-    #WE GET THE LIST AND REMOVE WHATEVER KEY NEEDS TO BE REMOVED
-    for attr,frames in attributesKeyframes.items():
-        if frames != None:
-            for frame in frames:
-                if frame in frameRange:
-                    tempRange = frameRange.remove(frame)
-            
-            for i in frameRange:
-                cmds.cutKey(originalControl + "." + attr, t=(i, i))
-                
-
-def createControl(name):
-    #CREATES THE SHAPE OF THE CONTROL
-    tempControl = cmds.curve(n=name, degree=1, point=[[-1, 0, -0], [1, 0, 0], [0,0,0], [0,0,-1], [0, 0, 1], [0,0,0], [0,-1,0], [0,1,0]])
-
-    cmds.setAttr(tempControl + ".lineWidth", 3)
-    cmds.setAttr(tempControl + ".overrideEnabled", 1)
-    cmds.setAttr(tempControl + ".overrideColor", 6)
-    return tempControl
-            
-def matchScale(parent, children, scale=True):
-    #SCALE UP AN OBJECT TO ANOTHER ONE'S BOUNDING BOX SCALE, INCASE IT'S BEEN FREEZE-TRANSFORMED. THIS WAY THE USER DOESN'T HAVE TO MANUALLY ADJUST THE SIZE
-    children = cmds.ls(children, flatten=True)
-    parentShapeNode = cmds.listRelatives(parent, shapes=True)[0]
-    
-    xMin, yMin, zMin, xMax, yMax, zMax = cmds.exactWorldBoundingBox(parentShapeNode)
-    parentDistanceX, parentDistanceY, parentDistanceZ = [xMax-xMin, yMax-yMin, zMax-zMin]
-        
-    #result=[]
-    for child in children:
-        xMin, yMin, zMin, xMax, yMax, zMax = cmds.exactWorldBoundingBox(child)
-        childDistanceX, childDistanceY, childDistanceZ = [xMax-xMin, yMax-yMin, zMax-zMin]
-        
-        #WE QUERY THE ORIGINAL SCALE OF THE LOCATOR 
-        originalX, originalY, originalZ = cmds.xform(child, q=True, s=True, r=True)
-        
-        
-        divisionX, divisionY, divisionZ = [parentDistanceX/childDistanceX, parentDistanceY/childDistanceY, parentDistanceZ/childDistanceZ]
-        
-        #WE GET THE FINAL SCALE HERE, WE TAKE THE LONGEST NUMBER AND APPLY THAT TO ALL SCALE AXIS
-        largestAxis = max([originalX*divisionX, originalY*divisionY, originalZ*divisionZ]) * 2
-        newScale = [largestAxis, largestAxis, largestAxis]
-        
-        #this part is for return the information outside the function
-        #[result.append(i) for i in newScale]
-
-        if scale:
-            cmds.xform(child, scale=newScale)
-        
-
-def add(a,b):
-    result = a + b
-    return result
-def subtract(a,b):
-    result = a - b
-    return result   
- 
-def getPairedFrames(checkPointOrient, keyword, blendCurve, constraint, timelineStart, timelineEnd):
-    #TAKES ALL THE TEMP LOCATORS IN THE SCENE THAT SHARE THE SAME ORIGINAL CONTROL
-    pairedFrames = []
-    for item in cmds.ls(tr=True):
-        if keyword in item:
-            if "pointConstraint" not in item:
-                #CHECKS TO SEE IF THE ITEMS WE'RE LISTING THROUGH SHARE THE SAME CONSTRAINT TYPE AS OUR CURRENT LOCATOR. IF THEY DO WE ADD THEM TO THE LIST, BECAUSE THOSE ARE THE RELEVANT TIME PAIRINGS WE WANT TO COMPARE AGAINST LATER ON 
-                if checkPointOrient:
-                    for obj in cmds.listConnections(item):
-                        if blendCurve[-1] == obj[-1]:
-                            #GETS A LIST OF ALL THE START/END KEYFRAMES FROM THE TEMP CONTROLS THAT SHARE THE SAME ORIGINAL CONTROL BUT EXCLUDES THE CURRENT TEMP LOCATOR FROM THE LIST
-                            if str(timelineStart) and str(timelineEnd) not in item:
-                                pairedFrames.append(item.split("_")[-2:-1][0])
-                                pairedFrames.append(item.split("_")[-1:][0])
-                            
-                #WE SPLIT IT OFF HERE BECAUSE THIS SECTION IS ONLY FOR VISIBILITY, AND IT NEEDS TO SOURCE FRAMES FROM ALL THE LOCATORS THE SHARE THE SAME ORIGIN, NOT JUST ONES WITH A SPECIFIC CONSTRAINT
-                else:
-                    if str(timelineStart) and str(timelineEnd) not in item:
-                        pairedFrames.append(item.split("_")[-2:-1][0])
-                        pairedFrames.append(item.split("_")[-1:][0])
-    #WE TAKE THE LIST OF KEYFRAMES AND PAIR THEM UP IN A DICTIONARY SO THAT THEY'RE PROPERLY ARRANGED - START: END
-    if len(pairedFrames) != 0:
-        pairedFrames = {pairedFrames[frame]: pairedFrames[frame + 1] for frame in range(0, len(pairedFrames), 2)}
-        return pairedFrames   
-
-
-
-def divideInfluence(curve, timelineStart, timelineEnd, operator, value):
-    #USUALLY APPLIED ON AN EMPTY SPACE WHERE THE RANGE ISN'T TOUCHING ANY PRE-EXISTING RANGES, SO IT HANDLES BOTH SIDES - THE START AND END
-    cmds.setKeyframe(curve, t=(timelineStart, timelineEnd), value=value)    
-    cmds.setKeyframe(curve, t=(timelineStart-1, timelineEnd+1), value=operator(value,1))  
-
-def adjustInfluence(curve, frame, offset, operator, value):
-    #USUALLY USED WHEN THE RANGE WE'RE APPLYING IS RIGHT NEXT TO THE END OR START OF AN EXISTING RANGE, SO WE MERGE ONE PART, AND ONLY ADD KEYS ON THE OTHER PART. 
-    cmds.setKeyframe(curve, t=(frame), value=value)     
-    cmds.setKeyframe(curve, t=(frame + offset), value=operator(value,1))  
-
-
-
-def applyInfluenceSwitch(curve, selectionShapeNode, timelineStart, timelineEnd, operator, value, storedFrameValue):
-    #FUNCTION THAT HANDLES APPLYING A SWITCH ON THE CONSTRAINT INFLUENCE, AS WELL AS THE VISIBILITY   
-    
-    keyframes = cmds.keyframe(curve, q=True)
-    storedFrames = []
-
-    #WE CHECK TO SEE WHAT EXISTING KEYFRAMES HAVE THE VALUE OF 0 OR 1 (DEPENDING ON IF YOU'VE CHOSEN THE VISIBILITY OR BLEND INDEX CURVES), AND STORE THEM IN A LIST SO THAT WE CAN PAIR THEM UP IN A DICTIONARY
-    if keyframes != None:
-        for keyframe in keyframes:
-            if cmds.keyframe(curve, q=True, t=(keyframe, keyframe), eval=True)[0] == storedFrameValue:
-                storedFrames.append(keyframe)
-            
-    pairedFrames = {storedFrames[frame]: storedFrames[frame + 1] for frame in range(0, len(storedFrames), 2)}
-    timelineRange = []
-    
-    #IF THE TIMELINE RANGE IS IN-BETWEEN 1 OR 2 PAIRS, WE STORE THE START OR THE END OF THE TIMELINE RANGE IN A LIST FOR LATER COMPARISON 
-    for start,end in pairedFrames.items():        
-        if start - 1 <= timelineStart <= end + 1:
-            timelineRange.append(timelineStart)
-            
-        if start - 1 <= timelineEnd <= end + 1: 
-            timelineRange.append(timelineEnd)
-        
-    
-    for start,end in pairedFrames.items():
-        #IF OUR TIMELINE RANGE OVERSHADOWS A GIVEN PAIRING OR IS IN-BETWEEN IT, THE SCRIPT WILL ABORT AND THE LOCATOR WON'T BE ADDED
-        if timelineStart <= int(start) and int(end) <= timelineEnd or int(start) <= timelineStart and timelineEnd <= int(end) or timelineStart < int(end) and int(start) < timelineEnd :
-            assistMessage("<hl>Error: This locator overlaps with another locator on the timeline. <hl>", 5000, True)
- 
-    confirmation = []
-    #IF TIMELINE RANGE IS 0, THAT MEANS THAT OUR RANGE IS NOT INTERSECING WITH ANY EXISTING PAIRINGS AND CAN BE APPLIED NORMALLY
-    if len(timelineRange) == 0:
-        confirmation = 1
-        divideInfluence(curve, timelineStart, timelineEnd, operator, value)
-    
-    #IF WE'RE TRYING TO FIT A TIMELINE RANGE INBETWEEN 2 OTHER RANGES, THIS CODE GETS EXECUTED 
-    
-    elif len(timelineRange) == 2:
-        cmds.cutKey(curve, t=(timelineStart, timelineStart - 1))
-        cmds.cutKey(curve, t=(timelineEnd, timelineEnd + 1))
-        confirmation = 1
-    else:
-        #IF TIMELINE RANGE IS 1, WE CHECK TO SEE IF OUR TIMELINESTART AND TIMELINEEND ARE TOUCHING THE VALUE STORED IN TIMELINERANGE. IF IT IS TOUCHING, WE MERGE THE POINT THEY TOUCH AND EXTEND UP TOWARDS THE OTHER END
-        for start,end in pairedFrames.items():
-            if timelineStart == int(end) + 1:
-                confirmation = 1
-                cmds.cutKey(curve, t=(timelineStart - 1, timelineEnd))
-                adjustInfluence(curve, timelineEnd, 1, operator, value )
-            elif int(start) - 1 == timelineEnd :
-                confirmation = 1
-                cmds.cutKey(curve, t=(timelineStart, timelineEnd + 1))
-                adjustInfluence(curve, timelineStart, -1, operator, value )
-    
-    #IF TIMELINE RANGE IS 1 OR 2, BUT IT'S OVERLAPPING RATHER THAN TOUCHING ON ONE OF THE ENDS, WELL THEN WE PROCLAIM THAT THE USER CAN'T APPLY THE SETUP
-    if confirmation != 1 and selectionShapeNode == curve:
-        assistMessage("<hl>Error: This locator overlaps with another locator on the timeline. <hl>", 5000, True)
-
-
-
-
-def removeInfluence(curve, timelineStart, timelineEnd, dictionary, typeOfCurve):
-    #DELETES THE KEYFRAMES AT THE POINT WHERE THE INFLUENCE/VISIBILTIY SWITCHES AND REARRANGES THE KEYS
-    tempList = []
-    
-    #THIS PORTION CHECKS EACH PAIRING FROM THE LIST, AND CHECKS HOW MANY OF THEM MATCH UP WITH OUR TIMELINE'S START AND END, IN OTHER WORDS HOW MANY OF THEM ARE TOUCHING
-    if dictionary != None:
-        for start,end in dictionary.items():
-            if timelineStart == int(end) + 1:
-                tempList.append(end)
-            elif timelineEnd == int(start) - 1:
-                tempList.append(start)
-    
-    #print(tempList)
-    #IF THE LIST IS 0, MEANING THERE'S NO MATCHES, OUR TIMELINE RANGE IS STANDALONE SO WE SIMPLY JUST HAVE TO DELETE THE BEGINNING AND END, NO NEED TO REARRANGE 
-    if len(tempList) == 0:
-        #print("This locator is isolated")
-        cmds.cutKey(curve, t=(timelineStart, timelineEnd))
-        cmds.cutKey(curve, t=(timelineStart - 1, timelineEnd + 1))
-        #IF THE CURVE IS THE VISIBILITY CURVE, AFTER DELETING THE KEYS WE SET THE VISIBILITY BACK TO 1
-        if typeOfCurve == "visibility":
-            cmds.setAttr(curve, 1)   
-    else:    
-        #IF THE LIST IS 2, THAT MEANS THAT BOTH THE TIMELINESTART AND END ARE OVERLAPPING WITH THE START AND END OF OTHER PAIRINGS. IT MEANS OUR RANGE IS STUCK IN THE MIDDLE OF 2 LOCATORS
-        if len(tempList) == 2:
-            #print("Both timelineStart and timelineEnd are in-between")
-            cmds.cutKey(curve, t=(timelineStart, timelineEnd))
-            cmds.cutKey(curve, t=(timelineStart - 1, timelineEnd + 1))
-            if typeOfCurve == "blend":
-                adjustInfluence(curve, timelineStart - 1, 1, subtract, 1 )
-                adjustInfluence(curve, timelineEnd, 1, add, 0 )
-            else:
-                adjustInfluence(curve, timelineStart - 1, 1, add, 0 )
-                adjustInfluence(curve, timelineEnd, 1, subtract, 1 )
-        
-        else:
-            if timelineStart == int(tempList[0]) + 1:
-                #print("timelineStart is in between")
-                #print("eee")
-                cmds.cutKey(curve, t=(timelineEnd, timelineEnd + 1))
-                if typeOfCurve == "blend":
-                    #print("EEEGSAFJAFJ")
-                    adjustInfluence(curve, int(tempList[0]), 1, subtract, 1 )
-                else:
-                    adjustInfluence(curve, int(tempList[0]), 1, add, 0 )
-                
-            
-            elif timelineEnd == int(tempList[0]) - 1:
-                #print("timelineEnd is in between")
-                cmds.cutKey(curve, t=(timelineStart, timelineStart - 1))
-                if typeOfCurve == "blend":
-                    adjustInfluence(curve, int(tempList[0]), -1, subtract, 1 )
-                else:
-                    adjustInfluence(curve, int(tempList[0]), -1, add, 0 )    
-    
-
-#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-def storeParentConstraint():
-    constraintType = "parent"
-    worldSpaceConversion(constraintType)
-
-def storeOrientConstraint():
-    constraintType = "orient"
-    worldSpaceConversion(constraintType)
-
-def storePointConstraint():
-    constraintType = "point"
-    worldSpaceConversion(constraintType)
-    
-#EXECUTION
-def worldSpaceConversion(constraintType):    
-    #VARIABLES FOR USER TO ADJUST
-    aTimeSlider = mel.eval('$tmpVar=$gPlayBackSlider')
-    timeRange = cmds.timeControl(aTimeSlider, q=True, rangeArray=True)
-
-    if 2 < (timeRange[1] - timeRange[0]):
-        specificTimelineMode = True
-        timelineStart = timeRange[0]
-        timelineEnd = timeRange[1] - 1
-    else:
-        specificTimelineMode = False
-        #QUERIES THE START AND END FRAME OF THE CURRENT TIMELINE
-        timelineStart = cmds.playbackOptions(min=True, q=True)
-        timelineEnd = cmds.playbackOptions(max=True, q=True)
-
-
-    #PREVENTS THE USER FROM APPLYING THE SETUP IN A NEGATIVE RANGE TIMELINE
-    if timelineStart < 0 or timelineEnd <0:
-        assistMessage("<hl>Error: You can't apply a locator setup on a negative time-range <hl>", 5000, True)
-
-    selection = cmds.ls(sl=True)
-
-
-    #ADVISES THE USER TO SELECT SOMETHING BEFORE RUNNING THIS SCRIPT
-    if len(selection) == 0:
-        assistMessage("<hl>You need to select at least 1 object to turn into world space<hl>", 4000, True)
-    else:            
-        for obj in selection:
-            #PREVENTS THE USER FROM APPLYING A LOCATOR SETUP ON TOP OF AN EXISTING LOCATOR
-            if "Petar3D" in obj:
-                assistMessage("<hl>Error: You can't stack locator setups<hl>", 4000, True)
-
-            #CHECKS TO SEE IF THERE'S ALREADY AN ORIENT OR A POINT CONSTRAINT, SO THAT IT DOESN'T TRY TO APPLY A PARENT CONSTRAINT, AND VICE VERSA
-            if cmds.listConnections(obj, c=True) != None:
-                for item in cmds.ls("*_Petar3D_worldSpaceLocator*", tr=True):
-                    print(item)
-                    if obj + "_Petar3D_worldSpaceLocator_point" in item and constraintType == "parent" or obj + "_Petar3D_worldSpaceLocator_orient" in item and constraintType == "parent":
-                        assistMessage("<hl>Error: You already have an orient/point point constraint applied, you can't apply a parent constraint <hl>", 5000, True)
-                    if obj + "_Petar3D_worldSpaceLocator_parent" in item and constraintType == "orient" or obj + "_Petar3D_worldSpaceLocator_parent" in item and constraintType == "point":
-                        assistMessage("<hl>Error: You already have a parent cosntraint applied, you can't applied an orient/point constraint <hl>", 5000, True)
-
-
-            #CHECKS TO SEE IF THERE'S ALREADY A NIS-TYPE OF LOCATOR SETUO, AND IF SO IT DOESN'T LET THE USER APPLY AN IFS-TYPE LOCATOR, AND VICE VERSA
-            for item in cmds.ls(obj + "_Petar3D*", tr=True):
-                if "NIS" in item and specificTimelineMode == True:
-                    assistMessage("<hl>Error: You already have a locator with overall influence over this selection. You can't mix overall with partial influence locators<hl>", 4000, True)
-                elif "IFS" in item and specificTimelineMode == False:
-                    assistMessage("<hl>Error: You already have a locator with partial influence over this selection. You can't mix partial with overall influence locators<hl>", 4000, True)
-            
-            #GETS A LIST OF ALL THE LOCKED CURVES SO THAT THE CONSTRAINTS KNOW WHICH CURVES TO SKIP OVER
-            translateCurves = getLockedCurves(obj, "translate")       
-            rotateCurves = getLockedCurves(obj, "rotate")
-            
-            #WE CHECK TO SEE IF ALL ROTATE AND TRANSLATE CHANNELS ARE LOCKED. IF THEY ARE, THERE'S NO POINT IN APPLYING THIS SCRIPT
-            if len(translateCurves + rotateCurves) != 6:  
-                
-                #SWITCHES THE VISIBILITY ON THE ORIGINAL SELECTION,
-                selectionShapeNode = cmds.listRelatives(obj, shapes=True, children=True)[0]     
-                if specificTimelineMode:
-                    applyInfluenceSwitch(selectionShapeNode + ".v", selectionShapeNode + ".v",  timelineStart, timelineEnd, add, 0, 0)
-                else:
-                    cmds.setAttr(selectionShapeNode + ".v", 0)
-                
-                #CREATES THE TEMP LOCATOR 
-                if specificTimelineMode:
-                    tempControl = createControl(obj + "_Petar3D_worldSpaceLocator_{0}_IFS_{1}_{2}".format(constraintType, int(timelineStart), int(timelineEnd)))   
-                else:
-                    tempControl = createControl(obj + "_Petar3D_worldSpaceLocator_{0}_NIS".format(constraintType))   
-             
-                #POSITIONS THE LOCATOR TO THE ORIGINAL SELECTION AND BAKES IT DOWN
-                setup(obj, tempControl, constraintType, timelineStart, timelineEnd, translateCurves, rotateCurves)       
-                locatorShapeNode = cmds.listRelatives(tempControl, shapes=True, children=True)[0]   
-                
-                hideAttributes("scale", tempControl)
-                cmds.lockNode(tempControl, l=True)
-                
-                #VISIBILITY SWITCH FOR LOCATOR
-                if specificTimelineMode:
-                    applyInfluenceSwitch(locatorShapeNode + ".v", selectionShapeNode + ".v", timelineStart, timelineEnd, subtract, 1, 0)
-            
-                
-                #CHECKS WHICH ATTRIBUTE TO PLACE THE INITIAL KEYS ON
-                tempAttribute = getConstraintAttribute(constraintType)
-                
-
-                #CHECKS TO SEE IF THE ORIGINAL CONTROL HAS ANY KEYS ON ITS CURVES ALREADY, AND IF NOT IT PLACES THEM TO ACTIVATE THE BLEND INDEX
-                if cmds.keyframe(selection, at =tempAttribute, q=True) == None:
-                    cmds.setKeyframe(obj, t=(timelineStart, timelineEnd), at=tempAttribute)   
-                else:
-                    cmds.setKeyframe(obj, t=(timelineStart, timelineEnd), at=tempAttribute, i=True)         
-                    
-                                
-                #LOCATOR CONSTRAINT SECTION 
-                constraint = setConstraint(constraintType, tempControl, obj, translateCurves, rotateCurves)
-                #IF THE CONSTRAINT TYPE IS ORIENT, WE APPLY A REVERSE POINT CONSTRAINT
-                if constraintType == "orient":
-                    pointConstraint = setConstraint("point", obj, tempControl, translateCurves, rotateCurves) 
-                
-                #IF THE RIG IS REFERENCED, WE STORE THE NAME OF THE TEMP LOCATOR WITHOUT THE NAMESPACE, BECAUSE THE COSNTRAINT WE'LL INFLUENCE DON'T HAVE THE NAMESPACE INSIDE
-                if cmds.referenceQuery(obj, isNodeReferenced=True) or ":" in obj:                                  
-                    tempControl = tempControl.split(":")[1]
-                
-                #WE'RE TRYING TO FIND THE INDEX AT THE END OF THE CONSTRAINT'S WEIGHT ATTRIBUTE. BECAUSE THERE COULD BE MANY CONSTRAINTS APPLIED ON THE SAME OBJECT, WE CAN'T ALWAYS KNOW WHAT THAT NUMBER WILL BE
-                for item in cmds.listConnections(constraint, c=True):       
-                    if "{0}.{1}W".format(constraint, tempControl) in item:
-                        constraintIndex = item[-1:]
-                     
-                #THE CONSTRAINT HAVE A NUMBER AT THE END, WE STORE THIS NUMBER IN A VARIABLE SO WE KNOW WHICH NUMBER TO ATTACHA WHEN WE INFLUENCE THE BLEND NODE
-                if specificTimelineMode:
-                    applyInfluenceSwitch("{0}.{1}W{2}".format(constraint, tempControl, constraintIndex), selectionShapeNode + ".v", timelineStart, timelineEnd, subtract, 1, 0)             
-                blendIndex = constraint[-1:]                                           
-                
-                #BLEND NODE SWITCH SECTION      
-                if specificTimelineMode:
-                    applyInfluenceSwitch("{0}.blend{1}{2}".format(obj, constraintType.capitalize(), blendIndex), selectionShapeNode + ".v", timelineStart, timelineEnd, subtract, 1, 1)
-            
-            #GIVES THIS ERROR IF ALL 6 CURVES ARE LOCKED AND THERE'S NO POINT IN APPLYING THE SCRIPT
-            else:
-                assistMessage("<hl>Error: All translate and rotate curves on this selection are locked -  {0} <hl>".format(obj), 4000, False)
-        
-        
-
-#DELETE SETUP
-def deleteSetup():
-    selection = cmds.ls(sl=True)
-    if len(selection) == 0:
-        #NOTIFIES THE USER THAT THEY NEED TO SELECT SOMETHING TO DELETE
-        assistMessage("<hl>Error: Nothing is selected<hl>", 4000, False)
-        
-    bakeInterval = cmds.intFieldGrp("BakeInterval_IntField", q=True, v1=True)
-    smartBake = cmds.checkBoxGrp("SmartBake_CheckBox", q=True, v1=True)
-    smartBakeIntensity = cmds.floatFieldGrp("Intensity_FloatField", q=True, v1=True)
-    
-
-    for temp_locator in selection:
-        #WS SETUP
-        if "Petar3D_worldSpaceLocator" in temp_locator:
-            originalControl = temp_locator.split("_Petar3D_")[:1][0]
-            selectionShapeNode = cmds.listRelatives(originalControl, shapes=True, children=True)[0]    #VISIBILITY SWITCH FOR THE ORIGINAL SELECTION
-            if "IFS" in temp_locator:
-                constraint = temp_locator.split("_")[-4:-3][0]
-            elif "NIS" in temp_locator:
-                constraint = temp_locator.split("_")[-2:-1][0]
-            #IF THE RIG IS REFERENCED, WE STORE THE NAME OF THE TEMP LOCATOR WITHOUT THE NAMESPACE, BECAUSE THE COSNTRAINT WE'LL INFLUENCE DON'T HAVE THE NAMESPACE INSIDE
-            if cmds.referenceQuery(originalControl, isNodeReferenced=True) or ":" in originalControl:                                  
-                blendIndexControl = originalControl.split(":")[1]
-            else:
-                blendIndexControl = originalControl
-            blendIndex = getBlendIndex(temp_locator, blendIndexControl, constraint)
-            blendCurve = originalControl + ".blend{0}{1}".format(constraint.capitalize(), blendIndex)
-            
-            
-            cmds.lockNode(temp_locator, l=False)
-
-            #CHECKS TO SEE IF THE KEYWORD EXISTS IN THE SELECTION, THIS BEING THAT THE LOCATOR AFFECTED A SPECIFIC RANGE OF THE TIMELINE. 
-            if "IFS" in temp_locator:
-                #EXTRACTS THE INFO FROM THE NAMES
-                timelineEnd = int(temp_locator.split("_")[-1:][0])
-                timelineStart = int(temp_locator.split("_")[-2:-1][0])
-        
-                pairedFrames = getPairedFrames(False, originalControl + "_Petar3D", blendCurve, constraint, timelineStart, timelineEnd)
-                removeInfluence(selectionShapeNode + ".v", timelineStart, timelineEnd, pairedFrames, "visibility")
-            
-            #IF THIS ORIGINAL CONTROL DIDN'T HAVE A SPECIFIC INFLUENCE APPLIED, WE JUST REVERT BACK THE VISIBILITY TO THE ORIGINAL AND QUERY THE CURRENT TIMELINE START AND END 
-            if "NIS" in temp_locator:
-                cmds.setAttr(selectionShapeNode + ".v", 1)
-                #QUERIES THE START AND END FRAME OF THE CURRENT TIMELINE
-                timelineStart = cmds.playbackOptions(min=True, q=True)
-                timelineEnd = cmds.playbackOptions(max=True, q=True)
-                
-                
-            #GETS THE ATTRIBUTE TO BAKE ONTO
-            bakeAttribute = getConstraintAttribute(constraint)     
-        
-            #BAKING THE CURVES
-            cmds.currentTime(timelineStart)
-            cmds.select(originalControl)
-            if smartBake == True:
-                cmds.bakeResults(originalControl, t = (timelineStart, timelineEnd), at=bakeAttribute, pok=True, sr=[True, smartBakeIntensity], simulation=False)
-                pseudoSmartBake(originalControl, bakeAttribute, timelineStart, timelineEnd)
-                
-                cmds.keyTangent(e=True, itt="auto", ott="auto", time=(timelineStart, timelineEnd))
-                
-            else:
-                cmds.bakeResults(originalControl, t = (timelineStart, timelineEnd), at=bakeAttribute, sampleBy = bakeInterval, pok=True,simulation=False)
-                
-        
-         
-            #REMOVES THE INFLUENCE ON THE BLEND INDEX CURVE        
-            if "IFS" in temp_locator:
-                pairedFrames = getPairedFrames(True, originalControl + "_Petar3D", blendCurve, constraint + blendIndex, timelineStart, timelineEnd)
-                removeInfluence(blendCurve, timelineStart, timelineEnd, pairedFrames, "blend")   
-            
-        
-            #EULER FILTER
-            cmds.filterCurve(originalControl + ".translate", originalControl + ".rotate")
-            
-            #THIS SECTION MAKES SURE THE NEWLY ADJUSTED CURVES ARE FLAT
-            if "IFS" in temp_locator:
-                #MAKING SURE THAT THE TANGENTS THAT ARE FLAT AT THE END OF IT ALL
-                cmds.keyTangent(selectionShapeNode, attribute = "visibility", inTangentType= "flat")
-                cmds.keyTangent(originalControl, attribute = "blend{0}{1}".format(constraint.capitalize(), blendIndex), inTangentType= "flat")
-            
-            cmds.delete(temp_locator)
-            
-        else:
-            #IF AN OBJECT FROM OUTSIDE THE PETAR3D SS SCRIPTS IS SELECTED, IT WON'T COUNT, AND THE USER WILL BE NOTIFIED WHICH OBJECT THEY MISSELECTED
-            assistMessage("<hl>Error: Can't run script on this object, it's not a locator set-up  - {0} <hl>".format(temp_locator), 4000, False)
-            
-#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-
-#UI LOGIC
-def userInterface():
-    if cmds.window("World_Space_Conversion", ex=True):
-        cmds.deleteUI("World_Space_Conversion")
-    
-    cmds.window("World_Space_Conversion", title="World-Space Conversion, by Petar3D", wh=[373, 211], s=False)
-    cmds.formLayout("formLayout", numberOfDivisions=100, w=373, h=211)
-
-    cmds.button("Parent_Constraint_Button", l="Parent Constraint", recomputeSize = True, bgc=[0.6220035095750363, 0.9418478675516899, 1.0], h = 50, w = 116,  c="storeParentConstraint()", parent ="formLayout")
-    formLayout("Parent_Constraint_Button", 15, 16)
-
-    cmds.button("Orient_Constraint_Button", l="Orient Constraint", recomputeSize = True, bgc=[0.6220035095750363, 1.0, 0.6220035095750363], h = 50.404921049703624, w = 116, c="storeOrientConstraint()", parent ="formLayout")
-    formLayout("Orient_Constraint_Button", 79, 16 )
-    
-    cmds.button("Point_Constraint_Button", l="Point Constraint", recomputeSize = True, bgc=[1.0, 1.0, 0.6220035095750363], h = 50, w = 116, c="storePointConstraint()",  parent ="formLayout")
-    formLayout("Point_Constraint_Button", 146, 16)
-    
-    cmds.button("Delete_Setup_Button", l="Delete Setup", recomputeSize = True, bgc=[1.0, 0.6220035095750363, 0.6220035095750363], h = 50, w = 197, c="deleteSetup()",  parent ="formLayout")
-    formLayout("Delete_Setup_Button", 16,154)
-    
-    cmds.button("Documentation", l="Documentation", recomputeSize = True, bgc=[0.8, 0.8, 0.8], h = 30, w = 100, c="documentation()",  parent ="formLayout")
-    formLayout("Documentation", 172,263)
-
-    cmds.intFieldGrp("BakeInterval_IntField", l="Bake Interval: ", numberOfFields=1, v1=1, cw = (1, 90.0), w = 198, parent ="formLayout")
-    formLayout("BakeInterval_IntField", 80, 134)
-    
-    cmds.checkBoxGrp("SmartBake_CheckBox", l="Smart Bake: ", ncb=1, l1="", cw = (1, 72), w = 92, vr=False, v1=False,  parent ="formLayout")
-    formLayout("SmartBake_CheckBox", 110,143)
-    
-    cmds.floatFieldGrp("Intensity_FloatField", l="Intensity", numberOfFields=1, v1=5.0,  cw = (1, 44), w = 128, parent ="formLayout")
-    formLayout("Intensity_FloatField", 106, 237)
-
-    cmds.showWindow("World_Space_Conversion")
-     
-userInterface()
\ No newline at end of file
+"""
+This script is part of my space-switching series, inspired by Richard Lico's animation sherpa course, where he goes over the space-switching approach to animating - https://www.animationsherpa.com/
+You can use this script for any commercial or non-commercial projects. You're not allowed to sell this script. 
+Author - Petar3D
+Initial Release Date - 18.07.2023
+Version - 1.0
+
+Description - Tool that allows you to apply a temporary locator setup on top of any selection, and it turns it into world-space. The perk of this tool is that you can apply it on a specific range in the timeline, and it 
+preserves the original control's animation data.
+"""
+
+
+import maya.cmds as cmds
+import maya.mel as mel
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+import bisect
+import functools
+from array import array
+import json
+import zlib
+import World_Space_Conversion_KeyReduction as keyReduction
+import World_Space_Conversion_Matrix as matrixMath
+import World_Space_Conversion_Undo as apiUndo
+import World_Space_Conversion_Profiling as profiling
+from sys import exit
+
+cmds.cycleCheck(e=False)
+
+def formLayout(name, topCoordinates, leftCoordinates):
+    #ADJUSTS THE POSITION OF THE UI FEATURES
+    cmds.formLayout("formLayout", edit=True, attachForm=[(name, "top",topCoordinates), (name, "left",leftCoordinates)])    
+
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+#FUNCTIONS
+def assistMessage(message, time, toExit):
+    #POPS UP A MESSAGE ON THE USER'S SCREEN TO INFORM THEM OF SOMETHING
+    cmds.inViewMessage(amg=message, pos='midCenter', fade=True, fst=time, ck=True)
+    if toExit == True:
+        exit()
+
+
+#THE EVALUATION MODE EVERY OPERATION RUNS IN ("off", "serial" OR "parallel"). NONE LEAVES WHATEVER THE USER HAS SET ALONE
+OPERATION_EVALUATION_MODE = None
+#DEBUG MODE PROFILES EVERY OPERATION - IT PRINTS THE TIME AND MAYA COMMANDS EVERY STAGE TOOK FOR EVERY CONTROL, APPENDS THEM TO THE PROFILE LOG AS JSON AND SHOWS A SHORT SUMMARY ON SCREEN
+#STUDIOS CAN ALSO FEED THE SAME SUMMARY INTO THEIR OWN TELEMETRY WITH profiling.addHook(function), THAT WORKS WITH DEBUG MODE OFF AS WELL
+DEBUG_MODE = False
+#WHERE THE PROFILE LOG GOES. NONE PUTS IT IN MAYA'S USER APP DIRECTORY
+PROFILE_LOG = None
+
+class SceneOperation(object):
+    #WRAPS ONE OPERATION OF THE TOOL (APPLY, DELETE, REFRESH...) SO IT'S A SINGLE UNDO STEP, DOESN'T REDRAW THE VIEWPORT WHILE IT WORKS, AND CAN RUN IN ITS OWN EVALUATION MODE
+    #IF THE OPERATION FAILS OR IS ABORTED BY assistMessage(..., True), THE WHOLE UNDO CHUNK IS UNDONE SO NOTHING IS LEFT HALF-APPLIED, AND THE VIEWPORT AND EVALUATION MODE ARE PUT BACK
+    #OPERATIONS CAN BE NESTED - ONLY THE OUTERMOST ONE DOES ANY OF THIS. IT CAN BE USED AS A with BLOCK OR AS A DECORATOR ON AN ENTRY POINT
+    depth = 0
+    profiler = profiling.NULL_PROFILER
+    nodeInfo = None
+
+    def __init__(self, name, evaluationMode=None):
+        self.name = name
+        self.evaluationMode = evaluationMode
+        self.previousMode = None
+
+    def __call__(self, function):
+        @functools.wraps(function)
+        def operation(*args, **kwargs):
+            with SceneOperation(self.name, self.evaluationMode):
+                return function(*args, **kwargs)
+        return operation
+
+    def __enter__(self):
+        global cmds
+        SceneOperation.depth += 1
+        if SceneOperation.depth != 1:
+            return self
+        if DEBUG_MODE or len(profiling.hooks) != 0:
+            #WHILE THE OPERATION IS PROFILED, EVERY MAYA COMMAND THE TOOL CALLS GOES THROUGH A COUNTER, SO THE PROFILER CAN TELL HOW MANY OF THEM EACH STAGE USED
+            cmds = profiling.CommandCounter(cmds)
+            SceneOperation.profiler = profiling.Profiler(self.name, cmds)
+        SceneOperation.nodeInfo = NodeInfoCache()
+        cmds.undoInfo(openChunk=True, chunkName=self.name)
+        #AN OPERATION THAT ABORTS BEFORE CHANGING ANYTHING WOULD LEAVE AN EMPTY CHUNK, AND UNDOING IT WOULD UNDO WHATEVER THE USER DID BEFORE, SO EVERY CHUNK STARTS WITH AN EMPTY STEP
+        apiUndo.commit(setupRegistry.invalidate, setupRegistry.invalidate)
+        cmds.refresh(suspend=True)
+        evaluationMode = self.evaluationMode or OPERATION_EVALUATION_MODE
+        if evaluationMode != None:
+            self.previousMode = cmds.evaluationManager(q=True, mode=True)[0]
+            if self.previousMode != evaluationMode:
+                cmds.evaluationManager(mode=evaluationMode)
+        return self
+
+    def __exit__(self, errorType, error, traceback):
+        global cmds
+        SceneOperation.depth -= 1
+        if SceneOperation.depth != 0:
+            return False
+        try:
+            if self.previousMode != None and cmds.evaluationManager(q=True, mode=True)[0] != self.previousMode:
+                cmds.evaluationManager(mode=self.previousMode)
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
+        if errorType != None:
+            if cmds.undoInfo(q=True, state=True):
+                cmds.undo()
+            setupRegistry.invalidate()
+        nodeInfo = SceneOperation.nodeInfo
+        SceneOperation.nodeInfo = None
+        if SceneOperation.profiler != profiling.NULL_PROFILER:
+            summary = SceneOperation.profiler.finish(errorType != None)
+            summary["nodeInfo"] = nodeInfo.getHitRates()
+            SceneOperation.profiler = profiling.NULL_PROFILER
+            cmds = cmds._module
+            reportProfile(summary)
+        #THE ABORTS THAT assistMessage() MAKES WITH sys.exit() ALREADY PUT THEIR MESSAGE ON SCREEN, SO THEY STOP HERE. ANY OTHER ERROR KEEPS GOING UP
+        return errorType != None and issubclass(errorType, SystemExit)
+
+
+class ProfiledStage(object):
+    #MARKS A STAGE OF AN OPERATION FOR THE PROFILER, AS A with BLOCK AROUND PART OF A FUNCTION OR AS A DECORATOR AROUND A WHOLE ONE. WHEN NOTHING IS BEING PROFILED IT DOES NOTHING
+    #THE CONTROL IS ONLY GIVEN ON THE STAGES THAT LOOP OVER THE CONTROLS, THE STAGES INSIDE THEM PICK IT UP FROM THERE
+    def __init__(self, name, control=None):
+        self.name = name
+        self.control = control
+        self.profiler = None
+
+    def __call__(self, function):
+        @functools.wraps(function)
+        def stage(*args, **kwargs):
+            with ProfiledStage(self.name):
+                return function(*args, **kwargs)
+        return stage
+
+    def __enter__(self):
+        self.profiler = SceneOperation.profiler
+        self.profiler.openStage(self.name, self.control)
+        return self
+
+    def __exit__(self, errorType, error, traceback):
+        self.profiler.closeStage()
+        return False
+
+
+class NodeInfoCache(object):
+    #REMEMBERS THE PROPERTIES OF A NODE THAT DON'T CHANGE WHILE AN OPERATION RUNS - ITS SHAPES, LOCKED CHANNELS, ROTATE ORDER, REFERENCE STATUS AND BOUNDING BOX - SO EACH ONE IS ONLY QUERIED ONCE PER OPERATION
+    #EVERY OPERATION GETS A NEW ONE FROM SceneOperation AND HANDS IT DOWN, SO NOTHING IS EVER READ FROM AN EARLIER OPERATION. IT COUNTS ITS HITS AND MISSES FOR THE PROFILE IN DEBUG MODE
+    def __init__(self):
+        self.values = {}
+        self.hits = {}
+        self.misses = {}
+
+    def get(self, kind, node, query):
+        key = (kind, node)
+        if key in self.values:
+            self.hits[kind] = self.hits.get(kind, 0) + 1
+        else:
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+            self.values[key] = query()
+        return self.values[key]
+
+    def set(self, kind, node, value):
+        #FOR THE PROPERTIES THE OPERATION CHANGES ITSELF, LIKE THE ROTATE ORDER setup() GIVES A NEW LOCATOR
+        self.values[(kind, node)] = value
+
+    def prefetch(self, nodes):
+        #ASKS FOR THE REFERENCE STATUS OF ALL THE NODES IN ONE QUERY, INSTEAD OF ONE referenceQuery PER NODE
+        nodes = [node for node in nodes if ("referenced", node) not in self.values]
+        if len(nodes) == 0:
+            return
+        referencedNodes = set(cmds.ls(nodes, referencedNodes=True))
+        for node in nodes:
+            self.values[("referenced", node)] = node in referencedNodes
+
+    def getShapes(self, node):
+        return self.get("shapes", node, lambda: cmds.listRelatives(node, shapes=True, children=True))
+
+    def getLockedAttributes(self, node):
+        #ALL THE LOCKED ATTRIBUTES OF THE NODE COME BACK FROM ONE listAttr, INSTEAD OF ONE getAttr PER CHANNEL
+        return self.get("locked", node, lambda: set(cmds.listAttr(node, locked=True) or []))
+
+    def getRotateOrder(self, node):
+        return self.get("rotateOrder", node, lambda: cmds.getAttr(node + ".rotateOrder"))
+
+    def isReferenced(self, node):
+        return self.get("referenced", node, lambda: cmds.referenceQuery(node, isNodeReferenced=True))
+
+    def getBoundingBox(self, node):
+        return self.get("boundingBox", node, lambda: cmds.exactWorldBoundingBox(node))
+
+    def getHitRates(self):
+        return dict([(kind, {"hits": self.hits.get(kind, 0), "misses": self.misses.get(kind, 0)}) for kind in set(self.hits) | set(self.misses)])
+
+
+def getNodeInfo(nodeInfo=None):
+    #THE CACHE THAT WAS HANDED DOWN, OR THE ONE OF THE OPERATION THAT'S RUNNING, OR A NEW ONE WHEN A FUNCTION IS CALLED ON ITS OWN OUTSIDE OF ANY OPERATION
+    if nodeInfo != None:
+        return nodeInfo
+    if SceneOperation.nodeInfo != None:
+        return SceneOperation.nodeInfo
+    return NodeInfoCache()
+
+
+def reportProfile(summary):
+    #IN DEBUG MODE THE SUMMARY GETS PRINTED, LOGGED AND SHOWN ON SCREEN. THE STUDIO'S HOOKS GET IT EITHER WAY
+    if DEBUG_MODE:
+        print(profiling.formatSummary(summary))
+        for entry in sorted(summary["stages"], key=lambda entry: entry["seconds"], reverse=True):
+            print("    {0:<18} {1:<40} {2:>9.3f}s {3:>8} commands".format(entry["stage"], entry["control"] or "-", entry["seconds"], entry["commands"]))
+        if len(summary.get("nodeInfo", {})) != 0:
+            rates = ["{0} {1}/{2}".format(kind, counts["hits"], counts["hits"] + counts["misses"]) for kind, counts in sorted(summary["nodeInfo"].items())]
+            print("    node info cache hits - " + ", ".join(rates))
+        logPath = PROFILE_LOG or cmds.internalVar(userAppDir=True) + "worldSpaceConversion_profile.log"
+        try:
+            profiling.writeLog(summary, logPath)
+        except (IOError, OSError) as error:
+            cmds.warning("Couldn't write the profile log - {0}".format(error))
+        if not summary["failed"]:
+            assistMessage(profiling.formatSummary(summary), 4000, False)
+    for hook, error in profiling.publish(summary):
+        cmds.warning("Profiling hook {0} failed - {1}".format(getattr(hook, "__name__", hook), error))
+
+        
+def documentation():
+    cmds.showHelp("https://petarpehchevski3d.gumroad.com/l/worldspaceconversion", a=True)
+            
+def hideAttributes(type, *controls):
+#HIDES UNNECESSARY ATTRIBUTES ON THE CONTROLS        
+    for item in controls:
+        for attr in ["." + type + "X", "." + type + "Y", "." + type + "Z"]:
+            cmds.setAttr(item + attr, k=False, cb=False)
+    
+
+
+def setConstraint(constraintType, parent, child, translateCurves, rotateCurves):
+    #CONSTRAINT FUNCTION
+    if constraintType == "parent":
+        constraint = cmds.parentConstraint(parent, child, skipTranslate = translateCurves, skipRotate = rotateCurves)[0]
+    elif constraintType == "orient":
+        constraint = cmds.orientConstraint(parent, child, skip = rotateCurves)[0]
+    elif constraintType == "point":
+        constraint = cmds.pointConstraint(parent, child, skip = translateCurves)[0]
+    
+    return constraint
+
+
+
+#CHECKS FOR WHAT TYPE OF CONSTRAINT DID THE SELECTED CONTROL APPLY ON THE ORIGINAL CONTROL. THEN WE STORE THE TYPE IN VARIABLE, AS WELL AS THE BLEND INDEX
+@ProfiledStage("blendIndex")
+def getBlendIndex(object, blendIndexControl, constraintType):
+    for item in cmds.listConnections(object, c=True, type="constraint"):  
+        if blendIndexControl + "_" + constraintType + "Constraint" in item:
+            tempBlendIndex = item[-1:]
+                
+            return tempBlendIndex
+            
+
+def getConstraintAttribute(constraintType):
+    #SETS A KEY ON THE START AND END OF THE TIMELINE, SO THAT WE ENSURE THERE'S A BLEND NODE ALL THE TIME. IF THERE'S NO KEY BEFORE ADDING THE SETUP, THE SCRIPT WON'T APPLY A SWITCH ON THE BLEND NODE
+    tempAttribute = []
+    if constraintType == "orient":
+        tempAttribute = "rotate"
+    elif constraintType == "point":
+        tempAttribute = "translate"
+    elif constraintType == "parent":
+        tempAttribute = ["translate", "rotate"]
+    return tempAttribute
+        
+def getLockedCurves(obj, attribute, nodeInfo=None):
+    #GETS A LIST OF THE LOCKED CURVES FOR EITHER TRANSLATE, ROTATE OR SCALE, SO THE CONSTRAINTS KNOW WHICH CURVES TO AVOID
+    lockedAttributes = getNodeInfo(nodeInfo).getLockedAttributes(obj)
+    curves = {"{0}X".format(attribute):"x", "{0}Y".format(attribute):"y", "{0}Z".format(attribute):"z"}
+    for curve in curves.copy():
+        if curve not in lockedAttributes:
+            curves.pop(curve)
+    curves = list(curves.values())
+    return curves
+            
+def setup(obj, tempControl, constraintType, translateCurves, rotateCurves, nodeInfo=None):
+    #ADDS A LOCATORS ONTO EVERY SELECTION AND CONSTRAINS IT TO THE ORIGINAL, THE BAKE ITSELF HAPPENS LATER FOR ALL THE LOCATORS AT ONCE IN bakeLocators()
+    nodeInfo = getNodeInfo(nodeInfo)
+    cmds.matchTransform(tempControl, obj)
+    original_RO = nodeInfo.getRotateOrder(obj)  #STORES THE ROTATION ORDER OF THE CURRENT CONTROL, TO BE ASSIGNED TO THE TEMP CONTROLS
+    cmds.setAttr(tempControl + ".rotateOrder", original_RO)
+    nodeInfo.set("rotateOrder", tempControl, original_RO)
+    matchScale(obj, tempControl, nodeInfo=nodeInfo)
+    setConstraint(constraintType, obj, tempControl, translateCurves, rotateCurves)
+
+
+def setConstraintDriver(obj, tempControl, record, translateCurves, rotateCurves, timelineStart, timelineEnd, specificTimelineMode, nodeInfo=None):
+    #REVERSES THE CONSTRAINT SO THE BAKED LOCATOR DRIVES THE ORIGINAL CONTROL, AND SWITCHES THE CONSTRAINT WEIGHT AND THE PAIRBLEND ON FOR THE RANGE
+    constraintType = record["constraintType"]
+
+    #CHECKS WHICH ATTRIBUTE TO PLACE THE INITIAL KEYS ON
+    tempAttribute = getConstraintAttribute(constraintType)
+
+    #CHECKS TO SEE IF THE ORIGINAL CONTROL HAS ANY KEYS ON ITS CURVES ALREADY, AND IF NOT IT PLACES THEM TO ACTIVATE THE BLEND INDEX
+    if cmds.keyframe(obj, at =tempAttribute, q=True) == None:
+        cmds.setKeyframe(obj, t=(timelineStart, timelineEnd), at=tempAttribute)
+    else:
+        cmds.setKeyframe(obj, t=(timelineStart, timelineEnd), at=tempAttribute, i=True)
+
+    #LOCATOR CONSTRAINT SECTION
+    constraint = setConstraint(constraintType, tempControl, obj, translateCurves, rotateCurves)
+    #IF THE CONSTRAINT TYPE IS ORIENT, WE APPLY A REVERSE POINT CONSTRAINT
+    if constraintType == "orient":
+        setConstraint("point", obj, tempControl, translateCurves, rotateCurves)
+
+    #IF THE RIG IS REFERENCED, WE STORE THE NAME OF THE TEMP LOCATOR WITHOUT THE NAMESPACE, BECAUSE THE COSNTRAINT WE'LL INFLUENCE DON'T HAVE THE NAMESPACE INSIDE
+    if getNodeInfo(nodeInfo).isReferenced(obj) or ":" in obj:
+        tempControl = tempControl.split(":")[1]
+
+    #WE'RE TRYING TO FIND THE INDEX AT THE END OF THE CONSTRAINT'S WEIGHT ATTRIBUTE. BECAUSE THERE COULD BE MANY CONSTRAINTS APPLIED ON THE SAME OBJECT, WE CAN'T ALWAYS KNOW WHAT THAT NUMBER WILL BE
+    with ProfiledStage("constraintIndex"):
+        for item in cmds.listConnections(constraint, c=True):
+            if "{0}.{1}W".format(constraint, tempControl) in item:
+                constraintIndex = item[-1:]
+
+    #THE CONSTRAINT HAVE A NUMBER AT THE END, WE STORE THIS NUMBER IN A VARIABLE SO WE KNOW WHICH NUMBER TO ATTACHA WHEN WE INFLUENCE THE BLEND NODE
+    if specificTimelineMode:
+        applyInfluenceSwitch("{0}.{1}W{2}".format(constraint, tempControl, constraintIndex), timelineStart, timelineEnd, subtract, 1, 0)
+    blendIndex = constraint[-1:]
+    record["blendIndex"] = blendIndex
+    cmds.setAttr(record["locator"] + ".worldSpaceBlendIndex", int(blendIndex))
+
+    #BLEND NODE SWITCH SECTION
+    if specificTimelineMode:
+        applyInfluenceSwitch("{0}.blend{1}{2}".format(obj, constraintType.capitalize(), blendIndex), timelineStart, timelineEnd, subtract, 1, 1)
+
+
+def canUseMatrixDriver(obj, constraintType, translateCurves, rotateCurves):
+    #THE MATRIX DRIVER OVERRIDES THE WHOLE WORLD MATRIX OF THE CONTROL, SO IT'S ONLY USED FOR PARENT SETUPS WITH NO LOCKED CHANNELS AND NO ANIMATED SCALE
+    #IT NEEDS offsetParentMatrix (MAYA 2020 AND UP) WITH NOTHING ELSE CONNECTED TO IT, AND A HIERARCHY THAT DOESN'T DEPEND ON THE CONTROL, SO THE BAKE-DOWN CAN ALWAYS BE WORKED OUT FROM THE MATH
+    if constraintType != "parent" or len(translateCurves + rotateCurves) != 0:
+        return False
+    if not cmds.attributeQuery("offsetParentMatrix", node=obj, exists=True):
+        return False
+    if cmds.listConnections([obj + ".offsetParentMatrix", obj + ".scaleX", obj + ".scaleY", obj + ".scaleZ"], s=True, d=False) != None:
+        return False
+    return not dependsOnItself(obj)
+
+
+def getMatrixDriverOffset(obj, tempControl):
+    #THE STATIC PART OF THE MATRIX DRIVER - IT MOVES THE CONTROL'S ROTATE PIVOT ONTO THE ORIGIN, GIVES IT BACK ITS OWN SCALE AND TAKES OUT THE SCALE matchScale() PUT ON THE LOCATOR
+    toCentimeters = om.MDistance(1.0, om.MDistance.uiUnit()).asCentimeters()
+    rotatePivot = [-value * toCentimeters for value in cmds.getAttr(obj + ".rotatePivot")[0]]
+    scale = [controlScale / locatorScale for controlScale, locatorScale in zip(cmds.getAttr(obj + ".scale")[0], cmds.getAttr(tempControl + ".scale")[0])]
+    return matrixMath.multiplyMatrices(matrixMath.composeMatrix(rotatePivot, [0.0, 0.0, 0.0], 0), matrixMath.composeMatrix([0.0, 0.0, 0.0], [0.0, 0.0, 0.0], 0, scale))
+
+
+def setMatrixDriver(obj, tempControl, timelineStart, timelineEnd, specificTimelineMode):
+    #LIVE ALTERNATIVE TO THE CONSTRAINT NETWORK - TWO MATRIX NODES DRIVE THE CONTROL'S offsetParentMatrix, SO ITS OWN CURVES STAY CONNECTED AND THERE'S NO CONSTRAINT OR PAIRBLEND TO EVALUATE
+    #THE multMatrix WORKS OUT INVERSE LOCAL MATRIX x OFFSET x LOCATOR WORLD MATRIX x INVERSE PARENT MATRIX, WHICH CANCELS WHATEVER THE CONTROL'S CHANNELS DO AND PUTS ITS PIVOT ON THE LOCATOR
+    #THE blendMatrix SWITCHES BETWEEN THAT AND THE ORIGINAL offsetParentMatrix, SO ITS ONE WEIGHT TAKES THE PLACE OF BOTH THE CONSTRAINT WEIGHT AND THE PAIRBLEND
+    multNode = cmds.createNode("multMatrix", n=tempControl + "_multMatrix", skipSelect=True)
+    blendNode = cmds.createNode("blendMatrix", n=tempControl + "_blendMatrix", skipSelect=True)
+    cmds.connectAttr(obj + ".inverseMatrix", multNode + ".matrixIn[0]")
+    cmds.setAttr(multNode + ".matrixIn[1]", getMatrixDriverOffset(obj, tempControl), type="matrix")
+    cmds.connectAttr(tempControl + ".worldMatrix[0]", multNode + ".matrixIn[2]")
+    cmds.connectAttr(obj + ".parentInverseMatrix[0]", multNode + ".matrixIn[3]")
+
+    cmds.setAttr(blendNode + ".inputMatrix", cmds.getAttr(obj + ".offsetParentMatrix"), type="matrix")
+    cmds.connectAttr(multNode + ".matrixSum", blendNode + ".target[0].targetMatrix")
+    cmds.connectAttr(blendNode + ".outputMatrix", obj + ".offsetParentMatrix")
+    if specificTimelineMode:
+        applyInfluenceSwitch(blendNode + ".target[0].weight", timelineStart, timelineEnd, subtract, 1, 0)
+
+
+def getMatrixDriver(locator):
+    #FINDS THE multMatrix AND blendMatrix THAT setMatrixDriver() HOOKED UP TO A LOCATOR
+    multNode = cmds.listConnections(locator + ".worldMatrix[0]", s=False, d=True, type="multMatrix")[0]
+    blendNode = cmds.listConnections(multNode + ".matrixSum", s=False, d=True, type="blendMatrix")[0]
+    return multNode, blendNode
+
+
+def removeMatrixDriver(locator, originalControl):
+    #PUTS THE ORIGINAL offsetParentMatrix BACK ON THE CONTROL AND DELETES THE MATRIX NODES, TOGETHER WITH THE CURVE THAT SWITCHED THEM
+    multNode, blendNode = getMatrixDriver(locator)
+    originalMatrix = cmds.getAttr(blendNode + ".inputMatrix")
+    weightCurves = cmds.listConnections(blendNode, s=True, d=False, type="animCurve") or []
+    cmds.disconnectAttr(blendNode + ".outputMatrix", originalControl + ".offsetParentMatrix")
+    cmds.setAttr(originalControl + ".offsetParentMatrix", originalMatrix, type="matrix")
+    cmds.delete([multNode, blendNode] + weightCurves)
+
+
+@ProfiledStage("bake")
+def bakeLocators(tempControls, originalControls, ranges, settings, nodeInfo=None):
+    #BAKES EVERY TEMP LOCATOR OVER ITS OWN (START, END) RANGE, INSTEAD OF SCRUBBING THE RANGE ONCE PER LOCATOR. LOCATORS WHOSE RANGES OVERLAP ARE SAMPLED TOGETHER IN A SINGLE PASS
+    #OVER THE UNION OF THEIR FRAMES, SO NO FRAME GETS EVALUATED TWICE AND NO LOCATOR GETS EVALUATED OUTSIDE THE FRAMES OF ITS GROUP
+    #THE PASSES GO THROUGH DG CONTEXTS, SO THE CURRENT TIME NEVER MOVES AND ONLY THE NODES THE LOCATORS DEPEND ON GET EVALUATED
+    nodeInfo = getNodeInfo(nodeInfo)
+    bakeInterval = settings["bakeInterval"]
+    smartBake = settings["smartBake"]
+    smartBakeTolerance = settings["smartBakeTolerance"]
+    sparseBake = settings["sparseBake"]
+
+    bakeTimes = []
+    denseCount = 0
+    for originalControl, (timelineStart, timelineEnd) in zip(originalControls, ranges):
+        denseTimes = set(range(int(timelineStart), int(timelineEnd) + 1, max(bakeInterval, 1))) | set([timelineStart, timelineEnd])
+        denseCount += len(denseTimes)
+        keyTimes = None
+        if sparseBake == True:
+            keyTimes = getUpstreamKeyTimes(originalControl, timelineStart, timelineEnd)
+        if keyTimes == None:
+            bakeTimes.append(denseTimes)
+        else:
+            bakeTimes.append(keyTimes | set([timelineStart, timelineEnd]))
+
+    groups = []
+    for position in sorted(range(len(tempControls)), key=lambda position: ranges[position][0]):
+        if len(groups) != 0 and ranges[position][0] <= groups[-1]["end"]:
+            groups[-1]["positions"].append(position)
+            groups[-1]["end"] = max(groups[-1]["end"], ranges[position][1])
+        else:
+            groups.append({"positions": [position], "end": ranges[position][1]})
+    for group in groups:
+        group["frames"] = sorted(set([frame for position in group["positions"] for frame in bakeTimes[position]]))
+        group["samples"] = sampleMatrices([tempControls[position] + ".worldMatrix[0]" for position in group["positions"]], group["frames"])
+
+    #THE KEYS ARE WRITTEN ONCE THE CONSTRAINTS ARE GONE, OTHERWISE KEYING A CONSTRAINED CHANNEL WOULD ADD A PAIRBLEND ONTO THE LOCATOR
+    cmds.delete(cmds.listRelatives(tempControls, type="constraint"))
+    for group in groups:
+        frames = group["frames"]
+        for nodeIndex, position in enumerate(group["positions"]):
+            tempControl = tempControls[position]
+            frameIndexes = [frameIndex for frameIndex, frame in enumerate(frames) if frame in bakeTimes[position]]
+            times = [frames[frameIndex] for frameIndex in frameIndexes]
+            channels = decomposeWorldMatrices(group["samples"], nodeIndex, len(group["positions"]), frameIndexes, nodeInfo.getRotateOrder(tempControl))
+            for attr in ["translate", "rotate"]:
+                for axis, curve in enumerate(["X", "Y", "Z"]):
+                    values = channels[attr][axis]
+                    #A CHANNEL THAT HOLDS THE SAME VALUE THROUGH THE WHOLE RANGE ONLY NEEDS A SINGLE KEY
+                    if max(values) - min(values) <= 1e-6:
+                        writeKeys("{0}.{1}{2}".format(tempControl, attr, curve), times[:1], values[:1])
+                    else:
+                        writeKeys("{0}.{1}{2}".format(tempControl, attr, curve), times, values)
+
+    #THE KEY REDUCTION WORKS ON ONE RANGE AT A TIME, SO THE LOCATORS ARE REDUCED TOGETHER WITH THE OTHERS THAT SHARE THEIR RANGE
+    if smartBake == True:
+        for timelineStart, timelineEnd in sorted(set(ranges)):
+            rangeControls = [tempControl for tempControl, tempRange in zip(tempControls, ranges) if tempRange == (timelineStart, timelineEnd)]
+            reduceKeys([plug for tempControl in rangeControls for plug in getBakePlugs(tempControl, ["translate", "rotate"])], timelineStart, timelineEnd, smartBakeTolerance)
+
+    #BAKING THE LOCATORS ONE BY ONE WOULD HAVE COST A FULL PASS OVER ITS RANGE FOR EACH OF THEM, SO THAT'S HOW MANY FRAME EVALUATIONS WE SAVED
+    return denseCount - sum([len(group["frames"]) for group in groups])
+
+
+@ProfiledStage("sampleMatrices")
+def sampleMatrices(matrixPlugs, times):
+    #EVALUATES EVERY MATRIX PLUG (LIKE "locator.worldMatrix[0]") AT EVERY TIME THROUGH A DG CONTEXT, WITHOUT EVER CHANGING THE CURRENT TIME, SO THE VIEWPORT, THE UI AND OTHER SCRIPTJOBS DON'T GET TRIGGERED
+    #THE RESULT IS ONE FLAT ARRAY OF DOUBLES, FRAMES x PLUGS x 16 - THE MATRIX OF A PLUG ON A FRAME STARTS AT (frameIndex * len(matrixPlugs) + plugIndex) * 16
+    selectionList = om.MSelectionList()
+    for matrixPlug in matrixPlugs:
+        selectionList.add(matrixPlug)
+    plugs = [selectionList.getPlug(index) for index in range(len(matrixPlugs))]
+
+    timeUnit = om.MTime.uiUnit()
+    samples = array("d")
+    for time in times:
+        context = om.MDGContext(om.MTime(time, timeUnit))
+        #NEWER VERSIONS OF MAYA WANT THE CONTEXT TO BE MADE CURRENT, OLDER ONES TAKE IT AS AN ARGUMENT WHEN READING THE PLUG
+        if hasattr(context, "makeCurrent"):
+            previousContext = context.makeCurrent()
+            try:
+                matrices = [om.MFnMatrixData(plug.asMObject()).matrix() for plug in plugs]
+            finally:
+                previousContext.makeCurrent()
+        else:
+            matrices = [om.MFnMatrixData(plug.asMObject(context)).matrix() for plug in plugs]
+        for matrix in matrices:
+            samples.extend([matrix[index] for index in range(16)])
+    return samples
+
+
+def decomposeWorldMatrices(samples, nodeIndex, nodeCount, frameIndexes, rotateOrder):
+    #TURNS THE SAMPLED MATRICES OF ONE NODE INTO TRANSLATE AND ROTATE VALUES IN UI UNITS. THE MATH ITSELF IS IN World_Space_Conversion_Matrix, THIS ONLY CONVERTS THE UNITS
+    #THE ROTATIONS COME OUT ALREADY EULER FILTERED, SO THE LOCATORS DON'T NEED A SEPARATE FILTER PASS
+    translate, rotate = matrixMath.decomposeMatrices(samples, nodeIndex, nodeCount, frameIndexes, rotateOrder)
+    distanceScale = om.MDistance(1.0).asUnits(om.MDistance.uiUnit())
+    angleScale = om.MAngle(1.0).asUnits(om.MAngle.uiUnit())
+    return {"translate": [[value * distanceScale for value in values] for values in translate], "rotate": [[value * angleScale for value in values] for values in rotate]}
+
+
+def dependsOnItself(control):
+    #CHECKS IF ANYTHING ABOVE THE CONTROL IN THE HIERARCHY IS DRIVEN BY THE CONTROL ITSELF. IF IT IS, THE PARENT MATRIX CHANGES WITH THE CONTROL'S OWN VALUES AND CAN'T BE READ AHEAD OF TIME
+    path = cmds.ls(control, long=True)[0].split("|")
+    parents = ["|".join(path[:depth]) for depth in range(2, len(path))]
+    if len(parents) == 0:
+        return False
+    return "|".join(path) in cmds.ls(cmds.listHistory(parents) or [], long=True)
+
+
+def getOffsetParentPlug(control, locator, driver):
+    #THE PLUG TO SAMPLE FOR THE offsetParentMatrix THE CONTROL'S CHANNELS SIT UNDER. A MATRIX DRIVER OWNS THE CONTROL'S OWN PLUG WHILE IT'S ON, SO FOR THOSE IT'S THE ORIGINAL MATRIX removeMatrixDriver() PUTS BACK
+    #NONE IN VERSIONS OF MAYA THAT DON'T HAVE THE ATTRIBUTE
+    if driver == "matrix":
+        return getMatrixDriver(locator)[1] + ".inputMatrix"
+    if cmds.attributeQuery("offsetParentMatrix", node=control, exists=True):
+        return control + ".offsetParentMatrix"
+    return None
+
+
+def bakeDownAnalytically(setups, timelineStart, timelineEnd, bakeInterval, nodeInfo=None):
+    #WORKS OUT WHAT THE CONSTRAINT WOULD HAVE BAKED ONTO EVERY ORIGINAL CONTROL STRAIGHT FROM THE MATH - LOCATOR WORLD MATRIX x INVERSE (OFFSET PARENT MATRIX x PARENT MATRIX), WITH THE ROTATE PIVOT AND JOINT ORIENT TAKEN INTO ACCOUNT
+    #ONLY THE LOCATORS AND THE PARENTS OF THE CONTROLS GET EVALUATED, AND THE KEYS ARE WRITTEN IN ONE CALL PER CHANNEL. IT RETURNS THE SETUPS IT COULDN'T SOLVE, SO THEY CAN GO THROUGH A REAL BAKE
+    nodeInfo = getNodeInfo(nodeInfo)
+    solvedSetups = []
+    unsolvedSetups = []
+    for setup in setups:
+        lockedAttributes = nodeInfo.getLockedAttributes(setup["originalControl"])
+        plugs = [plug for plug in getBakePlugs(setup["originalControl"], getConstraintAttribute(setup["constraint"])) if plug.split(".")[-1] not in lockedAttributes]
+        #MATRIX DRIVERS LEAVE THE CONTROL'S OWN CURVES CONNECTED, AND writeKeys() CREATES THEM IF THE CONTROL WASN'T KEYED
+        if dependsOnItself(setup["originalControl"]) or (setup["driver"] == "constraint" and None in [getAnimCurve(plug) for plug in plugs]):
+            unsolvedSetups.append(setup)
+        else:
+            solvedSetups.append((setup, plugs))
+    if len(solvedSetups) == 0:
+        return unsolvedSetups
+
+    #THE CONTROL'S CHANNELS SIT UNDER ITS offsetParentMatrix AS WELL AS ITS PARENT
+    offsetPlugs = [getOffsetParentPlug(setup["originalControl"], setup["locator"], setup["driver"]) for setup, plugs in solvedSetups]
+
+    frames = sorted(set(range(int(timelineStart), int(timelineEnd) + 1, max(bakeInterval, 1))) | set([timelineStart, timelineEnd]))
+    matrixPlugs = [setup["locator"] + ".worldMatrix[0]" for setup, plugs in solvedSetups] + [setup["originalControl"] + ".parentMatrix[0]" for setup, plugs in solvedSetups]
+    matrixPlugs += [offsetPlug for offsetPlug in offsetPlugs if offsetPlug != None]
+    samples = sampleMatrices(matrixPlugs, frames)
+    offsetIndex = 2 * len(solvedSetups)
+    for index, offsetPlug in enumerate(offsetPlugs):
+        if offsetPlug != None:
+            matrixMath.premultiplySamples(samples, offsetIndex, len(solvedSetups) + index, len(matrixPlugs), range(len(frames)))
+            offsetIndex += 1
+
+    toCentimeters = om.MDistance(1.0, om.MDistance.uiUnit()).asCentimeters()
+    toRadians = om.MAngle(1.0, om.MAngle.uiUnit()).asRadians()
+    for index, (setup, plugs) in enumerate(solvedSetups):
+        control = setup["originalControl"]
+        rotatePivot = [value * toCentimeters for value in cmds.getAttr(control + ".rotatePivot")[0]]
+        rotatePivotTranslate = [value * toCentimeters for value in cmds.getAttr(control + ".rotatePivotTranslate")[0]]
+        jointOrient = None
+        if cmds.objectType(control, isAType="joint"):
+            jointOrient = [value * toRadians for value in cmds.getAttr(control + ".jointOrient")[0]]
+
+        translate, rotate = matrixMath.getConstrainedChannels(samples, index, len(solvedSetups) + index, len(matrixPlugs), range(len(frames)), nodeInfo.getRotateOrder(control),
+                                                              rotatePivot, rotatePivotTranslate, jointOrient)
+        channels = {"translate": [[value / toCentimeters for value in values] for values in translate], "rotate": [[value / toRadians for value in values] for values in rotate]}
+        for plug in plugs:
+            attribute = plug.split(".")[-1]
+            writeKeys(plug, frames, channels[attribute[:-1]]["XYZ".index(attribute[-1])])
+    return unsolvedSetups
+
+
+@ProfiledStage("bakeDown")
+def bakeDownSetups(bakeGroup, timelineStart, timelineEnd, bakeInterval, smartBake, smartBakeTolerance, nodeInfo=None):
+    #BAKES WHAT A GROUP OF SETUPS DOES BACK ONTO THEIR ORIGINAL CONTROLS OVER ONE RANGE, WHILE THE SETUPS ARE STILL ACTIVE. THE GROUP HOLDS THE "setups", AND THE "controls" AND "plugs" THEY BAKE ONTO
+    #ONLY THE CONTROLS THAT CAN'T BE SOLVED STRAIGHT FROM THE LOCATOR CURVES GET A REAL BAKE, IN A SINGLE CALL
+    #THE SMART BAKE NEEDS EVERY FRAME TO REDUCE FROM
+    if smartBake == True:
+        bakeInterval = 1
+    nodeInfo = getNodeInfo(nodeInfo)
+    unsolvedSetups = bakeDownAnalytically(bakeGroup["setups"], timelineStart, timelineEnd, bakeInterval, nodeInfo)
+    if len(unsolvedSetups) != 0:
+        plugs = [plug for setup in unsolvedSetups for plug in getBakePlugs(setup["originalControl"], getConstraintAttribute(setup["constraint"]))]
+        cmds.currentTime(timelineStart)
+        cmds.select([setup["originalControl"] for setup in unsolvedSetups])
+        cmds.bakeResults(plugs, t = (timelineStart, timelineEnd), sampleBy = bakeInterval, pok=True,simulation=False)
+
+    #THE EULER FILTER ONLY TOUCHES THE BAKED RANGE, AND RUNS BEFORE THE KEY REDUCTION SO THE REDUCTION NEVER SEES A FLIP
+    filterEulerRange(bakeGroup["controls"], timelineStart, timelineEnd, nodeInfo)
+    if smartBake == True:
+        reduceKeys(bakeGroup["plugs"], timelineStart, timelineEnd, smartBakeTolerance)
+
+
+def getUpstreamCurves(nodes, exclude=()):
+    #COLLECTS EVERY ANIM CURVE THAT ENDS UP MOVING THE NODES IN WORLD-SPACE - THEIR OWN CURVES, THEIR PARENTS' CURVES, AND WHATEVER DRIVES THEM THROUGH CONSTRAINTS AND PAIRBLENDS
+    #IF ANYTHING ELSE UPSTREAM DEPENDS ON TIME (EXPRESSIONS, MOTION PATHS, SIMULATIONS), THE KEYS DON'T TELL THE WHOLE STORY, SO WE RETURN NONE. TRANSFORMS IN exclude ARE NEVER WALKED INTO
+    #ls() WITH AN EMPTY LIST RETURNS EVERY NODE IN THE SCENE, SO AN EMPTY exclude HAS TO STAY EMPTY
+    visited = set(cmds.ls(exclude, long=True)) if len(exclude) != 0 else set()
+    pending = cmds.ls(nodes, long=True)
+    curves = set()
+    while len(pending) != 0:
+        node = pending.pop()
+        if node in visited:
+            continue
+        #A TRANSFORM MOVES WITH EVERY ONE OF ITS PARENTS, SO THEIR HISTORY COUNTS AS WELL
+        path = node.split("|")
+        ancestors = ["|".join(path[:depth]) for depth in range(2, len(path) + 1)]
+        visited.update(ancestors)
+        history = cmds.listHistory(ancestors) or []
+        if len(cmds.ls(history, type="time")) != 0:
+            return None
+        curves.update(cmds.ls(history, type=["animCurveTL", "animCurveTA", "animCurveTU", "animCurveTT"]))
+        pending += [transform for transform in cmds.ls(history, type="transform", long=True) if transform not in visited]
+    return curves
+
+
+@ProfiledStage("upstreamKeys")
+def getUpstreamKeyTimes(control, timelineStart, timelineEnd):
+    #COLLECTS THE KEY TIMES OF EVERY ANIM CURVE UPSTREAM OF THE CONTROL. RETURNS NONE WHEN THE CONTROL HAS TO BE SAMPLED ON EVERY FRAME
+    curves = getUpstreamCurves(control)
+    if curves == None:
+        return None
+
+    keyTimes = set()
+    if len(curves) != 0:
+        keyTimes.update(cmds.keyframe(list(curves), q=True, tc=True, t=(timelineStart, timelineEnd)) or [])
+    return keyTimes
+
+
+def getCurveSignature(curve):
+    #SUMMARISES AN ANIM CURVE AS [INFINITY HASH, [[KEY TIME, KEY HASH], ...]]. EVERY KEY HASH COVERS ITS VALUE AND BOTH TANGENTS, SO AN EDIT ONLY SHOWS UP ON THE KEYS IT TOUCHED
+    selectionList = om.MSelectionList()
+    selectionList.add(curve)
+    curveFn = oma.MFnAnimCurve(selectionList.getDependNode(0))
+    timeUnit = om.MTime.uiUnit()
+    keys = []
+    for index in range(curveFn.numKeys):
+        key = (curveFn.value(index), curveFn.inTangentType(index), curveFn.outTangentType(index), tuple(curveFn.getTangentXY(index, True)), tuple(curveFn.getTangentXY(index, False)))
+        keys.append([curveFn.input(index).asUnits(timeUnit), zlib.crc32(repr(key).encode())])
+    return [zlib.crc32(repr((curveFn.preInfinityType, curveFn.postInfinityType, curveFn.isWeighted)).encode()), keys]
+
+
+def getSourceSignatures(control, locator):
+    #SIGNS EVERY CURVE THE LOCATOR'S BAKE CAME FROM - THE CONTROL'S OWN CHANNELS (BEHIND THE PAIRBLEND IF THERE IS ONE) AND EVERYTHING UPSTREAM OF ITS PARENTS
+    #THE CONTROL ITSELF ISN'T WALKED, BECAUSE ONCE THE SETUP IS APPLIED THE LOCATOR IS UPSTREAM OF IT. RETURNS NONE IF THE BAKE CAN'T BE TOLD FROM CURVES ALONE
+    curves = set()
+    parents = cmds.listRelatives(control, parent=True, fullPath=True)
+    if parents != None:
+        curves = getUpstreamCurves(parents, [locator])
+        if curves == None:
+            return None
+    for plug in getBakePlugs(control, ["translate", "rotate"]):
+        curveFn = getAnimCurve(plug)
+        if curveFn != None:
+            curves.add(curveFn.name())
+    return dict([(curve, getCurveSignature(curve)) for curve in curves])
+
+
+def storeSource(locator, timelineStart, timelineEnd, bakeInterval, signatures):
+    #KEEPS THE BAKE RANGE AND THE CURVE SIGNATURES ON THE LOCATOR, SO A REFRESH CAN TELL WHAT CHANGED SINCE
+    if not cmds.attributeQuery("worldSpaceSource", node=locator, exists=True):
+        locked = cmds.lockNode(locator, q=True, l=True)[0]
+        if locked:
+            cmds.lockNode(locator, l=False)
+        cmds.addAttr(locator, ln="worldSpaceSource", dt="string")
+        if locked:
+            cmds.lockNode(locator, l=True)
+    source = {"start": timelineStart, "end": timelineEnd, "interval": max(bakeInterval, 1), "curves": signatures}
+    cmds.setAttr(locator + ".worldSpaceSource", json.dumps(source), type="string")
+
+
+def readSource(locator):
+    #RETURNS WHAT storeSource() KEPT, OR NONE FOR LOCATORS BAKED BEFORE THE SIGNATURES EXISTED
+    if not cmds.attributeQuery("worldSpaceSource", node=locator, exists=True):
+        return None
+    source = cmds.getAttr(locator + ".worldSpaceSource")
+    if not source:
+        return None
+    return json.loads(source)
+
+
+def getChangedRanges(oldSignatures, newSignatures, timelineStart, timelineEnd):
+    #COMPARES TWO SETS OF CURVE SIGNATURES AND RETURNS THE FRAME RANGES, INSIDE START - END, WHERE THE CURVES CAN NOW EVALUATE DIFFERENTLY
+    #AN EDITED KEY ALSO CHANGES THE AUTO TANGENTS OF ITS NEIGHBOURS, SO EVERY CHANGE REACHES TWO KEYS OUT ON EACH SIDE. NEW, DELETED OR UNKNOWN CURVES INVALIDATE THE WHOLE RANGE
+    if oldSignatures == None or newSignatures == None or set(oldSignatures) != set(newSignatures):
+        return [(timelineStart, timelineEnd)]
+    ranges = []
+    for curve, (newInfinity, newKeys) in newSignatures.items():
+        oldInfinity, oldKeys = oldSignatures[curve]
+        if oldInfinity != newInfinity:
+            return [(timelineStart, timelineEnd)]
+        oldHashes = dict([(time, keyHash) for time, keyHash in oldKeys])
+        newHashes = dict([(time, keyHash) for time, keyHash in newKeys])
+        changedTimes = [time for time in set(oldHashes) | set(newHashes) if oldHashes.get(time) != newHashes.get(time)]
+        for keys in [oldKeys, newKeys]:
+            times = [time for time, keyHash in keys]
+            for time in changedTimes:
+                position = bisect.bisect_left(times, time)
+                rangeStart = times[position - 2] if position >= 2 else timelineStart
+                rangeEnd = times[position + 2] if position + 2 < len(times) else timelineEnd
+                if rangeEnd >= timelineStart and rangeStart <= timelineEnd:
+                    ranges.append((max(rangeStart, timelineStart), min(rangeEnd, timelineEnd)))
+
+    #OVERLAPPING AND TOUCHING RANGES ARE MERGED, SO EVERY FRAME GETS SAMPLED ONCE
+    merged = []
+    for rangeStart, rangeEnd in sorted(ranges):
+        if len(merged) != 0 and rangeStart <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], rangeEnd)
+        else:
+            merged.append([rangeStart, rangeEnd])
+    return [(rangeStart, rangeEnd) for rangeStart, rangeEnd in merged]
+
+
+@ProfiledStage("resample")
+def resampleLocator(record, source, ranges):
+    #SAMPLES THE ORIGINAL CONTROL'S WORLD-SPACE AGAIN ON THE FRAMES INSIDE THE RANGES, AND REPLACES ONLY THOSE KEYS ON THE LOCATOR
+    #THE LOCATOR DRIVES THE CONTROL BY NOW, SO THE CONTROL'S PIVOT IS REBUILT FROM ITS OWN CURVES, ITS offsetParentMatrix AND ITS PARENT MATRIX INSTEAD OF BEING READ BACK
+    control = record["control"]
+    locator = record["locator"]
+    runs = [sorted(set(range(int(rangeStart), int(rangeEnd) + 1)) & set(range(int(source["start"]), int(source["end"]) + 1, source["interval"])) | set([rangeStart, rangeEnd])) for rangeStart, rangeEnd in ranges]
+    frames = [frame for run in runs for frame in run]
+    matrixPlugs = [control + ".parentMatrix[0]"]
+    offsetPlug = getOffsetParentPlug(control, locator, record["driver"])
+    if offsetPlug != None:
+        matrixPlugs.append(offsetPlug)
+    samples = sampleMatrices(matrixPlugs, frames)
+    if offsetPlug != None:
+        matrixMath.premultiplySamples(samples, 1, 0, len(matrixPlugs), range(len(frames)))
+
+    timeUnit = om.MTime.uiUnit()
+    toCentimeters = om.MDistance(1.0, om.MDistance.uiUnit()).asCentimeters()
+    toRadians = om.MAngle(1.0, om.MAngle.uiUnit()).asRadians()
+    channels = {}
+    for plug in getBakePlugs(control, ["translate", "rotate"]):
+        curveFn = getAnimCurve(plug)
+        if curveFn == None:
+            scale = toRadians if "rotate" in plug else toCentimeters
+            channels[plug.split(".")[-1]] = [cmds.getAttr(plug) * scale] * len(frames)
+        else:
+            channels[plug.split(".")[-1]] = [curveFn.evaluate(om.MTime(frame, timeUnit)) for frame in frames]
+    rotatePivot = [value * toCentimeters for value in cmds.getAttr(control + ".rotatePivot")[0]]
+    rotatePivotTranslate = [value * toCentimeters for value in cmds.getAttr(control + ".rotatePivotTranslate")[0]]
+    jointOrient = None
+    if cmds.objectType(control, isAType="joint"):
+        jointOrient = [value * toRadians for value in cmds.getAttr(control + ".jointOrient")[0]]
+
+    nodeInfo = getNodeInfo()
+    rotateOrder = nodeInfo.getRotateOrder(control)
+    pivotMatrices = []
+    for frameIndex in range(len(frames)):
+        translate = [channels["translate" + axis][frameIndex] for axis in ["X", "Y", "Z"]]
+        rotate = [channels["rotate" + axis][frameIndex] for axis in ["X", "Y", "Z"]]
+        local = matrixMath.composePivotMatrix(translate, rotate, rotateOrder, rotatePivot, rotatePivotTranslate, jointOrient)
+        parentOffset = frameIndex * len(matrixPlugs) * 16
+        pivotMatrices += matrixMath.multiplyMatrices(local, list(samples[parentOffset:parentOffset + 16]))
+
+    #ONLY THE CHANNELS THE CONSTRAINT DROVE WHEN THE LOCATOR WAS BAKED ARE WRITTEN AGAIN, THE AXES IT SKIPPED BECAUSE THEY'RE LOCKED ON THE CONTROL KEEP THEIR ONE KEY
+    lockedAttributes = nodeInfo.getLockedAttributes(control) | nodeInfo.getLockedAttributes(locator)
+    plugs = [plug for plug in getBakePlugs(locator, getConstraintAttribute(record["constraintType"])) if plug.split(".")[-1] not in lockedAttributes]
+
+    #EVERY RUN IS WRITTEN ON ITS OWN, BECAUSE WRITING KEYS CLEARS WHATEVER WAS BETWEEN THE FIRST AND LAST NEW KEY
+    offset = 0
+    for run in runs:
+        channels = decomposeWorldMatrices(pivotMatrices, 0, 1, range(offset, offset + len(run)), nodeInfo.getRotateOrder(locator))
+        for plug in plugs:
+            attribute = plug.split(".")[-1]
+            writeKeys(plug, run, channels[attribute[:-1]]["XYZ".index(attribute[-1])])
+        offset += len(run)
+    return len(frames)
+
+
+@ProfiledStage("eulerFilter")
+def filterEulerRange(controls, timelineStart, timelineEnd, nodeInfo=None):
+    #EULER FILTER THAT ONLY LOOKS AT THE ROTATE KEYS INSIDE [START - 1, END + 1], SO ITS COST DOESN'T GROW WITH THE LENGTH OF THE WHOLE ANIMATION AND THE REST OF THE CURVE IS LEFT ALONE
+    #THE ROTATE KEYS OF EVERY CONTROL ARE READ IN ONE SNAPSHOT AND FILTERED IN ONE CALL. EVERY CHANNEL THAT FLIPPED IS WRITTEN IN ONE CALL, FROM ITS FIRST FLIPPED KEY TO ITS LAST, SO THE KEYS AROUND THEM KEEP THEIR TANGENTS
+    nodeInfo = getNodeInfo(nodeInfo)
+    controlPlugs = [["{0}.rotate{1}".format(control, axis) for axis in ["X", "Y", "Z"]] for control in controls]
+    snapshot = CurveSnapshot([plug for plugs in controlPlugs for plug in plugs], timelineStart - 1, timelineEnd + 1).capture()
+    channels = [([list(snapshot.getTimes(plug)) for plug in plugs], [list(snapshot.getValues(plug)) for plug in plugs]) for plugs in controlPlugs]
+    filtered = matrixMath.filterEulerChannels(channels, [nodeInfo.getRotateOrder(control) for control in controls])
+
+    angleScale = om.MAngle(1.0, om.MAngle.uiUnit()).asRadians()
+    for plugs, (times, values), filteredChannels in zip(controlPlugs, channels, filtered):
+        for plug, channelTimes, channelValues, filteredValues in zip(plugs, times, values, filteredChannels):
+            flipped = [index for index, (value, filteredValue) in enumerate(zip(channelValues, filteredValues)) if abs(filteredValue - value) > 1e-9]
+            if len(flipped) != 0:
+                writeKeys(plug, channelTimes[flipped[0]:flipped[-1] + 1], [value / angleScale for value in filteredValues[flipped[0]:flipped[-1] + 1]])
+
+
+def getBakePlugs(originalControl, bakeAttribute):
+    #TURNS THE BAKE ATTRIBUTE(S) INTO A LIST OF INDIVIDUAL CHANNELS ON THE CONTROL, SO MANY CONTROLS CAN BE BAKED IN THE SAME CALL
+    if not isinstance(bakeAttribute, list):
+        bakeAttribute = [bakeAttribute]
+    return ["{0}.{1}{2}".format(originalControl, attr, curve) for curve in ["X", "Y", "Z"] for attr in bakeAttribute]
+
+
+@ProfiledStage("keyReduction")
+def reduceKeys(plugs, timelineStart, timelineEnd, smartBakeTolerance):
+    #THINS OUT THE KEYS A DENSE BAKE LEFT ON THE CHANNELS. THE ENGINE ADDS KEYS WHERE THE ERROR IS THE LARGEST UNTIL THE CURVE NEVER GOES FURTHER THAN THE TOLERANCE FROM THE BAKED VALUES
+    #THE ERROR IS MEASURED WITH THE ENGINE'S OWN SLOPES, SO THEY'RE WRITTEN ONTO THE KEPT KEYS AS FIXED TANGENTS AND MAYA EVALUATES THE SAME CURVE THE ENGINE CHECKED
+    #THE TOLERANCE IS IN THE SCENE'S UI UNITS - ITS LINEAR UNIT FOR TRANSLATE AND ITS ANGULAR UNIT (DEGREES UNLESS IT'S BEEN CHANGED) FOR ROTATE. ALL THE CHANNELS ARE WORKED OUT FROM A SINGLE SNAPSHOT, IN ONE CALL TO THE REDUCTION ENGINE
+    #THE SNAPSHOT HOLDS THE VALUES IN INTERNAL UNITS (CENTIMETERS AND RADIANS), SO THE TOLERANCE IS CONVERTED TO THE SAME UNITS FIRST
+    snapshot = CurveSnapshot(plugs, timelineStart, timelineEnd).capture()
+    channels = [(snapshot.getTimes(plug), snapshot.getValues(plug)) for plug in plugs]
+    linearTolerance = om.MDistance.uiToInternal(smartBakeTolerance)
+    angularTolerance = om.MAngle.uiToInternal(smartBakeTolerance)
+    tolerances = [angularTolerance if snapshot.isAngular(plug) else linearTolerance for plug in plugs]
+    keptKeys = keyReduction.reduceChannels(channels, tolerances)
+
+    #EVERYTHING THE ENGINE DIDN'T KEEP GETS CUT. KEYS THAT SIT NEXT TO EACH OTHER ARE GROUPED INTO RUNS SO EACH CHANNEL ONLY TAKES ONE COMMAND
+    for plug, (times, values), (keys, slopes) in zip(plugs, channels, keptKeys):
+        keptIndexes = set(keys)
+        runs = getFrameRuns([index for index in range(len(times)) if index not in keptIndexes])
+        if len(runs) != 0:
+            cmds.cutKey(plug, t=[(times[start], times[end]) for start, end in runs], clear=True)
+        setFixedTangents(plug, [times[key] for key in keys], slopes)
+
+
+def setFixedTangents(plug, times, slopes):
+    #SETS THE SLOPES THE KEY REDUCTION WORKED OUT ON THE KEYS IT KEPT, IN ONE UNDO STEP. THE SLOPES ARE IN INTERNAL UNITS PER FRAME, A TANGENT IS WRITTEN IN SECONDS AND INTERNAL UNITS
+    #EVERY TANGENT IS A THIRD OF ITS SEGMENT LONG, SO A WEIGHTED CURVE TAKES THE SAME SHAPE AS A NON-WEIGHTED ONE. THE IN-TANGENT OF THE FIRST KEY AND THE OUT-TANGENT OF THE LAST ONE
+    #SHAPE THE CURVE OUTSIDE THE RANGE, SO THEY STAY AUTO
+    curveFn = getAnimCurve(plug)
+    if curveFn == None or len(times) < 2:
+        return
+    timeUnit = om.MTime.uiUnit()
+    secondsPerFrame = om.MTime(1.0, timeUnit).asUnits(om.MTime.kSeconds)
+    change = oma.MAnimCurveChange()
+    for position, (time, slope) in enumerate(zip(times, slopes)):
+        index = curveFn.find(om.MTime(time, timeUnit))
+        if position == 0 or position == len(times) - 1:
+            curveFn.setTangentsLocked(index, False, change)
+        if position == 0:
+            curveFn.setInTangentType(index, oma.MFnAnimCurve.kTangentAuto, change)
+        else:
+            length = (time - times[position - 1]) / 3.0
+            curveFn.setInTangentType(index, oma.MFnAnimCurve.kTangentFixed, change)
+            curveFn.setTangent(index, length * secondsPerFrame, length * slope, True, change, False)
+        if position == len(times) - 1:
+            curveFn.setOutTangentType(index, oma.MFnAnimCurve.kTangentAuto, change)
+        else:
+            length = (times[position + 1] - time) / 3.0
+            curveFn.setOutTangentType(index, oma.MFnAnimCurve.kTangentFixed, change)
+            curveFn.setTangent(index, length * secondsPerFrame, length * slope, False, change, False)
+    apiUndo.commit(change.undoIt, change.redoIt)
+
+
+def getFrameRuns(frames):
+    #GROUPS A SORTED LIST OF WHOLE NUMBERS (FRAMES OR KEY INDEXES) INTO CONTIGUOUS (START, END) RUNS - [1,2,3,7,8] BECOMES [(1,3), (7,8)]
+    runs = []
+    for frame in frames:
+        if len(runs) != 0 and runs[-1][1] == frame - 1:
+            runs[-1][1] = frame
+        else:
+            runs.append([frame, frame])
+    return [(start, end) for start, end in runs]
+                
+
+def getAnimCurve(plug):
+    #RETURNS THE API FUNCTION SET FOR THE ANIM CURVE THAT HOLDS A CHANNEL'S KEYS, OR NONE IF THE CHANNEL ISN'T KEYED
+    #WHEN A CONSTRAINT HAS PUT A PAIRBLEND IN BETWEEN, THE KEYS LIVE ON THE CURVE CONNECTED TO THE PAIRBLEND'S FIRST INPUT
+    pairBlends = cmds.listConnections(plug, s=True, d=False, type="pairBlend")
+    if pairBlends != None:
+        attribute = plug.split(".")[-1]
+        plug = "{0}.in{1}{2}1".format(pairBlends[0], attribute[0].upper(), attribute[1:])
+    selectionList = om.MSelectionList()
+    selectionList.add(plug)
+    curves = oma.MAnimUtil.findAnimation(selectionList.getPlug(0))
+    if len(curves) == 0:
+        return None
+    return oma.MFnAnimCurve(curves[0])
+
+
+@ProfiledStage("writeKeys")
+def writeKeys(plug, times, values):
+    #WRITES A WHOLE CHANNEL IN ONE CALL, AND CREATES ITS ANIM CURVE IF IT ISN'T KEYED YET. THE VALUES ARE IN UI UNITS, SO ROTATION COMES IN AS DEGREES
+    #A NEW CURVE IS MADE WITH A REGULAR KEY, SO ITS CREATION GOES ON THE UNDO QUEUE LIKE EVERYTHING ELSE. THE KEY ITSELF GETS REPLACED RIGHT AFTER
+    curveFn = getAnimCurve(plug)
+    if curveFn == None:
+        cmds.setKeyframe(plug, t=times[0])
+        curveFn = getAnimCurve(plug)
+    if curveFn.animCurveType in [oma.MFnAnimCurve.kAnimCurveTA, oma.MFnAnimCurve.kAnimCurveUA]:
+        angleScale = om.MAngle(1.0, om.MAngle.uiUnit()).asRadians()
+        values = [value * angleScale for value in values]
+    elif curveFn.animCurveType in [oma.MFnAnimCurve.kAnimCurveTL, oma.MFnAnimCurve.kAnimCurveUL]:
+        distanceScale = om.MDistance(1.0, om.MDistance.uiUnit()).asCentimeters()
+        values = [value * distanceScale for value in values]
+
+    timeUnit = om.MTime.uiUnit()
+    change = oma.MAnimCurveChange()
+    curveFn.addKeys(om.MTimeArray([om.MTime(time, timeUnit) for time in times]), om.MDoubleArray(values), oma.MFnAnimCurve.kTangentAuto, oma.MFnAnimCurve.kTangentAuto, False, change)
+    apiUndo.commit(change.undoIt, change.redoIt)
+
+
+class CurveSnapshot(object):
+    #AN IN-MEMORY COPY OF THE KEYS THAT A SET OF CHANNELS HAS INSIDE A FRAME RANGE. TIMES AND VALUES ARE STORED IN FLAT ARRAYS OF DOUBLES, ONE SET PER CHANNEL
+    #EVERYTHING IS READ THROUGH THE API, SO TAKING A SNAPSHOT NEVER GOES THROUGH THE UNDO QUEUE
+    def __init__(self, plugs, timelineStart, timelineEnd):
+        self.plugs = list(plugs)
+        self.timelineStart = timelineStart
+        self.timelineEnd = timelineEnd
+        self.channels = {}
+
+    def getKeyIndexes(self, curveFn):
+        #THE KEYS ARE SORTED BY TIME, SO THE FIRST ONE IN THE RANGE IS FOUND WITH A BINARY SEARCH AND ONLY THE KEYS INSIDE THE RANGE ARE READ
+        timeUnit = om.MTime.uiUnit()
+        low, high = 0, curveFn.numKeys
+        while low < high:
+            middle = (low + high) // 2
+            if curveFn.input(middle).asUnits(timeUnit) < self.timelineStart:
+                low = middle + 1
+            else:
+                high = middle
+        indexes = []
+        while low < curveFn.numKeys and curveFn.input(low).asUnits(timeUnit) <= self.timelineEnd:
+            indexes.append(low)
+            low += 1
+        return indexes
+
+    def capture(self):
+        timeUnit = om.MTime.uiUnit()
+        for plug in self.plugs:
+            curveFn = getAnimCurve(plug)
+            if curveFn == None:
+                self.channels[plug] = None
+                continue
+            channel = {"times": array("d"), "values": array("d"), "angular": curveFn.animCurveType in [oma.MFnAnimCurve.kAnimCurveTA, oma.MFnAnimCurve.kAnimCurveUA],
+                       "linear": curveFn.animCurveType in [oma.MFnAnimCurve.kAnimCurveTL, oma.MFnAnimCurve.kAnimCurveUL]}
+            for index in self.getKeyIndexes(curveFn):
+                channel["times"].append(curveFn.input(index).asUnits(timeUnit))
+                channel["values"].append(curveFn.value(index))
+            self.channels[plug] = channel
+        return self
+
+    def getTimes(self, plug):
+        channel = self.channels.get(plug)
+        if channel == None:
+            return array("d")
+        return channel["times"]
+
+    def isAngular(self, plug):
+        return self.channels.get(plug) != None and self.channels[plug]["angular"]
+
+    def getValues(self, plug):
+        channel = self.channels.get(plug)
+        if channel == None:
+            return array("d")
+        return channel["values"]
+
+    def getUiValues(self, plug):
+        #THE VALUES IN UI UNITS, THE WAY writeKeys() TAKES THEM
+        channel = self.channels.get(plug)
+        if channel == None:
+            return []
+        if channel["angular"]:
+            scale = om.MAngle(1.0, om.MAngle.uiUnit()).asRadians()
+        elif channel["linear"]:
+            scale = om.MDistance(1.0, om.MDistance.uiUnit()).asCentimeters()
+        else:
+            scale = 1.0
+        return [value / scale for value in channel["values"]]
+
+
+def createControl(name):
+    #CREATES THE SHAPE OF THE CONTROL
+    tempControl = cmds.curve(n=name, degree=1, point=[[-1, 0, -0], [1, 0, 0], [0,0,0], [0,0,-1], [0, 0, 1], [0,0,0], [0,-1,0], [0,1,0]])
+
+    cmds.setAttr(tempControl + ".lineWidth", 3)
+    cmds.setAttr(tempControl + ".overrideEnabled", 1)
+    cmds.setAttr(tempControl + ".overrideColor", 6)
+    return tempControl
+            
+@ProfiledStage("matchScale")
+def matchScale(parent, children, scale=True, nodeInfo=None):
+    #SCALE UP AN OBJECT TO ANOTHER ONE'S BOUNDING BOX SCALE, INCASE IT'S BEEN FREEZE-TRANSFORMED. THIS WAY THE USER DOESN'T HAVE TO MANUALLY ADJUST THE SIZE
+    #THE CHILDREN ARE NEW LOCATORS THAT HAVE JUST BEEN MOVED, SO ONLY THE PARENT'S BOUNDING BOX IS CACHED
+    nodeInfo = getNodeInfo(nodeInfo)
+    children = cmds.ls(children, flatten=True)
+    parentShapeNode = nodeInfo.getShapes(parent)[0]
+    
+    xMin, yMin, zMin, xMax, yMax, zMax = nodeInfo.getBoundingBox(parentShapeNode)
+    parentDistanceX, parentDistanceY, parentDistanceZ = [xMax-xMin, yMax-yMin, zMax-zMin]
+        
+    #result=[]
+    for child in children:
+        xMin, yMin, zMin, xMax, yMax, zMax = cmds.exactWorldBoundingBox(child)
+        childDistanceX, childDistanceY, childDistanceZ = [xMax-xMin, yMax-yMin, zMax-zMin]
+        
+        #WE QUERY THE ORIGINAL SCALE OF THE LOCATOR 
+        originalX, originalY, originalZ = cmds.xform(child, q=True, s=True, r=True)
+        
+        
+        divisionX, divisionY, divisionZ = [parentDistanceX/childDistanceX, parentDistanceY/childDistanceY, parentDistanceZ/childDistanceZ]
+        
+        #WE GET THE FINAL SCALE HERE, WE TAKE THE LONGEST NUMBER AND APPLY THAT TO ALL SCALE AXIS
+        largestAxis = max([originalX*divisionX, originalY*divisionY, originalZ*divisionZ]) * 2
+        newScale = [largestAxis, largestAxis, largestAxis]
+        
+        #this part is for return the information outside the function
+        #[result.append(i) for i in newScale]
+
+        if scale:
+            cmds.xform(child, scale=newScale)
+        
+
+def add(a,b):
+    result = a + b
+    return result
+def subtract(a,b):
+    result = a - b
+    return result   
+ 
+class IntervalIndex(object):
+    #A SORTED LIST OF THE FRAME RANGES THAT ARE SWITCHED ON A CURVE (START AND END INCLUDED). RANGES THAT TOUCH EACH OTHER ARE MERGED INTO ONE BLOCK, THE SAME WAY THEIR SWITCH KEYS ARE MERGED ON THE CURVE
+    #EVERY QUERY IS A BINARY SEARCH, SO IT STAYS FAST EVEN WITH DOZENS OF PARTIAL-RANGE LOCATORS ON THE SAME CONTROL
+    def __init__(self, ranges=()):
+        self.starts = []
+        self.ends = []
+        for start, end in ranges:
+            self.add(start, end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def getRanges(self):
+        return list(zip(self.starts, self.ends))
+
+    def find(self, frame):
+        #RETURNS THE POSITION OF THE BLOCK THAT CONTAINS THE FRAME, OR NONE IF NO BLOCK DOES
+        i = bisect.bisect_right(self.starts, frame) - 1
+        if i >= 0 and frame <= self.ends[i]:
+            return i
+        return None
+
+    def getBlock(self, frame):
+        i = self.find(frame)
+        if i == None:
+            return None
+        return self.starts[i], self.ends[i]
+
+    def overlaps(self, start, end):
+        i = bisect.bisect_left(self.ends, start)
+        return i < len(self.ends) and self.starts[i] <= end
+
+    def endsAt(self, frame):
+        i = bisect.bisect_left(self.ends, frame)
+        return i < len(self.ends) and self.ends[i] == frame
+
+    def startsAt(self, frame):
+        i = bisect.bisect_left(self.starts, frame)
+        return i < len(self.starts) and self.starts[i] == frame
+
+    def add(self, start, end):
+        #INSERTS A RANGE, AND MERGES IT WITH THE BLOCKS RIGHT BEFORE AND AFTER IT IF THEY'RE TOUCHING
+        if self.overlaps(start, end):
+            raise ValueError("Range {0}-{1} overlaps an existing range".format(start, end))
+        i = bisect.bisect_left(self.starts, start)
+        if i > 0 and self.ends[i - 1] == start - 1:
+            i -= 1
+            start = self.starts.pop(i)
+            self.ends.pop(i)
+        if i < len(self.starts) and self.starts[i] == end + 1:
+            self.starts.pop(i)
+            end = self.ends.pop(i)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
+    def remove(self, start, end):
+        #CUTS A RANGE OUT OF THE BLOCK THAT CONTAINS IT. IF THE RANGE WAS IN THE MIDDLE OF THE BLOCK, THE BLOCK GETS SPLIT IN TWO
+        i = self.find(start)
+        if i == None or self.ends[i] < end:
+            raise ValueError("Range {0}-{1} isn't part of a single block".format(start, end))
+        blockStart = self.starts.pop(i)
+        blockEnd = self.ends.pop(i)
+        if end < blockEnd:
+            self.starts.insert(i, end + 1)
+            self.ends.insert(i, blockEnd)
+        if blockStart < start:
+            self.starts.insert(i, blockStart)
+            self.ends.insert(i, start - 1)
+
+
+def readInfluenceIndex(curve, storedFrameValue):
+    #BUILDS THE INDEX OF A CURVE FROM ITS KEYS. WE CHECK TO SEE WHAT EXISTING KEYFRAMES HAVE THE VALUE OF 0 OR 1 (DEPENDING ON IF YOU'VE CHOSEN THE VISIBILITY OR BLEND INDEX CURVES), AND PAIR THEM UP START - END
+    #ALL THE KEY TIMES AND VALUES COME BACK FROM A SINGLE QUERY AS [TIME, VALUE, TIME, VALUE...], SO THE FILTERING HAPPENS HERE INSTEAD OF ASKING MAYA ONCE PER KEY
+    keyframes = cmds.keyframe(curve, q=True, tc=True, vc=True)
+    storedFrames = []
+    if keyframes != None:
+        storedFrames = [time for time, value in zip(keyframes[0::2], keyframes[1::2]) if value == storedFrameValue]
+    return IntervalIndex([(storedFrames[frame], storedFrames[frame + 1]) for frame in range(0, len(storedFrames) - 1, 2)])
+
+
+def divideInfluence(curve, timelineStart, timelineEnd, operator, value):
+    #USUALLY APPLIED ON AN EMPTY SPACE WHERE THE RANGE ISN'T TOUCHING ANY PRE-EXISTING RANGES, SO IT HANDLES BOTH SIDES - THE START AND END
+    cmds.setKeyframe(curve, t=(timelineStart, timelineEnd), value=value)    
+    cmds.setKeyframe(curve, t=(timelineStart-1, timelineEnd+1), value=operator(value,1))  
+
+def adjustInfluence(curve, frame, offset, operator, value):
+    #USUALLY USED WHEN THE RANGE WE'RE APPLYING IS RIGHT NEXT TO THE END OR START OF AN EXISTING RANGE, SO WE MERGE ONE PART, AND ONLY ADD KEYS ON THE OTHER PART. 
+    cmds.setKeyframe(curve, t=(frame), value=value)     
+    cmds.setKeyframe(curve, t=(frame + offset), value=operator(value,1))  
+
+
+
+@ProfiledStage("influenceSwitch")
+def applyInfluenceSwitch(curve, timelineStart, timelineEnd, operator, value, storedFrameValue):
+    #FUNCTION THAT HANDLES APPLYING A SWITCH ON THE CONSTRAINT INFLUENCE, AS WELL AS THE VISIBILITY   
+    index = setupRegistry.getInfluenceIndex(curve, storedFrameValue)
+
+    #IF OUR TIMELINE RANGE OVERSHADOWS A GIVEN PAIRING OR IS IN-BETWEEN IT, THE SCRIPT WILL ABORT AND THE LOCATOR WON'T BE ADDED
+    if index.overlaps(timelineStart, timelineEnd):
+        assistMessage("<hl>Error: This locator overlaps with another locator on the timeline. <hl>", 5000, True)
+
+    #CHECKS IF THE START OR THE END OF OUR RANGE IS TOUCHING AN EXISTING PAIRING
+    touchingStart = index.endsAt(timelineStart - 1)
+    touchingEnd = index.startsAt(timelineEnd + 1)
+
+    #IF NOTHING IS TOUCHING, OUR RANGE IS NOT INTERSECING WITH ANY EXISTING PAIRINGS AND CAN BE APPLIED NORMALLY
+    if not touchingStart and not touchingEnd:
+        divideInfluence(curve, timelineStart, timelineEnd, operator, value)
+    
+    #IF WE'RE TRYING TO FIT A TIMELINE RANGE INBETWEEN 2 OTHER RANGES, THIS CODE GETS EXECUTED 
+    elif touchingStart and touchingEnd:
+        cmds.cutKey(curve, t=(timelineStart, timelineStart - 1))
+        cmds.cutKey(curve, t=(timelineEnd, timelineEnd + 1))
+
+    #IF ONLY ONE SIDE IS TOUCHING, WE MERGE THE POINT THEY TOUCH AND EXTEND UP TOWARDS THE OTHER END
+    elif touchingStart:
+        cmds.cutKey(curve, t=(timelineStart - 1, timelineEnd))
+        adjustInfluence(curve, timelineEnd, 1, operator, value )
+    else:
+        cmds.cutKey(curve, t=(timelineStart, timelineEnd + 1))
+        adjustInfluence(curve, timelineStart, -1, operator, value )
+
+    index.add(timelineStart, timelineEnd)
+
+
+
+
+@ProfiledStage("removeInfluence")
+def removeInfluence(curve, timelineStart, timelineEnd, typeOfCurve):
+    #DELETES THE KEYFRAMES AT THE POINT WHERE THE INFLUENCE/VISIBILTIY SWITCHES AND REARRANGES THE KEYS
+    if typeOfCurve == "visibility":
+        index = setupRegistry.getInfluenceIndex(curve, 0)
+    else:
+        index = setupRegistry.getInfluenceIndex(curve, 1)
+
+    #THE BLOCK THAT HOLDS OUR RANGE TELLS US IF ANOTHER LOCATOR IS TOUCHING OUR TIMELINE'S START AND END - IF THE BLOCK REACHES PAST THEM, SOMETHING IS CONNECTED ON THAT SIDE
+    block = index.getBlock(timelineStart)
+    touchingStart = block != None and block[0] < timelineStart
+    touchingEnd = block != None and timelineEnd < block[1]
+    
+    #IF NOTHING IS TOUCHING, OUR TIMELINE RANGE IS STANDALONE SO WE SIMPLY JUST HAVE TO DELETE THE BEGINNING AND END, NO NEED TO REARRANGE 
+    if not touchingStart and not touchingEnd:
+        cmds.cutKey(curve, t=(timelineStart, timelineEnd))
+        cmds.cutKey(curve, t=(timelineStart - 1, timelineEnd + 1))
+        #IF THE CURVE IS THE VISIBILITY CURVE, AFTER DELETING THE KEYS WE SET THE VISIBILITY BACK TO 1
+        if typeOfCurve == "visibility":
+            cmds.setAttr(curve, 1)   
+
+    #IF BOTH THE TIMELINESTART AND END ARE TOUCHING OTHER PAIRINGS, IT MEANS OUR RANGE IS STUCK IN THE MIDDLE OF 2 LOCATORS
+    elif touchingStart and touchingEnd:
+        cmds.cutKey(curve, t=(timelineStart, timelineEnd))
+        cmds.cutKey(curve, t=(timelineStart - 1, timelineEnd + 1))
+        if typeOfCurve == "blend":
+            adjustInfluence(curve, timelineStart - 1, 1, subtract, 1 )
+            adjustInfluence(curve, timelineEnd, 1, add, 0 )
+        else:
+            adjustInfluence(curve, timelineStart - 1, 1, add, 0 )
+            adjustInfluence(curve, timelineEnd, 1, subtract, 1 )
+    
+    elif touchingStart:
+        cmds.cutKey(curve, t=(timelineEnd, timelineEnd + 1))
+        if typeOfCurve == "blend":
+            adjustInfluence(curve, timelineStart - 1, 1, subtract, 1 )
+        else:
+            adjustInfluence(curve, timelineStart - 1, 1, add, 0 )
+        
+    else:
+        cmds.cutKey(curve, t=(timelineStart, timelineStart - 1))
+        if typeOfCurve == "blend":
+            adjustInfluence(curve, timelineEnd + 1, -1, subtract, 1 )
+        else:
+            adjustInfluence(curve, timelineEnd + 1, -1, add, 0 )    
+
+    if block != None:
+        index.remove(timelineStart, timelineEnd)
+    
+
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+#SETUP REGISTRY
+REGISTRY_NODE = "Petar3D_worldSpaceRegistry"
+
+CONSTRAINT_TYPES = ["parent", "orient", "point"]
+SETUP_MODES = ["NIS", "IFS"]
+DRIVER_TYPES = ["constraint", "matrix"]
+
+def addSetupAttributes(locator, originalControl, constraintType, mode, timelineStart, timelineEnd, blendIndex=None, driver="constraint"):
+    #STORES EVERYTHING WE NEED TO KNOW ABOUT A SETUP AS TYPED ATTRIBUTES ON THE LOCATOR, SO NOTHING HAS TO BE PARSED BACK OUT OF ITS NAME
+    #THE ORIGINAL CONTROL IS STORED AS A MESSAGE CONNECTION, SO IT SURVIVES RENAMES AND NAMESPACES
+    cmds.addAttr(locator, ln="worldSpaceControl", at="message")
+    cmds.addAttr(locator, ln="worldSpaceConstraint", at="enum", en=":".join(CONSTRAINT_TYPES))
+    cmds.addAttr(locator, ln="worldSpaceMode", at="enum", en=":".join(SETUP_MODES))
+    cmds.addAttr(locator, ln="worldSpaceStart", at="long")
+    cmds.addAttr(locator, ln="worldSpaceEnd", at="long")
+    cmds.addAttr(locator, ln="worldSpaceBlendIndex", at="long", dv=-1)
+    cmds.addAttr(locator, ln="worldSpaceDriver", at="enum", en=":".join(DRIVER_TYPES))
+
+    cmds.connectAttr(originalControl + ".message", locator + ".worldSpaceControl")
+    cmds.setAttr(locator + ".worldSpaceConstraint", CONSTRAINT_TYPES.index(constraintType))
+    cmds.setAttr(locator + ".worldSpaceMode", SETUP_MODES.index(mode))
+    cmds.setAttr(locator + ".worldSpaceDriver", DRIVER_TYPES.index(driver))
+    if mode == "IFS":
+        cmds.setAttr(locator + ".worldSpaceStart", int(timelineStart))
+        cmds.setAttr(locator + ".worldSpaceEnd", int(timelineEnd))
+    if blendIndex != None:
+        cmds.setAttr(locator + ".worldSpaceBlendIndex", int(blendIndex))
+
+
+def readSetupAttributes(locator):
+    #READS THE SETUP ATTRIBUTES BACK INTO A RECORD. RETURNS NONE IF THE LOCATOR STILL USES THE OLD NAME-ONLY SCHEME
+    if not cmds.attributeQuery("worldSpaceMode", node=locator, exists=True):
+        return None
+    originalControl = cmds.listConnections(locator + ".worldSpaceControl", s=True, d=False)
+    if originalControl == None:
+        return None
+    record = {"locator": locator, "control": originalControl[0],
+              "constraintType": CONSTRAINT_TYPES[cmds.getAttr(locator + ".worldSpaceConstraint")],
+              "mode": SETUP_MODES[cmds.getAttr(locator + ".worldSpaceMode")], "start": None, "end": None, "blendIndex": None, "driver": "constraint"}
+    if record["mode"] == "IFS":
+        record["start"] = cmds.getAttr(locator + ".worldSpaceStart")
+        record["end"] = cmds.getAttr(locator + ".worldSpaceEnd")
+    blendIndex = cmds.getAttr(locator + ".worldSpaceBlendIndex")
+    if blendIndex >= 0:
+        record["blendIndex"] = str(blendIndex)
+    #LOCATORS MADE BEFORE THE LIVE DRIVER EXISTED ARE ALWAYS CONSTRAINT SETUPS
+    if cmds.attributeQuery("worldSpaceDriver", node=locator, exists=True):
+        record["driver"] = DRIVER_TYPES[cmds.getAttr(locator + ".worldSpaceDriver")]
+    return record
+
+
+def parseLegacyLocatorName(locator):
+    #RECOVERS THE ORIGINAL CONTROL, CONSTRAINT TYPE, MODE AND RANGE FROM THE NAME OF A LOCATOR MADE BEFORE THE SETUP ATTRIBUTES EXISTED
+    originalControl = locator.split("_Petar3D_")[:1][0]
+    if "IFS" in locator:
+        constraint = locator.split("_")[-4:-3][0]
+        return originalControl, constraint, "IFS", int(locator.split("_")[-2:-1][0]), int(locator.split("_")[-1:][0])
+    constraint = locator.split("_")[-2:-1][0]
+    return originalControl, constraint, "NIS", None, None
+
+
+def getLegacyBlendIndex(originalControl, locator, constraintType):
+    #IF THE RIG IS REFERENCED, THE CONSTRAINT DOESN'T HAVE THE NAMESPACE INSIDE ITS NAME
+    if cmds.referenceQuery(originalControl, isNodeReferenced=True) or ":" in originalControl:                                  
+        blendIndexControl = originalControl.split(":")[1]
+    else:
+        blendIndexControl = originalControl
+    return getBlendIndex(locator, blendIndexControl, constraintType)
+
+
+def upgradeLegacySetup(locator):
+    #CONVERTS A LOCATOR FROM THE OLD NAMING SCHEME, BY PARSING ITS NAME ONE LAST TIME AND STORING THE RESULT AS SETUP ATTRIBUTES
+    originalControl, constraintType, mode, timelineStart, timelineEnd = parseLegacyLocatorName(locator)
+    if not cmds.objExists(originalControl) or constraintType not in CONSTRAINT_TYPES:
+        return None
+    blendIndex = getLegacyBlendIndex(originalControl, locator, constraintType)
+
+    locked = cmds.lockNode(locator, q=True, l=True)[0]
+    if locked:
+        cmds.lockNode(locator, l=False)
+    addSetupAttributes(locator, originalControl, constraintType, mode, timelineStart, timelineEnd, blendIndex)
+    if locked:
+        cmds.lockNode(locator, l=True)
+    return readSetupAttributes(locator)
+
+
+def upgradeLegacySetups():
+    #UPGRADES EVERY OLD-STYLE LOCATOR IN THE SCENE IN ONE GO, THE REGISTRY ALSO DOES THIS ON ITS OWN WHEN IT COMES ACROSS ONE
+    setupRegistry.invalidate()
+    for locator in cmds.ls("*_Petar3D_worldSpaceLocator*", "*:*_Petar3D_worldSpaceLocator*", tr=True):
+        setupRegistry.getSetup(locator)
+
+
+class SetupRegistry(object):
+    #KEEPS TRACK OF EVERY WORLD-SPACE SETUP IN THE SCENE, SO WE NEVER HAVE TO SCAN ALL THE TRANSFORMS TO FIND THEM
+    #THE SCENE SIDE IS A NETWORK NODE WITH A MESSAGE CONNECTION TO EVERY TEMP LOCATOR, THE MEMORY SIDE IS A DICTIONARY THAT GETS REBUILT WHENEVER A CALLBACK TELLS US IT'S OUT OF DATE
+    #THE TOOL'S OWN OPERATIONS UPDATE THE DICTIONARY IN PLACE AS THEY CREATE AND DELETE LOCATORS, SO ONLY THE EDITS MADE OUTSIDE OF THEM COST A REBUILD
+    def __init__(self):
+        self.records = None
+        self.controls = None
+        self.influenceIndexes = {}
+        self.callbackIds = []
+
+    def getNode(self):
+        #CREATES THE NETWORK NODE THE FIRST TIME IT'S NEEDED, AND HOOKS UP ANY LOCATORS THAT WERE MADE BEFORE THE REGISTRY EXISTED
+        if cmds.objExists(REGISTRY_NODE):
+            return REGISTRY_NODE
+        node = cmds.createNode("network", n=REGISTRY_NODE, skipSelect=True)
+        cmds.addAttr(node, ln="locators", at="message", m=True, im=False)
+        for locator in cmds.ls("*_Petar3D_worldSpaceLocator*", "*:*_Petar3D_worldSpaceLocator*", tr=True):
+            self.connect(locator)
+        return node
+
+    def connect(self, locator):
+        #LOCKED NODES CAN'T HAVE THEIR CONNECTIONS CHANGED, SO WE TEMPORARILY UNLOCK THE LOCATOR
+        locked = cmds.lockNode(locator, q=True, l=True)[0]
+        if locked:
+            cmds.lockNode(locator, l=False)
+        cmds.connectAttr(locator + ".message", self.getNode() + ".locators", nextAvailable=True)
+        if locked:
+            cmds.lockNode(locator, l=True)
+
+    def rebuild(self):
+        #READS ALL THE LOCATORS CONNECTED TO THE REGISTRY NODE IN ONE GO, AND INDEXES THEM BY THEIR ORIGINAL CONTROL
+        self.installCallbacks()
+        self.records = {}
+        self.controls = {}
+        for locator in cmds.listConnections(self.getNode() + ".locators", s=True, d=False) or []:
+            record = self.readRecord(locator)
+            if record != None:
+                self.addRecord(record)
+
+    def readRecord(self, locator):
+        #OLD-STYLE LOCATORS GET THEIR SETUP ATTRIBUTES THE FIRST TIME THE REGISTRY READS THEM
+        record = readSetupAttributes(locator)
+        if record == None:
+            record = upgradeLegacySetup(locator)
+        return record
+
+    def addRecord(self, record):
+        self.records[record["locator"]] = record
+        self.controls.setdefault(record["control"], []).append(record)
+
+    def invalidate(self):
+        self.records = None
+        self.controls = None
+        self.influenceIndexes = {}
+
+    def register(self, locator):
+        #CONNECTS A NEWLY CREATED LOCATOR TO THE REGISTRY, AND ADDS IT TO THE IN-MEMORY INDEX
+        self.connect(locator)
+        if self.records == None:
+            self.rebuild()
+        elif locator not in self.records:
+            record = self.readRecord(locator)
+            if record != None:
+                self.addRecord(record)
+        return self.records.get(locator)
+
+    def unregister(self, locator):
+        #REMOVES A LOCATOR FROM THE IN-MEMORY INDEX RIGHT BEFORE IT GETS DELETED, THE MESSAGE CONNECTION GOES AWAY WITH THE NODE ITSELF
+        if self.records != None and locator in self.records:
+            record = self.records.pop(locator)
+            self.controls[record["control"]].remove(record)
+        #SO DO THE SWITCH CURVES ON ITS SHAPE AND ITS WEIGHT ON THE CONSTRAINT, A LOCATOR MADE LATER UNDER THE SAME NAME STARTS WITH NEW INDEXES
+        #MAYA NAMES THE WEIGHT AFTER THE LOCATOR WITHOUT ITS NAMESPACE
+        nodes = [locator] + (cmds.listRelatives(locator, shapes=True) or [])
+        weightPrefix = locator.split("|")[-1].split(":")[-1] + "W"
+        for curve in list(self.influenceIndexes):
+            node, attribute = curve.split(".", 1)
+            if node in nodes or attribute.startswith(weightPrefix):
+                self.influenceIndexes.pop(curve)
+
+    def getSetup(self, locator):
+        #RETURNS THE RECORD OF A TEMP LOCATOR. LOCATORS THAT AREN'T REGISTERED YET (FOR EXAMPLE MADE BY THE STANDALONE SCRIPTS) GET REGISTERED ON THE SPOT
+        if self.records == None:
+            self.rebuild()
+        if locator not in self.records:
+            if not cmds.objExists(locator):
+                return None
+            if not cmds.attributeQuery("worldSpaceMode", node=locator, exists=True) and "_Petar3D_worldSpaceLocator" not in locator:
+                return None
+            return self.register(locator)
+        return self.records[locator]
+
+    def getSetups(self, originalControl):
+        #RETURNS THE RECORDS OF EVERY LOCATOR THAT WAS APPLIED ON THE ORIGINAL CONTROL
+        if self.controls == None:
+            self.rebuild()
+        return list(self.controls.get(originalControl, []))
+
+    def getAllSetups(self):
+        #RETURNS THE RECORDS OF EVERY SETUP IN THE SCENE
+        if self.records == None:
+            self.rebuild()
+        return list(self.records.values())
+
+    def getBlendIndex(self, record):
+        #THE BLEND INDEX IS STORED ON THE LOCATOR WHEN THE SETUP IS APPLIED, WE ONLY LOOK IT UP IF IT WENT MISSING
+        if record["blendIndex"] == None:
+            record["blendIndex"] = getLegacyBlendIndex(record["control"], record["locator"], record["constraintType"])
+            if record["blendIndex"] != None:
+                cmds.setAttr(record["locator"] + ".worldSpaceBlendIndex", int(record["blendIndex"]))
+        return record["blendIndex"]
+
+    def getInfluenceIndex(self, curve, storedFrameValue):
+        #RETURNS THE INDEX OF THE RANGES ALREADY SWITCHED ON A CURVE. IT'S READ FROM THE CURVE THE FIRST TIME, AND FROM THEN ON applyInfluenceSwitch/removeInfluence KEEP IT UP TO DATE
+        self.installCallbacks()
+        if curve not in self.influenceIndexes:
+            self.influenceIndexes[curve] = readInfluenceIndex(curve, storedFrameValue)
+        return self.influenceIndexes[curve]
+
+    def getBlendCurve(self, record):
+        return record["control"] + ".blend{0}{1}".format(record["constraintType"].capitalize(), self.getBlendIndex(record))
+
+    #CALLBACKS
+    def installCallbacks(self):
+        if len(self.callbackIds) != 0:
+            return
+        self.callbackIds.append(om.MDGMessage.addNodeAddedCallback(self.nodeChanged, "transform"))
+        self.callbackIds.append(om.MDGMessage.addNodeRemovedCallback(self.nodeChanged, "transform"))
+        self.callbackIds.append(om.MNodeMessage.addNameChangedCallback(om.MObject(), self.nameChanged))
+        self.callbackIds.append(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self.sceneChanged))
+        self.callbackIds.append(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self.sceneChanged))
+        #AN UNDO OR REDO CAN PUT BACK KEYS THE INFLUENCE INDEXES DON'T KNOW ABOUT
+        self.callbackIds.append(om.MEventMessage.addEventCallback("Undo", self.sceneChanged))
+        self.callbackIds.append(om.MEventMessage.addEventCallback("Redo", self.sceneChanged))
+
+    def removeCallbacks(self):
+        if len(self.callbackIds) != 0:
+            om.MMessage.removeCallbacks(self.callbackIds)
+        self.callbackIds = []
+
+    def isTracked(self, name):
+        if "_Petar3D_" in name:
+            return True
+        return self.records != None and (name in self.records or name in self.controls)
+
+    def isMuted(self):
+        #WHILE AN OPERATION RUNS, THE ONLY EDITS ARE THE TOOL'S OWN, AND IT KEEPS THE INDEX UP TO DATE ITSELF WITH register() AND unregister()
+        #IF THE OPERATION FAILS, ITS UNDO HAPPENS AFTER IT'S CLOSED AND GOES THROUGH THE CALLBACKS LIKE ANY OTHER EDIT
+        return SceneOperation.depth != 0
+
+    def nodeChanged(self, node, clientData):
+        if not self.isMuted() and self.isTracked(om.MFnDependencyNode(node).name()):
+            self.invalidate()
+
+    def nameChanged(self, node, previousName, clientData):
+        if not self.isMuted() and (self.isTracked(previousName) or self.isTracked(om.MFnDependencyNode(node).name())):
+            self.invalidate()
+
+    def sceneChanged(self, clientData):
+        self.invalidate()
+
+
+#REMOVES THE CALLBACKS OF A PREVIOUS RUN OF THIS SCRIPT, SO THEY DON'T PILE UP EVERY TIME THE TOOL IS OPENED
+if "setupRegistry" in globals():
+    setupRegistry.removeCallbacks()
+setupRegistry = SetupRegistry()
+
+
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+@SceneOperation("World-Space Parent Constraint")
+def storeParentConstraint():
+    constraintType = "parent"
+    worldSpaceConversion(constraintType)
+
+@SceneOperation("World-Space Orient Constraint")
+def storeOrientConstraint():
+    constraintType = "orient"
+    worldSpaceConversion(constraintType)
+
+@SceneOperation("World-Space Point Constraint")
+def storePointConstraint():
+    constraintType = "point"
+    worldSpaceConversion(constraintType)
+    
+#BAKE SETTINGS
+#WHAT THE BAKE OPTIONS ARE WHEN THE WINDOW ISN'T OPEN, LIKE IN BATCH MODE
+DEFAULT_BAKE_SETTINGS = {"bakeInterval": 1, "smartBake": False, "smartBakeTolerance": 0.05, "sparseBake": False, "matrixDriver": False}
+
+def getBakeSettings():
+    #READS THE BAKE OPTIONS OFF THE WINDOW. ONLY THE BUTTONS CALL THIS, EVERYTHING BELOW THEM GETS THE SETTINGS PASSED IN, SO THE SAME CODE RUNS WITHOUT THE WINDOW
+    settings = dict(DEFAULT_BAKE_SETTINGS)
+    if not cmds.window("World_Space_Conversion", ex=True):
+        return settings
+    settings["bakeInterval"] = cmds.intFieldGrp("BakeInterval_IntField", q=True, v1=True)
+    settings["smartBake"] = cmds.checkBoxGrp("SmartBake_CheckBox", q=True, v1=True)
+    settings["smartBakeTolerance"] = cmds.floatFieldGrp("Tolerance_FloatField", q=True, v1=True)
+    settings["sparseBake"] = cmds.checkBoxGrp("SparseBake_CheckBox", q=True, v1=True)
+    settings["matrixDriver"] = cmds.checkBoxGrp("MatrixDriver_CheckBox", q=True, v1=True)
+    return settings
+
+
+#PLANNING
+@ProfiledStage("plan")
+def planConversion(selection, constraintType, timelineStart, timelineEnd, specificTimelineMode, useMatrixDriver, nodeInfo=None):
+    #CHECKS EVERY SELECTED CONTROL BEFORE ANYTHING IN THE SCENE IS TOUCHED, AND RETURNS THE PLAN FOR THE CONTROLS THAT WILL BE CONVERTED, WITH EVERY ERROR AND WARNING FOUND ALONG THE WAY
+    #THE APPLY ONLY GOES AHEAD IF THERE ARE NO ERRORS. EVERYTHING THE APPLY NEEDS TO KNOW ABOUT A CONTROL IS QUERIED HERE ONCE AND CARRIED IN ITS STEP OF THE PLAN
+    nodeInfo = getNodeInfo(nodeInfo)
+    plan = []
+    errors = []
+    warnings = []
+
+    #PREVENTS THE USER FROM APPLYING THE SETUP IN A NEGATIVE RANGE TIMELINE
+    if timelineStart < 0 or timelineEnd < 0:
+        errors.append("You can't apply a locator setup on a negative time-range")
+
+    for obj in selection:
+        if obj in [step["control"] for step in plan]:
+            continue
+
+        #PREVENTS THE USER FROM APPLYING A LOCATOR SETUP ON TOP OF AN EXISTING LOCATOR
+        if setupRegistry.getSetup(obj) != None:
+            errors.append("You can't stack locator setups - {0}".format(obj))
+            continue
+
+        #CHECKS TO SEE IF THERE'S ALREADY AN ORIENT OR A POINT CONSTRAINT, SO THAT IT DOESN'T TRY TO APPLY A PARENT CONSTRAINT, AND VICE VERSA
+        #AND IF THERE'S ALREADY A NIS-TYPE OF LOCATOR SETUP, IT DOESN'T LET THE USER APPLY AN IFS-TYPE LOCATOR, AND VICE VERSA
+        controlErrors = []
+        for record in setupRegistry.getSetups(obj):
+            if record["constraintType"] in ["point", "orient"] and constraintType == "parent":
+                controlErrors.append("You already have an orient/point constraint applied, you can't apply a parent constraint - {0}".format(obj))
+            if record["constraintType"] == "parent" and constraintType in ["orient", "point"]:
+                controlErrors.append("You already have a parent constraint applied, you can't apply an orient/point constraint - {0}".format(obj))
+            if record["mode"] == "NIS" and specificTimelineMode == True:
+                controlErrors.append("You already have a locator with overall influence over this selection. You can't mix overall with partial influence locators - {0}".format(obj))
+            elif record["mode"] == "IFS" and specificTimelineMode == False:
+                controlErrors.append("You already have a locator with partial influence over this selection. You can't mix partial with overall influence locators - {0}".format(obj))
+        errors += [message for index, message in enumerate(controlErrors) if message not in controlErrors[:index]]
+
+        shapeNodes = nodeInfo.getShapes(obj)
+        if shapeNodes == None:
+            errors.append("This selection has no shape to hide while it's in world-space - {0}".format(obj))
+            continue
+
+        #IF ALL ROTATE AND TRANSLATE CHANNELS ARE LOCKED, THERE'S NO POINT IN APPLYING THIS SCRIPT, SO THE CONTROL IS LEFT OUT OF THE PLAN
+        translateCurves = getLockedCurves(obj, "translate", nodeInfo)
+        rotateCurves = getLockedCurves(obj, "rotate", nodeInfo)
+        if len(translateCurves + rotateCurves) == 6:
+            warnings.append("All translate and rotate curves on this selection are locked - {0}".format(obj))
+            continue
+
+        #THE SAME OVERLAP CHECK applyInfluenceSwitch() DOES, MADE BEFORE ANY KEY IS WRITTEN
+        if specificTimelineMode and setupRegistry.getInfluenceIndex(shapeNodes[0] + ".v", 0).overlaps(timelineStart, timelineEnd):
+            errors.append("This locator overlaps with another locator on the timeline - {0}".format(obj))
+
+        #THE LIVE DRIVER IS USED WHEREVER IT CAN BE, EVERYTHING ELSE FALLS BACK TO THE CONSTRAINT NETWORK
+        driver = "constraint"
+        if useMatrixDriver == True:
+            if canUseMatrixDriver(obj, constraintType, translateCurves, rotateCurves):
+                driver = "matrix"
+            else:
+                warnings.append("Live driver isn't available for {0}, it uses a constraint instead".format(obj))
+
+        plan.append({"control": obj, "shapeNode": shapeNodes[0], "translateCurves": translateCurves, "rotateCurves": rotateCurves, "driver": driver})
+    return plan, errors, warnings
+
+
+#EXECUTION
+def convertControls(plan, constraintType, timelineStart, timelineEnd, specificTimelineMode, settings, nodeInfo=None):
+    #APPLIES A PLAN FROM planConversion() THAT CAME BACK WITHOUT ERRORS, AND RETURNS THE TEMP LOCATORS IT MADE AND HOW MANY FRAME EVALUATIONS THE SHARED BAKE SAVED
+    #IT DOESN'T LOOK AT THE SELECTION OR THE WINDOW, SO THE BUTTONS AND THE BATCH MODE BOTH GO THROUGH HERE
+    steps = [dict(step, constraintType=constraintType, start=timelineStart, end=timelineEnd, specificTimelineMode=specificTimelineMode) for step in plan]
+    return convertSteps(steps, settings, nodeInfo)
+
+
+def convertSteps(steps, settings, nodeInfo=None):
+    #DOES THE WORK OF convertControls() FOR STEPS THAT EACH CARRY THEIR OWN CONSTRAINT TYPE AND RANGE, SO ENTRIES WITH DIFFERENT RANGES STILL SHARE ONE BAKE
+    nodeInfo = getNodeInfo(nodeInfo)
+    nodeInfo.prefetch([step["control"] for step in steps])
+
+    #FIRST PASS - CREATES AND CONSTRAINS EVERY TEMP LOCATOR, WITHOUT BAKING ANYTHING YET
+    setups = []
+    for step in steps:
+        obj = step["control"]
+        selectionShapeNode = step["shapeNode"]
+        translateCurves = step["translateCurves"]
+        rotateCurves = step["rotateCurves"]
+        constraintType = step["constraintType"]
+        timelineStart = step["start"]
+        timelineEnd = step["end"]
+        specificTimelineMode = step["specificTimelineMode"]
+
+        with ProfiledStage("createLocator", obj):
+            #SWITCHES THE VISIBILITY ON THE ORIGINAL SELECTION,
+            if specificTimelineMode:
+                applyInfluenceSwitch(selectionShapeNode + ".v", timelineStart, timelineEnd, add, 0, 0)
+            else:
+                cmds.setAttr(selectionShapeNode + ".v", 0)
+
+            #CREATES THE TEMP LOCATOR 
+            if specificTimelineMode:
+                tempControl = createControl(obj + "_Petar3D_worldSpaceLocator_{0}_IFS_{1}_{2}".format(constraintType, int(timelineStart), int(timelineEnd)))   
+            else:
+                tempControl = createControl(obj + "_Petar3D_worldSpaceLocator_{0}_NIS".format(constraintType))   
+            addSetupAttributes(tempControl, obj, constraintType, "IFS" if specificTimelineMode else "NIS", timelineStart, timelineEnd, driver=step["driver"])
+            record = setupRegistry.register(tempControl)
+
+            #POSITIONS THE LOCATOR TO THE ORIGINAL SELECTION AND CONSTRAINS IT, READY TO BE BAKED
+            setup(obj, tempControl, constraintType, translateCurves, rotateCurves, nodeInfo)       
+            setups.append([obj, tempControl, selectionShapeNode, translateCurves, rotateCurves, record, step])
+
+    if len(setups) == 0:
+        return [], 0
+
+    #SECOND PASS - BAKES ALL THE LOCATORS TOGETHER, IN ONE TIMELINE PASS FOR EVERY GROUP OF OVERLAPPING RANGES
+    savedEvaluations = bakeLocators([item[1] for item in setups], [item[0] for item in setups], [(item[6]["start"], item[6]["end"]) for item in setups], settings, nodeInfo)
+
+    #THIRD PASS - REVERSES THE CONSTRAINTS AND APPLIES THE INFLUENCE SWITCHES FOR EVERY LOCATOR
+    for obj, tempControl, selectionShapeNode, translateCurves, rotateCurves, record, step in setups:
+        timelineStart = step["start"]
+        timelineEnd = step["end"]
+        specificTimelineMode = step["specificTimelineMode"]
+        with ProfiledStage("setDriver", obj):
+            locatorShapeNode = nodeInfo.getShapes(tempControl)[0]   
+        
+            hideAttributes("scale", tempControl)
+            cmds.lockNode(tempControl, l=True)
+        
+            #VISIBILITY SWITCH FOR LOCATOR
+            if specificTimelineMode:
+                applyInfluenceSwitch(locatorShapeNode + ".v", timelineStart, timelineEnd, subtract, 1, 0)
+    
+        
+            #THE LOCATOR EITHER DRIVES THE ORIGINAL CONTROL THROUGH A REVERSED CONSTRAINT, OR THROUGH THE LIGHTER MATRIX NODES
+            if record["driver"] == "matrix":
+                setMatrixDriver(obj, tempControl, timelineStart, timelineEnd, specificTimelineMode)
+            else:
+                setConstraintDriver(obj, tempControl, record, translateCurves, rotateCurves, timelineStart, timelineEnd, specificTimelineMode, nodeInfo)
+
+    #SIGNS THE CURVES EVERY LOCATOR WAS BAKED FROM, SO refreshSetup() CAN LATER RE-SAMPLE ONLY WHAT CHANGED. IT HAPPENS AFTER THE DRIVERS ARE SET, BECAUSE setConstraintDriver() KEYS THE CONTROL'S CHANNELS
+    #AT THE START AND END OF THE RANGE, AND SIGNING THEM BEFORE THAT WOULD MAKE THE FIRST REFRESH SAMPLE AGAIN
+    for obj, tempControl, selectionShapeNode, translateCurves, rotateCurves, record, step in setups:
+        with ProfiledStage("signSource", obj):
+            storeSource(tempControl, step["start"], step["end"], settings["bakeInterval"], getSourceSignatures(obj, tempControl))
+
+    return [item[1] for item in setups], savedEvaluations
+
+
+def reportPlanProblems(errors, warnings):
+    #PUTS EVERY PROBLEM THE PLANNING FOUND IN THE SCRIPT EDITOR, SHOWS THE FIRST ONE ON SCREEN, AND STOPS THE OPERATION IF ANY OF THEM IS AN ERROR
+    for message in warnings + errors:
+        cmds.warning(message)
+    if len(errors) > 1:
+        assistMessage("<hl>Error: {0} (and {1} more problems, see the script editor)<hl>".format(errors[0], len(errors) - 1), 5000, True)
+    elif len(errors) == 1:
+        assistMessage("<hl>Error: {0}<hl>".format(errors[0]), 5000, True)
+    elif len(warnings) != 0:
+        assistMessage(warnings[0], 4000, False)
+
+
+def worldSpaceConversion(constraintType):    
+    #VARIABLES FOR USER TO ADJUST
+    aTimeSlider = mel.eval('$tmpVar=$gPlayBackSlider')
+    timeRange = cmds.timeControl(aTimeSlider, q=True, rangeArray=True)
+
+    if 2 < (timeRange[1] - timeRange[0]):
+        specificTimelineMode = True
+        timelineStart = timeRange[0]
+        timelineEnd = timeRange[1] - 1
+    else:
+        specificTimelineMode = False
+        #QUERIES THE START AND END FRAME OF THE CURRENT TIMELINE
+        timelineStart = cmds.playbackOptions(min=True, q=True)
+        timelineEnd = cmds.playbackOptions(max=True, q=True)
+
+
+    selection = cmds.ls(sl=True)
+    settings = getBakeSettings()
+
+
+    #ADVISES THE USER TO SELECT SOMETHING BEFORE RUNNING THIS SCRIPT
+    if len(selection) == 0:
+        assistMessage("<hl>You need to select at least 1 object to turn into world space<hl>", 4000, True)
+    else:            
+        #PLANNING PASS - CHECKS THE WHOLE SELECTION BEFORE ANYTHING IS TOUCHED, SO AN ERROR NEVER LEAVES HALF OF IT CONVERTED
+        plan, errors, warnings = planConversion(selection, constraintType, timelineStart, timelineEnd, specificTimelineMode, settings["matrixDriver"])
+        reportPlanProblems(errors, warnings)
+
+        tempControls, savedEvaluations = convertControls(plan, constraintType, timelineStart, timelineEnd, specificTimelineMode, settings)
+
+        #LETS THE USER KNOW HOW MUCH SCRUBBING THE SINGLE BAKE PASS SAVED
+        if savedEvaluations > 0:
+            assistMessage("Baked {0} locators in one pass - saved {1} frame evaluations".format(len(tempControls), savedEvaluations), 3000, False)
+
+
+#ENTRY LISTS
+#AN ENTRY IS ONE CONTROL WORLD-SPACED OVER ITS OWN RANGE - {"control": "foot_L_ctrl", "start": 12, "end": 30, "constraintType": "parent"}, OR THE SAME AS A [control, start, end, constraintType] LIST
+def readEntries(path):
+    #READS A LIST OF ENTRIES FROM A JSON FILE, EITHER THE LIST ITSELF OR AN OBJECT WITH THE LIST UNDER "entries"
+    with open(path) as entryFile:
+        entries = json.load(entryFile)
+    if isinstance(entries, dict):
+        entries = entries["entries"]
+    return entries
+
+
+def planEntries(entries, useMatrixDriver, constraintType="parent", nodeInfo=None):
+    #CHECKS A WHOLE LIST OF ENTRIES BEFORE ANYTHING IN THE SCENE IS TOUCHED, AND RETURNS THE STEPS FOR convertSteps(), WITH EVERY ERROR AND WARNING FOUND ALONG THE WAY
+    #EVERY ENTRY GOES THROUGH planConversion() AGAINST THE SCENE, AND AGAINST THE ENTRIES BEFORE IT FOR THE SAME RULES - NO OVERLAPPING RANGES ON A CONTROL, AND NO PARENT MIXED WITH ORIENT/POINT
+    steps = []
+    errors = []
+    warnings = []
+    entryRanges = {}
+    entryTypes = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            entry = dict(zip(["control", "start", "end", "constraintType"], entry))
+        control = entry.get("control")
+        entryType = entry.get("constraintType") or constraintType
+        timelineStart = entry.get("start")
+        timelineEnd = entry.get("end")
+        if control == None or timelineStart == None or timelineEnd == None:
+            errors.append("Every entry needs a control, a start and an end - {0}".format(entry))
+            continue
+        if entryType not in CONSTRAINT_TYPES:
+            errors.append("Unknown constraint type '{0}', it has to be one of {1} - {2}".format(entryType, ", ".join(CONSTRAINT_TYPES), control))
+            continue
+        if timelineStart > timelineEnd:
+            errors.append("The entry ends before it starts, {0}-{1} - {2}".format(timelineStart, timelineEnd, control))
+            continue
+        if not cmds.objExists(control):
+            errors.append("This control doesn't exist - {0}".format(control))
+            continue
+
+        index = entryRanges.setdefault(control, IntervalIndex())
+        if index.overlaps(timelineStart, timelineEnd):
+            errors.append("This entry overlaps another entry on the same control, {0}-{1} - {2}".format(timelineStart, timelineEnd, control))
+            continue
+        otherTypes = entryTypes.setdefault(control, set())
+        if (entryType == "parent" and len(otherTypes - set(["parent"])) != 0) or (entryType != "parent" and "parent" in otherTypes):
+            errors.append("You can't mix a parent constraint with orient/point constraints in the same entries - {0}".format(control))
+            continue
+        index.add(timelineStart, timelineEnd)
+        otherTypes.add(entryType)
+
+        plan, planErrors, planWarnings = planConversion([control], entryType, timelineStart, timelineEnd, True, useMatrixDriver, nodeInfo)
+        errors += ["{0} ({1}-{2})".format(error, timelineStart, timelineEnd) for error in planErrors]
+        warnings += planWarnings
+        steps += [dict(step, constraintType=entryType, start=timelineStart, end=timelineEnd, specificTimelineMode=True) for step in plan]
+    return steps, errors, warnings
+
+
+@SceneOperation("World-Space Apply Entries")
+def applyEntries(entries, settings, constraintType="parent"):
+    #WORLD-SPACES EVERY CONTROL OVER ITS OWN RANGE, AS A SINGLE OPERATION. NOTHING IS APPLIED UNLESS THE WHOLE LIST PLANS WITHOUT ERRORS
+    #RETURNS THE TEMP LOCATORS IT MADE, AND THE ERRORS AND WARNINGS THE PLANNING FOUND. constraintType IS USED FOR THE ENTRIES THAT DON'T HAVE ONE
+    steps, errors, warnings = planEntries(entries, settings["matrixDriver"], constraintType)
+    if len(errors) != 0:
+        return [], errors, warnings
+    tempControls, savedEvaluations = convertSteps(steps, settings)
+    return tempControls, errors, warnings
+
+
+@SceneOperation("World-Space Apply Entries")
+def applyEntryFile(path=None):
+    #APPLIES A JSON FILE OF ENTRIES FROM THE SCRIPT EDITOR OR A SHELF BUTTON, WITH THE BAKE OPTIONS OF THE WINDOW. WITHOUT A PATH IT ASKS FOR THE FILE
+    if path == None:
+        paths = cmds.fileDialog2(fileFilter="JSON (*.json)", fileMode=1, caption="World-Space Entries")
+        if not paths:
+            return
+        path = paths[0]
+    settings = getBakeSettings()
+    steps, errors, warnings = planEntries(readEntries(path), settings["matrixDriver"])
+    reportPlanProblems(errors, warnings)
+    tempControls, savedEvaluations = convertSteps(steps, settings)
+    if len(tempControls) != 0:
+        assistMessage("Applied {0} locators - saved {1} frame evaluations".format(len(tempControls), savedEvaluations), 3000, False)
+
+
+#DELETE SETUP
+@SceneOperation("World-Space Delete Setup")
+def deleteSetup():
+    selection = cmds.ls(sl=True)
+    if len(selection) == 0:
+        #NOTIFIES THE USER THAT THEY NEED TO SELECT SOMETHING TO DELETE
+        assistMessage("<hl>Error: Nothing is selected<hl>", 4000, False)
+
+    deletedLocators, skippedObjects = deleteSetups(selection, getBakeSettings())
+
+    #IF AN OBJECT FROM OUTSIDE THE PETAR3D SS SCRIPTS IS SELECTED, IT WON'T COUNT, AND THE USER WILL BE NOTIFIED WHICH OBJECT THEY MISSELECTED
+    for temp_locator in skippedObjects:
+        assistMessage("<hl>Error: Can't run script on this object, it's not a locator set-up  - {0} <hl>".format(temp_locator), 4000, False)
+
+
+def deleteSetups(locators, settings, nodeInfo=None):
+    #BAKES THE SETUPS OF THE GIVEN TEMP LOCATORS BACK ONTO THEIR ORIGINAL CONTROLS AND REMOVES THEM. RETURNS THE LOCATORS IT DELETED, AND THE OBJECTS IT SKIPPED BECAUSE THEY AREN'T SETUPS
+    #IT DOESN'T LOOK AT THE SELECTION OR THE WINDOW, SO THE DELETE BUTTON AND THE BATCH MODE BOTH GO THROUGH HERE
+    nodeInfo = getNodeInfo(nodeInfo)
+    bakeInterval = settings["bakeInterval"]
+    smartBake = settings["smartBake"]
+    smartBakeTolerance = settings["smartBakeTolerance"]
+
+    #FIRST PASS - GATHERS THE INFO FOR EVERY SELECTED LOCATOR, AND GROUPS THEM BY THE WAY THEIR ORIGINAL CONTROLS NEED TO BE BAKED
+    setups = []
+    skippedObjects = []
+    bakeGroups = {}
+    for temp_locator in locators:
+        #WS SETUP
+        record = setupRegistry.getSetup(temp_locator)
+        if record != None:
+            with ProfiledStage("gatherSetup", record["control"]):
+                originalControl = record["control"]
+                selectionShapeNode = nodeInfo.getShapes(originalControl)[0]    #VISIBILITY SWITCH FOR THE ORIGINAL SELECTION
+                constraint = record["constraintType"]
+                #MATRIX DRIVERS DON'T HAVE A CONSTRAINT, SO THERE'S NO BLEND INDEX TO LOOK UP
+                blendIndex = None
+                blendCurve = None
+                if record["driver"] == "constraint":
+                    blendIndex = setupRegistry.getBlendIndex(record)
+                    blendCurve = setupRegistry.getBlendCurve(record)
+
+                #CHECKS TO SEE IF THE LOCATOR AFFECTED A SPECIFIC RANGE OF THE TIMELINE
+                if record["mode"] == "IFS":
+                    timelineStart = record["start"]
+                    timelineEnd = record["end"]
+            
+                #IF THIS ORIGINAL CONTROL DIDN'T HAVE A SPECIFIC INFLUENCE APPLIED, WE QUERY THE CURRENT TIMELINE START AND END 
+                else:
+                    timelineStart = cmds.playbackOptions(min=True, q=True)
+                    timelineEnd = cmds.playbackOptions(max=True, q=True)
+
+                #GETS THE CHANNELS TO BAKE ONTO
+                bakePlugs = getBakePlugs(originalControl, getConstraintAttribute(constraint))
+
+                setup = {"locator": temp_locator, "mode": record["mode"], "originalControl": originalControl, "selectionShapeNode": selectionShapeNode, "constraint": constraint, "driver": record["driver"],
+                         "blendIndex": blendIndex, "blendCurve": blendCurve, "timelineStart": timelineStart, "timelineEnd": timelineEnd}
+                setups.append(setup)
+
+                #LOCATORS THAT SHARE THE SAME RANGE AND BAKE SETTINGS GET THEIR ORIGINAL CONTROLS BAKED TOGETHER
+                bakeGroup = bakeGroups.setdefault((timelineStart, timelineEnd, bakeInterval, smartBake), {"setups": [], "controls": [], "plugs": []})
+                bakeGroup["setups"].append(setup)
+                if originalControl not in bakeGroup["controls"]:
+                    bakeGroup["controls"].append(originalControl)
+                bakeGroup["plugs"] += [plug for plug in bakePlugs if plug not in bakeGroup["plugs"]]
+            
+        else:
+            skippedObjects.append(temp_locator)
+
+    #SECOND PASS - WORKS OUT THE BAKED VALUES OF EVERY GROUP STRAIGHT FROM THE LOCATOR CURVES, WHILE ALL THE CONSTRAINTS ARE STILL ACTIVE. ONLY THE CONTROLS THAT CAN'T BE SOLVED THAT WAY GET A REAL BAKE, IN A SINGLE CALL
+    for (timelineStart, timelineEnd, bakeInterval, smartBake), bakeGroup in bakeGroups.items():
+        bakeDownSetups(bakeGroup, timelineStart, timelineEnd, bakeInterval, smartBake, smartBakeTolerance, nodeInfo)
+
+    #THIRD PASS - REMOVES THE INFLUENCE KEYS AND THE LOCATORS ONE BY ONE, SO EVERY LOCATOR SEES ITS NEIGHBOURS THE SAME WAY IT DID BEFORE
+    for setup in setups:
+        temp_locator = setup["locator"]
+        originalControl = setup["originalControl"]
+        selectionShapeNode = setup["selectionShapeNode"]
+        constraint = setup["constraint"]
+        blendIndex = setup["blendIndex"]
+        blendCurve = setup["blendCurve"]
+        timelineStart = setup["timelineStart"]
+        timelineEnd = setup["timelineEnd"]
+
+        with ProfiledStage("removeSetup", originalControl):
+            cmds.lockNode(temp_locator, l=False)
+            setupRegistry.unregister(temp_locator)
+
+            if setup["mode"] == "IFS":
+                removeInfluence(selectionShapeNode + ".v", timelineStart, timelineEnd, "visibility")
+        
+            #IF THIS ORIGINAL CONTROL DIDN'T HAVE A SPECIFIC INFLUENCE APPLIED, WE JUST REVERT BACK THE VISIBILITY TO THE ORIGINAL
+            else:
+                cmds.setAttr(selectionShapeNode + ".v", 1)
+     
+            #MATRIX DRIVERS TAKE THEIR SWITCH WITH THEM WHEN THEIR NODES ARE DELETED
+            if setup["driver"] == "matrix":
+                removeMatrixDriver(temp_locator, originalControl)
+                if setup["mode"] == "IFS":
+                    cmds.keyTangent(selectionShapeNode, attribute = "visibility", inTangentType= "flat")
+
+            #REMOVES THE INFLUENCE ON THE BLEND INDEX CURVE        
+            elif setup["mode"] == "IFS":
+                removeInfluence(blendCurve, timelineStart, timelineEnd, "blend")   
+        
+                #MAKING SURE THAT THE TANGENTS THAT ARE FLAT AT THE END OF IT ALL
+                cmds.keyTangent(selectionShapeNode, attribute = "visibility", inTangentType= "flat")
+                cmds.keyTangent(originalControl, attribute = "blend{0}{1}".format(constraint.capitalize(), blendIndex), inTangentType= "flat")
+        
+            cmds.delete(temp_locator)
+
+    return [setup["locator"] for setup in setups], skippedObjects
+
+#EDIT SETUP RANGE
+def getConstraintWeightPlug(record):
+    #FINDS THE WEIGHT ATTRIBUTE THE LOCATOR HAS ON THE CONSTRAINT THAT DRIVES THE ORIGINAL CONTROL, THROUGH THE CONSTRAINT'S TARGET LIST RATHER THAN ITS NAME
+    constraintCommand = getattr(cmds, record["constraintType"] + "Constraint")
+    constraint = cmds.listConnections(record["locator"] + ".parentMatrix[0]", s=False, d=True, type=record["constraintType"] + "Constraint")[0]
+    locator = cmds.ls(record["locator"], long=True)[0]
+    for target, weightAlias in zip(constraintCommand(constraint, q=True, targetList=True), constraintCommand(constraint, q=True, weightAliasList=True)):
+        if cmds.ls(target, long=True)[0] == locator:
+            return "{0}.{1}".format(constraint, weightAlias)
+
+
+def setLocatorSwitches(record, timelineStart, timelineEnd):
+    #KEYS THE SWITCHES THAT ONLY BELONG TO ONE SETUP - THE LOCATOR'S VISIBILITY AND ITS CONSTRAINT OR MATRIX DRIVER WEIGHT - FROM SCRATCH FOR A NEW RANGE
+    ownCurves = [cmds.listRelatives(record["locator"], shapes=True, children=True)[0] + ".v"]
+    if record["driver"] == "matrix":
+        ownCurves.append(getMatrixDriver(record["locator"])[1] + ".target[0].weight")
+    else:
+        ownCurves.append(getConstraintWeightPlug(record))
+    for curve in ownCurves:
+        cmds.cutKey(curve, clear=True)
+        setupRegistry.influenceIndexes.pop(curve, None)
+        applyInfluenceSwitch(curve, timelineStart, timelineEnd, subtract, 1, 0)
+
+
+def moveSetupSwitches(record, previousStart, previousEnd, timelineStart, timelineEnd):
+    #MOVES EVERY SWITCH OF A PARTIAL-RANGE SETUP FROM ITS OLD RANGE TO ITS NEW ONE. THE CURVES THE CONTROL SHARES WITH ITS OTHER SETUPS GO THROUGH removeInfluence() AND applyInfluenceSwitch()
+    #SO THE NEIGHBOURING RANGES STAY MERGED, THE CURVES THAT ONLY BELONG TO THIS SETUP ARE SIMPLY KEYED AGAIN
+    selectionShapeNode = cmds.listRelatives(record["control"], shapes=True, children=True)[0]
+    removeInfluence(selectionShapeNode + ".v", previousStart, previousEnd, "visibility")
+    applyInfluenceSwitch(selectionShapeNode + ".v", timelineStart, timelineEnd, add, 0, 0)
+    cmds.keyTangent(selectionShapeNode, attribute = "visibility", inTangentType= "flat")
+
+    if record["driver"] == "constraint":
+        blendCurve = setupRegistry.getBlendCurve(record)
+        removeInfluence(blendCurve, previousStart, previousEnd, "blend")
+        applyInfluenceSwitch(blendCurve, timelineStart, timelineEnd, subtract, 1, 1)
+        cmds.keyTangent(record["control"], attribute = blendCurve.split(".")[-1], inTangentType= "flat")
+    setLocatorSwitches(record, timelineStart, timelineEnd)
+
+
+@SceneOperation("World-Space Set Range")
+def editSetupRange():
+    #GIVES THE SELECTED PARTIAL-RANGE LOCATOR THE RANGE THAT'S HIGHLIGHTED ON THE TIMELINE. FRAMES THE RANGE GAINS GET BAKED ONTO THE LOCATOR, AND FRAMES IT LOSES GET BAKED BACK ONTO THE ORIGINAL CONTROL
+    aTimeSlider = mel.eval('$tmpVar=$gPlayBackSlider')
+    timeRange = cmds.timeControl(aTimeSlider, q=True, rangeArray=True)
+    if 2 >= (timeRange[1] - timeRange[0]):
+        assistMessage("<hl>Error: Highlight the new range on the timeline first<hl>", 4000, True)
+    timelineStart = timeRange[0]
+    timelineEnd = timeRange[1] - 1
+    if timelineStart < 0 or timelineEnd < 0:
+        assistMessage("<hl>Error: You can't apply a locator setup on a negative time-range <hl>", 5000, True)
+
+    selection = cmds.ls(sl=True)
+    if len(selection) != 1:
+        assistMessage("<hl>Error: Select the one locator you want to change the range of<hl>", 4000, True)
+    record = setupRegistry.getSetup(selection[0])
+    if record == None or record["mode"] != "IFS":
+        assistMessage("<hl>Error: Only locators with a partial influence over the timeline have a range to change<hl>", 4000, True)
+    previousStart = record["start"]
+    previousEnd = record["end"]
+    if (timelineStart, timelineEnd) == (previousStart, previousEnd):
+        return
+
+    #NOTHING GETS TOUCHED UNLESS THE NEW RANGE IS FREE OF THE CONTROL'S OTHER LOCATORS
+    for otherRecord in setupRegistry.getSetups(record["control"]):
+        if otherRecord["locator"] != record["locator"] and otherRecord["mode"] == "IFS" and otherRecord["start"] <= timelineEnd and timelineStart <= otherRecord["end"]:
+            assistMessage("<hl>Error: This locator overlaps with another locator on the timeline. <hl>", 5000, True)
+
+    settings = getBakeSettings()
+    bakeInterval = settings["bakeInterval"]
+    smartBake = settings["smartBake"]
+    smartBakeTolerance = settings["smartBakeTolerance"]
+
+    #FRAMES THE SETUP LOSES ARE BAKED BACK ONTO THE ORIGINAL CONTROL FIRST, WHILE THE SETUP STILL DRIVES THEM
+    removedRanges = [(rangeStart, rangeEnd) for rangeStart, rangeEnd in [(previousStart, min(timelineStart - 1, previousEnd)), (max(timelineEnd + 1, previousStart), previousEnd)] if rangeStart <= rangeEnd]
+    setup = {"locator": record["locator"], "originalControl": record["control"], "constraint": record["constraintType"], "driver": record["driver"]}
+    bakePlugs = getBakePlugs(record["control"], getConstraintAttribute(record["constraintType"]))
+    for rangeStart, rangeEnd in removedRanges:
+        bakeDownSetups({"setups": [setup], "controls": [record["control"]], "plugs": bakePlugs}, rangeStart, rangeEnd, bakeInterval, smartBake, smartBakeTolerance)
+
+    #FRAMES THE SETUP GAINS ARE SAMPLED ONTO THE LOCATOR, THE SAME WAY A REFRESH SAMPLES THEM
+    addedRanges = [(rangeStart, rangeEnd) for rangeStart, rangeEnd in [(timelineStart, min(previousStart - 1, timelineEnd)), (max(previousEnd + 1, timelineStart), timelineEnd)] if rangeStart <= rangeEnd]
+    if len(addedRanges) != 0:
+        resampleLocator(record, {"start": timelineStart, "end": timelineEnd, "interval": max(bakeInterval, 1)}, addedRanges)
+        for rangeStart, rangeEnd in addedRanges:
+            filterEulerRange([record["locator"]], rangeStart, rangeEnd)
+            if smartBake == True:
+                reduceKeys(getBakePlugs(record["locator"], getConstraintAttribute(record["constraintType"])), rangeStart, rangeEnd, smartBakeTolerance)
+
+    moveSetupSwitches(record, previousStart, previousEnd, timelineStart, timelineEnd)
+
+    #THE STORED RANGE FOLLOWS, SO DELETE AND REFRESH WORK ON THE NEW ONE
+    cmds.setAttr(record["locator"] + ".worldSpaceStart", int(timelineStart))
+    cmds.setAttr(record["locator"] + ".worldSpaceEnd", int(timelineEnd))
+    record["start"] = int(timelineStart)
+    record["end"] = int(timelineEnd)
+    source = readSource(record["locator"])
+    if source != None:
+        storeSource(record["locator"], timelineStart, timelineEnd, source["interval"], source["curves"])
+    assistMessage("Changed the range of {0} to {1} - {2}".format(record["locator"], int(timelineStart), int(timelineEnd)), 3000, False)
+
+
+#COMPACT SETUPS
+def getTouchingSetups(originalControl):
+    #GROUPS THE PARTIAL-RANGE SETUPS OF A CONTROL INTO RUNS WHERE EVERY RANGE STARTS ON THE FRAME AFTER THE PREVIOUS ONE ENDS. ONLY SETUPS WITH THE SAME CONSTRAINT AND DRIVER GO INTO THE SAME RUN
+    records = sorted([record for record in setupRegistry.getSetups(originalControl) if record["mode"] == "IFS"], key=lambda record: record["start"])
+    runs = []
+    for record in records:
+        previous = runs[-1][-1] if len(runs) != 0 else None
+        if previous != None and record["start"] == previous["end"] + 1 and (record["constraintType"], record["driver"]) == (previous["constraintType"], previous["driver"]):
+            runs[-1].append(record)
+        else:
+            runs.append([record])
+    return [run for run in runs if len(run) > 1]
+
+
+def mergeSetups(records):
+    #MERGES A RUN OF TOUCHING SETUPS INTO THE FIRST ONE. THE OTHER LOCATORS' KEYS ARE PASTED ONTO IT OVER THEIR OWN RANGES, IT GETS ONE WEIGHT SWITCH FOR THE WHOLE RUN, AND THE OTHER LOCATORS ARE TAKEN OFF THE CONSTRAINT AND DELETED
+    #THE CONTROL'S VISIBILITY AND BLEND CURVES DON'T CHANGE - applyInfluenceSwitch() ALREADY MERGED THE TOUCHING RANGES ON THEM INTO ONE BLOCK
+    survivor = records[0]
+    timelineStart = records[0]["start"]
+    timelineEnd = records[-1]["end"]
+    sources = [readSource(record["locator"]) for record in records]
+
+    #THE KEYS ARE MOVED THROUGH A SNAPSHOT RATHER THAN copyKey AND pasteKey, SO THE USER'S CLIPBOARD IS LEFT ALONE
+    for record in records[1:]:
+        plugs = getBakePlugs(record["locator"], ["translate", "rotate"])
+        snapshot = CurveSnapshot(plugs, record["start"], record["end"]).capture()
+        cmds.cutKey(survivor["locator"], t=(record["start"], record["end"]), at=["translate", "rotate"], clear=True)
+        for plug, survivorPlug in zip(plugs, getBakePlugs(survivor["locator"], ["translate", "rotate"])):
+            if len(snapshot.getTimes(plug)) != 0:
+                writeKeys(survivorPlug, snapshot.getTimes(plug), snapshot.getUiValues(plug))
+    #EVERY LOCATOR WAS UNWRAPPED ON ITS OWN, SO THE ROTATION CAN JUMP BY A FULL TURN WHERE TWO OF THEM NOW MEET
+    filterEulerRange([survivor["locator"]], timelineStart, timelineEnd)
+    for record in records[1:]:
+        #THE MERGED LOCATORS COME OFF THE CONTROL'S CONSTRAINT BEFORE THEY'RE DELETED, SO IT DOESN'T KEEP A DEAD TARGET, AND THEIR WEIGHT CURVES GO WITH THEM
+        weightPlug = getConstraintWeightPlug(record)
+        cmds.cutKey(weightPlug, clear=True)
+        setupRegistry.influenceIndexes.pop(weightPlug, None)
+        getattr(cmds, record["constraintType"] + "Constraint")(record["locator"], record["control"], e=True, rm=True)
+        cmds.lockNode(record["locator"], l=False)
+        setupRegistry.unregister(record["locator"])
+        cmds.delete(record["locator"])
+
+    setLocatorSwitches(survivor, timelineStart, timelineEnd)
+    cmds.setAttr(survivor["locator"] + ".worldSpaceStart", int(timelineStart))
+    cmds.setAttr(survivor["locator"] + ".worldSpaceEnd", int(timelineEnd))
+    survivor["start"] = int(timelineStart)
+    survivor["end"] = int(timelineEnd)
+
+    #THE SIGNATURES ONLY CARRY OVER IF EVERY LOCATOR WAS BAKED FROM THE SAME CURVES, OTHERWISE THE NEXT REFRESH SAMPLES THE WHOLE RANGE
+    signatures = None
+    if None not in sources and all(source["curves"] == sources[0]["curves"] for source in sources):
+        signatures = sources[0]["curves"]
+    interval = sources[0]["interval"] if sources[0] != None else 1
+    storeSource(survivor["locator"], timelineStart, timelineEnd, interval, signatures)
+
+
+@SceneOperation("World-Space Merge Locators")
+def compactSetups():
+    #MERGES THE TOUCHING PARTIAL-RANGE LOCATORS OF EVERY SELECTED CONTROL (OR OF THE CONTROLS THE SELECTED LOCATORS BELONG TO) INTO ONE LOCATOR PER RUN
+    selection = cmds.ls(sl=True)
+    if len(selection) == 0:
+        assistMessage("<hl>Error: Nothing is selected<hl>", 4000, True)
+
+    originalControls = []
+    for item in selection:
+        record = setupRegistry.getSetup(item)
+        originalControl = record["control"] if record != None else item
+        if originalControl not in originalControls:
+            originalControls.append(originalControl)
+
+    mergedLocators = 0
+    runCount = 0
+    for originalControl in originalControls:
+        for run in getTouchingSetups(originalControl):
+            mergeSetups(run)
+            mergedLocators += len(run)
+            runCount += 1
+
+    if runCount == 0:
+        assistMessage("There are no touching locators to merge", 3000, False)
+    else:
+        assistMessage("Merged {0} locators into {1}".format(mergedLocators, runCount), 3000, False)
+
+
+#REFRESH SETUP
+@SceneOperation("World-Space Refresh Locator")
+def refreshSetup():
+    selection = cmds.ls(sl=True)
+    if len(selection) == 0:
+        assistMessage("<hl>Error: Nothing is selected<hl>", 4000, True)
+
+    settings = getBakeSettings()
+    smartBake = settings["smartBake"]
+    smartBakeTolerance = settings["smartBakeTolerance"]
+
+    refreshedFrames = 0
+    refreshedLocators = 0
+    for temp_locator in selection:
+        record = setupRegistry.getSetup(temp_locator)
+        if record == None:
+            assistMessage("<hl>Error: Can't run script on this object, it's not a locator set-up  - {0} <hl>".format(temp_locator), 4000, False)
+            continue
+
+        #LOCATORS BAKED BEFORE THE SIGNATURES EXISTED DON'T KNOW WHAT THEY CAME FROM, SO THEY GET THEIR WHOLE RANGE SAMPLED AGAIN ONCE
+        source = readSource(temp_locator)
+        if source == None:
+            if record["mode"] == "IFS":
+                source = {"start": record["start"], "end": record["end"], "curves": None}
+            else:
+                source = {"start": cmds.playbackOptions(min=True, q=True), "end": cmds.playbackOptions(max=True, q=True), "curves": None}
+            source["interval"] = max(settings["bakeInterval"], 1)
+
+        signatures = getSourceSignatures(record["control"], temp_locator)
+        ranges = getChangedRanges(source["curves"], signatures, source["start"], source["end"])
+        if len(ranges) != 0:
+            refreshedFrames += resampleLocator(record, source, ranges)
+            refreshedLocators += 1
+            for rangeStart, rangeEnd in ranges:
+                filterEulerRange([temp_locator], rangeStart, rangeEnd)
+                if smartBake == True:
+                    reduceKeys(getBakePlugs(temp_locator, getConstraintAttribute(record["constraintType"])), rangeStart, rangeEnd, smartBakeTolerance)
+        storeSource(temp_locator, source["start"], source["end"], source["interval"], signatures)
+
+    if refreshedLocators == 0:
+        assistMessage("The selected locators are up to date", 3000, False)
+    else:
+        assistMessage("Refreshed {0} locators - sampled {1} frames".format(refreshedLocators, refreshedFrames), 3000, False)
+
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+#---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+#UI LOGIC
+def userInterface():
+    if cmds.window("World_Space_Conversion", ex=True):
+        cmds.deleteUI("World_Space_Conversion")
+    
+    cmds.window("World_Space_Conversion", title="World-Space Conversion, by Petar3D", wh=[373, 245], s=False)
+    cmds.formLayout("formLayout", numberOfDivisions=100, w=373, h=245)
+
+    cmds.button("Parent_Constraint_Button", l="Parent Constraint", recomputeSize = True, bgc=[0.6220035095750363, 0.9418478675516899, 1.0], h = 50, w = 116,  c="storeParentConstraint()", parent ="formLayout")
+    formLayout("Parent_Constraint_Button", 15, 16)
+
+    cmds.button("Orient_Constraint_Button", l="Orient Constraint", recomputeSize = True, bgc=[0.6220035095750363, 1.0, 0.6220035095750363], h = 50.404921049703624, w = 116, c="storeOrientConstraint()", parent ="formLayout")
+    formLayout("Orient_Constraint_Button", 79, 16 )
+    
+    cmds.button("Point_Constraint_Button", l="Point Constraint", recomputeSize = True, bgc=[1.0, 1.0, 0.6220035095750363], h = 50, w = 116, c="storePointConstraint()",  parent ="formLayout")
+    formLayout("Point_Constraint_Button", 146, 16)
+    
+    cmds.button("Delete_Setup_Button", l="Delete Setup", recomputeSize = True, bgc=[1.0, 0.6220035095750363, 0.6220035095750363], h = 50, w = 197, c="deleteSetup()",  parent ="formLayout")
+    formLayout("Delete_Setup_Button", 16,154)
+    
+    cmds.button("Documentation", l="Documentation", recomputeSize = True, bgc=[0.8, 0.8, 0.8], h = 30, w = 100, c="documentation()",  parent ="formLayout")
+    formLayout("Documentation", 172,263)
+
+    cmds.button("Refresh_Setup_Button", l="Refresh Locator", recomputeSize = True, bgc=[0.8, 0.7, 1.0], h = 28, w = 116, c="refreshSetup()",  parent ="formLayout")
+    formLayout("Refresh_Setup_Button", 208, 16)
+
+    cmds.button("Edit_Range_Button", l="Set Range", recomputeSize = True, bgc=[0.8, 0.7, 1.0], h = 28, w = 116, c="editSetupRange()",  parent ="formLayout")
+    formLayout("Edit_Range_Button", 208, 140)
+
+    cmds.button("Compact_Setups_Button", l="Merge Locators", recomputeSize = True, bgc=[0.8, 0.7, 1.0], h = 28, w = 93, c="compactSetups()",  parent ="formLayout")
+    formLayout("Compact_Setups_Button", 208, 264)
+
+    cmds.intFieldGrp("BakeInterval_IntField", l="Bake Interval: ", numberOfFields=1, v1=1, cw = (1, 90.0), w = 198, parent ="formLayout")
+    formLayout("BakeInterval_IntField", 80, 134)
+    
+    cmds.checkBoxGrp("SmartBake_CheckBox", l="Smart Bake: ", ncb=1, l1="", cw = (1, 72), w = 92, vr=False, v1=False,  parent ="formLayout")
+    formLayout("SmartBake_CheckBox", 110,143)
+
+    cmds.checkBoxGrp("SparseBake_CheckBox", l="Sparse Bake: ", ncb=1, l1="", cw = (1, 72), w = 92, vr=False, v1=False,  parent ="formLayout")
+    formLayout("SparseBake_CheckBox", 132,143)
+
+    cmds.checkBoxGrp("MatrixDriver_CheckBox", l="Live Driver: ", ncb=1, l1="", cw = (1, 72), w = 92, vr=False, v1=False,  parent ="formLayout")
+    formLayout("MatrixDriver_CheckBox", 154,143)
+    
+    cmds.floatFieldGrp("Tolerance_FloatField", l="Tolerance", numberOfFields=1, v1=0.05, pre=3, cw = (1, 50), w = 128, parent ="formLayout")
+    formLayout("Tolerance_FloatField", 106, 231)
+
+    cmds.showWindow("World_Space_Conversion")
+     
+#MAYAPY AND BATCH SESSIONS (LIKE THE PLAYBACK BENCHMARK) IMPORT THE TOOL WITHOUT A UI TO BUILD IT IN
+if not cmds.about(batch=True):
+    userInterface()
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Undo support for the World-Space Conversion tool's API edits. Changes made through the Maya API (like writing keys with MFnAnimCurve) don't go
+on the undo queue by themselves, so this module is also a tiny plugin with one undoable command that puts them there.
+
+Description - commit(undo, redo) loads the plugin if it isn't loaded yet and runs the command, which takes the two functions and calls them whenever
+the user undoes or redoes it. Every API edit gets committed right after it's made, so it sits in the undo queue in the same order as the commands
+around it, and inside the same undo chunk.
+"""
+
+import os
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+
+COMMAND = "worldSpaceConversionApiUndo"
+PLUGIN_PATH = os.path.splitext(os.path.abspath(__file__))[0] + ".py"
+
+#THE FUNCTIONS WAITING FOR THE COMMAND TO PICK THEM UP. MAYA LOADS THE PLUGIN AS ITS OWN MODULE, SO THE COMMAND READS THIS LIST THROUGH AN IMPORT OF THIS ONE
+pending = []
+
+
+def maya_useNewAPI():
+    pass
+
+
+class ApiUndoCommand(om.MPxCommand):
+    def doIt(self, args):
+        import World_Space_Conversion_Undo as shared
+        self.undo, self.redo = shared.pending.pop()
+
+    def undoIt(self):
+        self.undo()
+
+    def redoIt(self):
+        self.redo()
+
+    def isUndoable(self):
+        return True
+
+
+def initializePlugin(plugin):
+    om.MFnPlugin(plugin).registerCommand(COMMAND, ApiUndoCommand)
+
+
+def uninitializePlugin(plugin):
+    om.MFnPlugin(plugin).deregisterCommand(COMMAND)
+
+
+def commit(undo, redo):
+    #PUTS ONE API EDIT ON THE UNDO QUEUE - undo PUTS THE SCENE BACK THE WAY IT WAS BEFORE THE EDIT, redo MAKES THE EDIT AGAIN
+    if not cmds.pluginInfo(PLUGIN_PATH, q=True, loaded=True):
+        cmds.loadPlugin(PLUGIN_PATH, quiet=True)
+    pending.append((undo, redo))
+    try:
+        getattr(cmds, COMMAND)()
+    finally:
+        del pending[:]
@@ -0,0 +1,762 @@
+'''
+Headless stand-in for the parts of Maya the World-Space Conversion tool talks to, so its hot paths can be run and measured outside of Maya.
+
+FakeCommands replaces maya.cmds. It keeps a small scene in memory - transforms and shapes with a parent hierarchy, attributes and lock states,
+connections, and anim curves as sorted [time, value] lists - and simulates the commands the tool uses to look at and edit it. Every command call
+is counted, and commands it doesn't simulate are counted as no-ops. The parts of OpenMaya the tool reads and writes keys with (selection lists,
+plugs, DG contexts, MFnAnimCurve) work on the same in-memory scene, every world matrix samples as the identity, and the rest of the API is a Stub
+that accepts anything. The scene messages are sent like in Maya - adding or removing a node, opening a file and undoing call the callbacks the
+tool added for them. That's enough to run a whole apply or delete, without checking the math the real scene would give.
+
+Scene files are JSON. Opening one either builds a synthetic scene from {"controls": N, "frames": F, "ranges": K}, or loads a scene the fake
+saved before, so a batch can apply setups to a file and clean them up again from its output.
+
+The scene is indexed the way Maya's own lookups are (children by parent, curves by node and by name), so the fake never adds a scan of its own
+to a command that is a single lookup in Maya - a path that shows up as quadratic here is quadratic in the tool.
+
+Usage - tool, cmds = loadTool(); buildScene(cmds, ...); cmds._resetCounts(); ...; cmds._getCounts()
+'''
+
+import io
+import os
+import sys
+import json
+import math
+import types
+import fnmatch
+import importlib
+import collections
+
+
+DEFAULT_VALUES = {"scaleX": 1.0, "scaleY": 1.0, "scaleZ": 1.0, "visibility": 1.0, "v": 1.0, "lineWidth": -1.0, "rotateOrder": 0}
+VECTOR_ATTRIBUTES = ["translate", "rotate", "scale", "rotatePivot", "rotatePivotTranslate", "jointOrient"]
+TRANSFORM_TYPES = ["transform", "joint"]
+
+
+class FakeCommands(object):
+    #STAND-IN FOR maya.cmds. STATE LIVES IN UNDERSCORE ATTRIBUTES, EVERYTHING ELSE IS A COMMAND AND GETS COUNTED WHEN IT'S LOOKED UP
+    def __init__(self):
+        self._nodes = {}
+        self._children = {}
+        self._curves = {}
+        self._curveNodes = {}
+        self._nodeCurves = {}
+        self._connections = {}
+        self._selection = []
+        self._time = 1.0
+        self._playback = [1.0, 1.0]
+        self._sceneName = ""
+        self._counts = collections.Counter()
+        #THE CALLBACKS BELONG TO THE SESSION, NOT THE SCENE, SO OPENING A FILE KEEPS THEM
+        if "_callbacks" not in self.__dict__:
+            self._callbacks = {}
+
+    def __getattribute__(self, name):
+        if not name.startswith("_"):
+            object.__getattribute__(self, "_counts")[name] += 1
+        return object.__getattribute__(self, name)
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            return None
+        return command
+
+    #BOOKKEEPING - CALLED BY THE BENCHMARKS AND BY THE OTHER COMMANDS, SO THEY DON'T GET COUNTED
+    def _resetCounts(self):
+        self._counts.clear()
+
+    def _getCounts(self):
+        return collections.Counter(self._counts)
+
+    def _addCallback(self, message, function, clientData=None, nodeType=None):
+        callbackId = len(self._callbacks) + 1
+        while callbackId in self._callbacks:
+            callbackId += 1
+        self._callbacks[callbackId] = (message, function, clientData, nodeType)
+        return callbackId
+
+    def _notify(self, message, node=None, *args):
+        #CALLS THE CALLBACKS OF A MESSAGE LIKE MAYA DOES, THE NODE MESSAGES ONLY FOR THE NODE TYPE THEY WERE ADDED FOR
+        for callbackMessage, function, clientData, nodeType in list(self._callbacks.values()):
+            if callbackMessage != message:
+                continue
+            if node == None:
+                function(*(args + (clientData,)))
+            elif nodeType == None or self._isType(self._nodes[node]["type"], nodeType):
+                function(*((node,) + args + (clientData,)))
+
+    def _addNode(self, name, nodeType="transform", parent=None):
+        self._nodes[name] = {"type": nodeType, "parent": parent, "attrs": {}, "locked": set(), "lockedNode": False}
+        self._children.setdefault(parent, []).append(name)
+        self._notify("nodeAdded", name)
+        return name
+
+    def _removeNode(self, name):
+        for child in list(self._children.get(name, [])):
+            self._removeNode(child)
+        for plug in list(self._nodeCurves.get(name, [])):
+            self._removeCurve(plug)
+        self._notify("nodeRemoved", name)
+        node = self._nodes.pop(name)
+        self._children[node["parent"]].remove(name)
+        self._children.pop(name, None)
+        self._connections.pop(name, None)
+
+    def _getCurve(self, plug, create=False):
+        #RETURNS THE KEYS OF A CHANNEL. A NEW CURVE IS A NODE OF ITS OWN NAMED AFTER THE CHANNEL, LIKE IN MAYA
+        if plug not in self._curves and create:
+            node, attr = self._splitPlug(plug)
+            curveType = "animCurveTL" if attr.startswith("translate") else "animCurveTA" if attr.startswith("rotate") else "animCurveTU"
+            curveNode = self._addNode("{0}_{1}".format(node, attr), curveType)
+            self._curves[plug] = []
+            self._curveNodes[curveNode] = plug
+            self._nodeCurves.setdefault(node, []).append(plug)
+        return self._curves.get(plug)
+
+    def _removeCurve(self, plug):
+        node, attr = self._splitPlug(plug)
+        self._curves.pop(plug)
+        self._nodeCurves[node].remove(plug)
+        curveNode = "{0}_{1}".format(node, attr)
+        self._curveNodes.pop(curveNode)
+        self._removeNode(curveNode)
+
+    def _getPath(self, name):
+        path = []
+        while name != None:
+            path.insert(0, name)
+            name = self._nodes[name]["parent"]
+        return "|" + "|".join(path)
+
+    def _getName(self, name):
+        return name.split("|")[-1]
+
+    def _splitPlug(self, plug):
+        node, attr = plug.split(".", 1)
+        return self._getName(node), attr
+
+    def _flatten(self, items):
+        if isinstance(items, (list, tuple, set)):
+            return [name for item in items for name in self._flatten(item)]
+        return [items]
+
+    def _getPlugs(self, target, at=None):
+        #TURNS THE TARGET OF A KEY COMMAND INTO CHANNELS - PLUGS STAY AS THEY ARE, CURVE NODES BECOME THEIR CHANNEL, AND NODES EXPAND INTO THE ATTRIBUTES ASKED FOR (OR ALL THEIR KEYED ONES)
+        plugs = []
+        for item in self._flatten(target):
+            if "." in item:
+                plugs.append(item)
+            elif item in self._curveNodes:
+                plugs.append(self._curveNodes[item])
+            elif at == None:
+                plugs += self._nodeCurves.get(self._getName(item), [])
+            else:
+                for attribute in self._flatten(at):
+                    if attribute in VECTOR_ATTRIBUTES:
+                        plugs += ["{0}.{1}{2}".format(item, attribute, axis) for axis in "XYZ"]
+                    else:
+                        plugs.append("{0}.{1}".format(item, attribute))
+        return plugs
+
+    def _getRanges(self, t):
+        if t == None:
+            return None
+        if isinstance(t, list):
+            return [tuple(sorted(item)) if isinstance(item, tuple) else (item, item) for item in t]
+        if isinstance(t, tuple):
+            return [tuple(sorted(t))]
+        return [(t, t)]
+
+    def _isType(self, nodeType, typeName):
+        #LIKE MAYA, THE ABSTRACT TYPES MATCH EVERY NODE TYPE THAT INHERITS FROM THEM
+        if typeName == "constraint":
+            return nodeType.endswith("Constraint")
+        if typeName == "animCurve":
+            return nodeType.startswith("animCurve")
+        if typeName == "transform":
+            return nodeType in TRANSFORM_TYPES or nodeType.endswith("Constraint")
+        return nodeType == typeName
+
+    def _inRanges(self, time, ranges):
+        return ranges == None or any(start <= time <= end for start, end in ranges)
+
+    def _evaluate(self, keys):
+        #STEPPED EVALUATION IS ENOUGH FOR THE TOOL'S SWITCH CURVES, WHICH ARE ALL THE BENCHMARKS READ BACK
+        previous = keys[0]
+        for key in keys:
+            if key[0] > self._time:
+                break
+            previous = key
+        return previous[1]
+
+    #NAME LOOKUPS
+    def ls(self, *names, **kwargs):
+        if kwargs.get("sl") or kwargs.get("selection"):
+            names = list(self._selection)
+        names = self._flatten(list(names))
+        #LIKE MAYA, ls() WITH AN EMPTY LIST OF NAMES RETURNS EVERY NODE IN THE SCENE
+        if len(names) == 0 and not (kwargs.get("sl") or kwargs.get("selection")):
+            names = list(self._nodes)
+        found = []
+        for name in names:
+            if "*" in name:
+                found += [node for node in self._nodes if fnmatch.fnmatchcase(node, name)]
+            elif self._getName(name) in self._nodes:
+                found.append(self._getName(name))
+        nodeTypes = kwargs.get("type")
+        if nodeTypes != None:
+            nodeTypes = self._flatten(nodeTypes)
+            found = [name for name in found if any(self._isType(self._nodes[name]["type"], nodeType) for nodeType in nodeTypes)]
+        if kwargs.get("tr") or kwargs.get("transforms"):
+            found = [name for name in found if self._nodes[name]["type"] in TRANSFORM_TYPES]
+        #NOTHING IN THE FAKE SCENE COMES FROM A REFERENCE
+        if kwargs.get("rn") or kwargs.get("referencedNodes"):
+            return []
+        if kwargs.get("long"):
+            return [self._getPath(name) for name in found]
+        return found
+
+    def objExists(self, name):
+        return self._getName(name.split(".")[0]) in self._nodes
+
+    def objectType(self, name, isAType=None):
+        nodeType = self._nodes[self._getName(name)]["type"]
+        if isAType != None:
+            return nodeType == isAType
+        return nodeType
+
+    def listRelatives(self, names, shapes=False, children=False, parent=False, fullPath=False, type=None, **kwargs):
+        found = []
+        for name in self._flatten(names):
+            name = self._getName(name)
+            if parent:
+                if self._nodes[name]["parent"] != None:
+                    found.append(self._nodes[name]["parent"])
+                continue
+            for child in self._children.get(name, []):
+                if (not shapes or self._nodes[child]["type"] not in TRANSFORM_TYPES) and (type == None or self._isType(self._nodes[child]["type"], type)):
+                    found.append(child)
+        if len(found) == 0:
+            return None
+        return [self._getPath(item) for item in found] if fullPath else found
+
+    def listHistory(self, names, **kwargs):
+        #A NODE'S HISTORY IS ITSELF, THE CURVES ON ITS CHANNELS, AND WHATEVER IS CONNECTED INTO IT
+        history = []
+        for name in self._flatten(names):
+            name = self._getName(name)
+            history.append(name)
+            history += ["{0}_{1}".format(name, self._splitPlug(plug)[1]) for plug in self._nodeCurves.get(name, [])]
+            history += [self._splitPlug(source)[0] for source, destination in self._connections.get(name, []) if self._splitPlug(destination)[0] == name]
+        return history
+
+    def referenceQuery(self, name, isNodeReferenced=False, **kwargs):
+        return False
+
+    def attributeQuery(self, attribute, node=None, exists=False, **kwargs):
+        return attribute in self._nodes[self._getName(node)]["attrs"]
+
+    def listAttr(self, name, locked=False, **kwargs):
+        node = self._nodes[self._getName(name)]
+        attributes = sorted(node["locked"]) if locked else sorted(node["attrs"])
+        return attributes or None
+
+    #NODES AND CONNECTIONS
+    def createNode(self, nodeType, n=None, **kwargs):
+        return self._addNode(n or "{0}{1}".format(nodeType, len(self._nodes)), nodeType)
+
+    def curve(self, n=None, **kwargs):
+        name = self._addNode(n or "curve{0}".format(len(self._nodes)))
+        self._addNode(name + "Shape", "nurbsCurve", name)
+        return name
+
+    def _constraint(self, constraintType, parent, child=None, q=False, e=False, rm=False, targetList=False, weightAliasList=False, **kwargs):
+        #LIKE MAYA, CONSTRAINING A CHILD AGAIN ADDS THE PARENT AS THE NEXT TARGET OF ITS EXISTING CONSTRAINT. A QUERY GOES ON THE CONSTRAINT ITSELF, A REMOVE TAKES THE PARENT OFF THE CHILD'S CONSTRAINT AND LEAVES ITS WEIGHT CURVE BEHIND, LIKE MAYA DOES
+        if q:
+            targets = self._getTargets(self._getName(parent))
+            return [target for index, target, weight in targets] if targetList else [weight for index, target, weight in targets]
+        name = "{0}_{1}Constraint1".format(self._getName(child), constraintType)
+        if e and rm:
+            for index, target, weight in self._getTargets(name):
+                if target == self._getName(parent):
+                    self._connections[name] = [connection for connection in self._connections[name] if "target[{0}]".format(index) not in connection[1]]
+            return None
+        if name not in self._nodes:
+            self._addNode(name, constraintType + "Constraint", self._getName(child))
+        index = max([targetIndex + 1 for targetIndex, target, weight in self._getTargets(name)] or [0])
+        FakeCommands.connectAttr(self, parent + ".parentMatrix[0]", "{0}.target[{1}].targetParentMatrix".format(name, index))
+        #THE WEIGHT IS NAMED AFTER THE PARENT WITHOUT ITS NAMESPACE, LIKE IN MAYA
+        FakeCommands.connectAttr(self, "{0}.{1}W{2}".format(name, self._getName(parent).split(":")[-1], index), "{0}.target[{1}].targetWeight".format(name, index))
+        return [name]
+
+    def _getTargets(self, constraint):
+        #[(INDEX, TARGET, WEIGHT ATTRIBUTE)] FOR EVERY TARGET OF A CONSTRAINT, READ FROM ITS CONNECTIONS
+        parents, weights = {}, {}
+        for source, destination in self._connections.get(constraint, []):
+            if destination.startswith(constraint + ".target["):
+                index = int(destination.split("[")[1].split("]")[0])
+                if destination.endswith("targetParentMatrix"):
+                    parents[index] = self._splitPlug(source)[0]
+                elif destination.endswith("targetWeight"):
+                    weights[index] = self._splitPlug(source)[1]
+        return [(index, parents[index], weights[index]) for index in sorted(weights)]
+
+    def parentConstraint(self, parent, child=None, **kwargs):
+        return self._constraint("parent", parent, child, **kwargs)
+
+    def orientConstraint(self, parent, child=None, **kwargs):
+        return self._constraint("orient", parent, child, **kwargs)
+
+    def pointConstraint(self, parent, child=None, **kwargs):
+        return self._constraint("point", parent, child, **kwargs)
+
+    def delete(self, names):
+        for name in self._flatten(names):
+            if self._getName(name) in self._nodes:
+                self._removeNode(self._getName(name))
+
+    def lockNode(self, name, q=False, l=None, **kwargs):
+        if q:
+            return [self._nodes[self._getName(name)]["lockedNode"]]
+        self._nodes[self._getName(name)]["lockedNode"] = l
+
+    def connectAttr(self, source, destination, **kwargs):
+        for node in set([self._splitPlug(source)[0], self._splitPlug(destination)[0]]):
+            self._connections.setdefault(node, []).append((source, destination))
+
+    def listConnections(self, targets, s=True, d=True, type=None, c=False, **kwargs):
+        found = []
+        for target in self._flatten(targets):
+            node = self._getName(target.split(".")[0])
+            for source, destination in self._connections.get(node, []):
+                if s and (destination == target or self._splitPlug(destination)[0] == target):
+                    found.append((destination, self._splitPlug(source)[0]))
+                if d and (source == target or self._splitPlug(source)[0] == target):
+                    found.append((source, self._splitPlug(destination)[0]))
+        if type != None:
+            found = [(plug, other) for plug, other in found if other in self._nodes and self._isType(self._nodes[other]["type"], type)]
+        if len(found) == 0:
+            return None
+        if c:
+            return [item for pair in found for item in pair]
+        return [other for plug, other in found]
+
+    #ATTRIBUTES
+    def getAttr(self, plug, l=False, lock=False, **kwargs):
+        node, attr = self._splitPlug(plug)
+        if l or lock:
+            return attr in self._nodes[node]["locked"]
+        if plug in self._curves:
+            return self._evaluate(self._curves[plug])
+        attrs = self._nodes[node]["attrs"]
+        if attr in VECTOR_ATTRIBUTES:
+            return [tuple(attrs.get(attr + axis, DEFAULT_VALUES.get(attr + axis, 0.0)) for axis in "XYZ")]
+        return attrs.get(attr, DEFAULT_VALUES.get(attr, 0.0))
+
+    def setAttr(self, plug, *values, **kwargs):
+        node, attr = self._splitPlug(plug)
+        if kwargs.get("lock") != None or kwargs.get("l") != None:
+            (self._nodes[node]["locked"].add if kwargs.get("lock", kwargs.get("l")) else self._nodes[node]["locked"].discard)(attr)
+        if len(values) == 1:
+            self._nodes[node]["attrs"][attr] = values[0]
+
+    def addAttr(self, node, ln=None, dv=0, **kwargs):
+        self._nodes[self._getName(node)]["attrs"][ln] = dv
+
+    def xform(self, name, q=False, scale=None, **kwargs):
+        attrs = self._nodes[self._getName(name)]["attrs"]
+        if q:
+            return [attrs.get("scale" + axis, 1.0) for axis in "XYZ"]
+        for axis, value in zip("XYZ", scale or []):
+            attrs["scale" + axis] = value
+
+    def exactWorldBoundingBox(self, name, **kwargs):
+        return [-1.0, -1.0, -1.0, 1.0, 1.0, 1.0]
+
+    def matchTransform(self, target, source, **kwargs):
+        for attribute in ["translate", "rotate"]:
+            for axis in "XYZ":
+                plug = "{0}.{1}{2}".format(self._getName(source), attribute, axis)
+                self._nodes[self._getName(target)]["attrs"][attribute + axis] = FakeCommands.getAttr(self, plug)
+
+    #ANIM CURVES
+    def keyframe(self, target, q=False, e=False, t=None, at=None, tc=False, vc=None, eval=False, **kwargs):
+        ranges = self._getRanges(t)
+        keys = []
+        for plug in self._getPlugs(target, at):
+            for key in self._getCurve(plug) or []:
+                if self._inRanges(key[0], ranges):
+                    keys.append(key)
+                    if e and vc != None:
+                        key[1] = vc
+        if e:
+            return len(keys)
+        if len(keys) == 0:
+            return None
+        if eval or (vc and not tc):
+            return [value for time, value in keys]
+        if tc and vc:
+            return [item for key in keys for item in key]
+        return [time for time, value in keys]
+
+    def setKeyframe(self, target, t=None, value=None, v=None, at=None, i=False, **kwargs):
+        value = v if value == None else value
+        times = self._flatten(t) if t != None else [self._time]
+        for plug in self._getPlugs(target, at):
+            if i and plug not in self._curves:
+                continue
+            current = FakeCommands.getAttr(self, plug)
+            keys = self._getCurve(plug, create=True)
+            for time in times:
+                keys[:] = [key for key in keys if key[0] != time] + [[time, value if value != None else current]]
+            keys.sort()
+
+    def cutKey(self, target, t=None, at=None, clear=False, **kwargs):
+        ranges = self._getRanges(t)
+        for plug in self._getPlugs(target, at):
+            keys = self._getCurve(plug)
+            if keys != None:
+                keys[:] = [key for key in keys if ranges != None and not self._inRanges(key[0], ranges)]
+                if len(keys) == 0:
+                    self._removeCurve(plug)
+
+    def currentTime(self, time=None, q=False, **kwargs):
+        if q:
+            return self._time
+        self._time = time
+
+    def playbackOptions(self, q=False, min=None, max=None, **kwargs):
+        if q:
+            return self._playback[0] if min else self._playback[1]
+        if min != None:
+            self._playback[0] = float(min)
+        if max != None:
+            self._playback[1] = float(max)
+
+    def about(self, batch=False, **kwargs):
+        return True
+
+    #SCENE FILES
+    def file(self, path=None, q=False, sceneName=False, open=False, new=False, rename=None, save=False, **kwargs):
+        if q:
+            return self._sceneName
+        if new or open:
+            FakeCommands.__init__(self)
+        if open:
+            with io.open(path, "r") as sceneFile:
+                scene = json.load(sceneFile)
+            if "nodes" in scene:
+                self._load(scene)
+            else:
+                buildScene(self, scene["controls"], scene["frames"], scene.get("ranges", 0))
+            self._sceneName = path
+        if new or open:
+            self._notify("afterOpen" if open else "afterNew")
+        if rename != None:
+            self._sceneName = rename
+        if save:
+            with io.open(self._sceneName, "w") as sceneFile:
+                sceneFile.write(json.dumps(self._dump(), sort_keys=True))
+        return self._sceneName
+
+    def undo(self, **kwargs):
+        #NOTHING IS RECORDED, SO AN UNDO ONLY TELLS THE CALLBACKS IT HAPPENED
+        self._notify("Undo")
+
+    def redo(self, **kwargs):
+        self._notify("Redo")
+
+    def _dump(self):
+        connections = sorted(set([connection for nodeConnections in self._connections.values() for connection in nodeConnections]))
+        nodes = dict([(name, dict(node, locked=sorted(node["locked"]))) for name, node in self._nodes.items()])
+        return {"nodes": nodes, "order": list(self._nodes), "curves": self._curves, "connections": connections, "playback": self._playback}
+
+    def _load(self, scene):
+        #NODES ARE ADDED IN THE ORDER THEY WERE SAVED, SO EVERY PARENT EXISTS BEFORE ITS CHILDREN
+        for name in scene["order"]:
+            node = scene["nodes"][name]
+            self._addNode(name, node["type"], node["parent"])
+            self._nodes[name].update({"attrs": node["attrs"], "locked": set(node["locked"]), "lockedNode": node["lockedNode"]})
+        for plug, keys in scene["curves"].items():
+            node, attr = self._splitPlug(plug)
+            self._curves[plug] = keys
+            self._curveNodes["{0}_{1}".format(node, attr)] = plug
+            self._nodeCurves.setdefault(node, []).append(plug)
+        for source, destination in scene["connections"]:
+            FakeCommands.connectAttr(self, source, destination)
+        self._playback = scene["playback"]
+
+
+class Stub(object):
+    #STAND-IN FOR maya.mel AND THE OPENMAYA MODULES, IT ACCEPTS ANYTHING AND RETURNS ITSELF
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+def buildApi(cmds):
+    #BUILDS THE FAKE maya.api.OpenMaya AND OpenMayaAnim ON TOP OF A FakeCommands SCENE. TIMES ARE ALWAYS IN FRAMES AND DISTANCES IN CENTIMETERS, ANGLES ARE KEPT IN DEGREES ON THE CURVES LIKE THE COMMANDS SEE THEM
+    om = Stub()
+    oma = Stub()
+
+    class MTime(object):
+        kSeconds = 6
+
+        def __init__(self, value=0.0, unit=None):
+            self.value = float(value)
+
+        def asUnits(self, unit):
+            return self.value
+
+        @staticmethod
+        def uiUnit():
+            return "film"
+
+    class MDistance(object):
+        def __init__(self, value=0.0, unit=None):
+            self.value = value
+
+        def asCentimeters(self):
+            return self.value
+
+        def asUnits(self, unit):
+            return self.value
+
+        @staticmethod
+        def uiUnit():
+            return "cm"
+
+        @staticmethod
+        def uiToInternal(value):
+            return value
+
+    class MAngle(object):
+        def __init__(self, value=0.0, unit="radians"):
+            self.value = math.radians(value) if unit == "degrees" else value
+
+        def asRadians(self):
+            return self.value
+
+        def asUnits(self, unit):
+            return math.degrees(self.value) if unit == "degrees" else self.value
+
+        @staticmethod
+        def uiUnit():
+            return "degrees"
+
+        @staticmethod
+        def uiToInternal(value):
+            return math.radians(value)
+
+    class MPlug(object):
+        def __init__(self, name):
+            self._name = name
+
+        def name(self):
+            return self._name
+
+        def asMObject(self, context=None):
+            return self._name
+
+    class MSelectionList(object):
+        def __init__(self):
+            self.items = []
+
+        def add(self, name):
+            self.items.append(name)
+
+        def getPlug(self, index):
+            return MPlug(self.items[index])
+
+        def getDependNode(self, index):
+            return self.items[index]
+
+    class MDGContext(object):
+        #MAKING A CONTEXT CURRENT MOVES THE FAKE'S EVALUATION TIME, THE CONTEXT IT RETURNS PUTS IT BACK
+        def __init__(self, time=None):
+            self.time = time.value if time != None else cmds._time
+
+        def makeCurrent(self):
+            previous = MDGContext()
+            cmds._time = self.time
+            return previous
+
+    class MFnMatrixData(object):
+        def __init__(self, data=None):
+            pass
+
+        def matrix(self):
+            return [1.0 if row == column else 0.0 for row in range(4) for column in range(4)]
+
+    class MFnAnimCurve(object):
+        kAnimCurveTA, kAnimCurveTL, kAnimCurveTT, kAnimCurveTU, kAnimCurveUA, kAnimCurveUL = range(6)
+        kTangentFixed = 1
+        kTangentAuto = 10
+        CURVE_TYPES = {"animCurveTA": kAnimCurveTA, "animCurveTL": kAnimCurveTL, "animCurveTU": kAnimCurveTU}
+
+        def __init__(self, curve):
+            self._curve = curve
+            self._keys = cmds._curves[cmds._curveNodes[curve]]
+            self.animCurveType = MFnAnimCurve.CURVE_TYPES[cmds._nodes[curve]["type"]]
+            self._scale = math.radians(1.0) if self.animCurveType == MFnAnimCurve.kAnimCurveTA else 1.0
+            self.preInfinityType = self.postInfinityType = 0
+            self.isWeighted = False
+
+        def __getattr__(self, name):
+            #THE TANGENT SETTERS DON'T CHANGE ANYTHING THE FAKE EVALUATES
+            if not name.startswith("set"):
+                raise AttributeError(name)
+            return lambda *args, **kwargs: None
+
+        @property
+        def numKeys(self):
+            return len(self._keys)
+
+        def name(self):
+            return self._curve
+
+        def input(self, index):
+            return MTime(self._keys[index][0])
+
+        def value(self, index):
+            return self._keys[index][1] * self._scale
+
+        def inTangentType(self, index):
+            return MFnAnimCurve.kTangentAuto
+
+        def outTangentType(self, index):
+            return MFnAnimCurve.kTangentAuto
+
+        def getTangentXY(self, index, isInTangent):
+            return (1.0, 0.0)
+
+        def getTangentAngleWeight(self, index, isInTangent):
+            return MAngle(0.0), 1.0
+
+        def evaluate(self, time):
+            previous = self._keys[0]
+            for key in self._keys:
+                if key[0] > time.value:
+                    break
+                previous = key
+            return previous[1] * self._scale
+
+        def find(self, time):
+            for index, key in enumerate(self._keys):
+                if key[0] == time.value:
+                    return index
+            return None
+
+        def remove(self, index, change=None):
+            del self._keys[index]
+
+        def addKeys(self, times, values, tangentInType=None, tangentOutType=None, keepExistingKeys=False, change=None):
+            #LIKE MAYA, UNLESS THE EXISTING KEYS ARE KEPT, EVERYTHING BETWEEN THE FIRST AND THE LAST NEW KEY GETS REPLACED
+            times = [time.value for time in times]
+            keys = [key for key in self._keys if (keepExistingKeys or not min(times) <= key[0] <= max(times)) and key[0] not in times]
+            self._keys[:] = sorted(keys + [[time, value / self._scale] for time, value in zip(times, values)])
+
+    class MAnimUtil(object):
+        @staticmethod
+        def findAnimation(plug):
+            node, attr = cmds._splitPlug(plug.name())
+            if "{0}.{1}".format(node, attr) not in cmds._curves:
+                return []
+            return ["{0}_{1}".format(node, attr)]
+
+    class MFnDependencyNode(object):
+        #THE FAKE'S MOBJECTS ARE THE NODE NAMES
+        def __init__(self, node):
+            self._node = node
+
+        def name(self):
+            return self._node
+
+    class MDGMessage(object):
+        @staticmethod
+        def addNodeAddedCallback(function, nodeType="dependNode", clientData=None):
+            return cmds._addCallback("nodeAdded", function, clientData, None if nodeType == "dependNode" else nodeType)
+
+        @staticmethod
+        def addNodeRemovedCallback(function, nodeType="dependNode", clientData=None):
+            return cmds._addCallback("nodeRemoved", function, clientData, None if nodeType == "dependNode" else nodeType)
+
+    class MNodeMessage(object):
+        #NOTHING RENAMES NODES IN THE FAKE, SO THESE ARE KEPT BUT NEVER CALLED
+        @staticmethod
+        def addNameChangedCallback(node, function, clientData=None):
+            return cmds._addCallback("nameChanged", function, clientData)
+
+    class MSceneMessage(object):
+        kAfterOpen, kAfterNew = "afterOpen", "afterNew"
+
+        @staticmethod
+        def addCallback(message, function, clientData=None):
+            return cmds._addCallback(message, function, clientData)
+
+    class MEventMessage(object):
+        @staticmethod
+        def addEventCallback(event, function, clientData=None):
+            return cmds._addCallback(event, function, clientData)
+
+    class MMessage(object):
+        @staticmethod
+        def removeCallbacks(callbackIds):
+            for callbackId in callbackIds:
+                cmds._callbacks.pop(callbackId, None)
+
+    class MAnimCurveChange(object):
+        def undoIt(self):
+            pass
+
+        def redoIt(self):
+            pass
+
+    om.MTime, om.MDistance, om.MAngle, om.MSelectionList, om.MDGContext, om.MFnMatrixData = MTime, MDistance, MAngle, MSelectionList, MDGContext, MFnMatrixData
+    om.MFnDependencyNode, om.MDGMessage, om.MNodeMessage, om.MSceneMessage, om.MEventMessage, om.MMessage = MFnDependencyNode, MDGMessage, MNodeMessage, MSceneMessage, MEventMessage, MMessage
+    om.MTimeArray = om.MDoubleArray = list
+    #THE UNDO MODULE SUBCLASSES MPxCommand, SO THAT ONE HAS TO BE A REAL CLASS
+    om.MPxCommand = object
+    oma.MFnAnimCurve, oma.MAnimUtil, oma.MAnimCurveChange = MFnAnimCurve, MAnimUtil, MAnimCurveChange
+    return om, oma
+
+
+def loadTool(cmds=None):
+    #PUTS THE FAKE maya PACKAGE IN sys.modules AND IMPORTS THE TOOL AGAINST IT. THE FAKE REPORTS A BATCH SESSION, SO NO UI GETS BUILT
+    cmds = cmds or FakeCommands()
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+    maya.mel = Stub()
+    maya.api = types.ModuleType("maya.api")
+    maya.api.OpenMaya, maya.api.OpenMayaAnim = buildApi(cmds)
+    sys.modules.update({"maya": maya, "maya.cmds": cmds, "maya.mel": maya.mel, "maya.api": maya.api, "maya.api.OpenMaya": maya.api.OpenMaya, "maya.api.OpenMayaAnim": maya.api.OpenMayaAnim})
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for module in ["World_Space_Conversion_UI", "World_Space_Conversion_Undo"]:
+        sys.modules.pop(module, None)
+    return importlib.import_module("World_Space_Conversion_UI"), cmds
+
+
+def buildScene(cmds, controlCount, frameCount, rangeCount):
+    #N CONTROLS UNDER ANIMATED PARENTS, BOTH KEYED ON EVERY FRAME WITH A SMOOTH MOTION LIKE A BAKE LEAVES, EACH WITH rangeCount PARTIAL RANGES ALREADY SWITCHED ON ITS SHAPE'S VISIBILITY
+    #RETURNS THE CONTROLS, AND THE FIRST FRAME AFTER THE EXISTING RANGES WHERE A NEW ONE CAN GO
+    controls = []
+    firstFreeFrame = 10 + rangeCount * 15
+    for index in range(controlCount):
+        parent = cmds._addNode("parent{0}".format(index))
+        control = cmds._addNode("control{0}".format(index), "transform", parent)
+        cmds._addNode(control + "Shape", "nurbsCurve", control)
+        for node in [parent, control]:
+            for attribute in ["translateX", "rotateY"]:
+                cmds._getCurve("{0}.{1}".format(node, attribute), create=True)[:] = [[float(frame), 10.0 * math.sin(frame * 0.05 + index) + math.sin(frame * 0.4)] for frame in range(1, frameCount + 1)]
+        keys = []
+        for start in range(10, firstFreeFrame, 15):
+            keys += [[start - 1, 1.0], [start, 0.0], [start + 5, 0.0], [start + 6, 1.0]]
+        if len(keys) != 0:
+            cmds._getCurve(control + "Shape.v", create=True)[:] = keys
+        controls.append(control)
+    cmds._playback = [1.0, float(frameCount)]
+    return controls, firstFreeFrame
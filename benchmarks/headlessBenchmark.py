@@ -0,0 +1,176 @@
+'''
+Benchmark suite for the apply and delete hot paths, run headless against the fake maya.cmds in fakeMaya.py - no Maya needed.
+
+It builds a synthetic scene of N animated controls keyed on F frames, each with K partial ranges already switched on, and runs every operation
+on all the controls the way one apply or delete would. For every operation it reports the wall time and how many Maya commands were called,
+with the commands that were called the most.
+
+The operations are the planning pass, setup() on a fresh locator, placing and removing an influence switch (which is where the old
+getPairedFrames() query went, now readInfluenceIndex() and the IntervalIndex), the upstream key query the bake samples from, and the
+key reduction that replaced pseudoSmartBake(), and then a whole apply and delete of a partial-range setup on every control. The key reduction
+is pure Python, so it only has a wall time.
+
+With --check it runs the scene again with N, F and K each made 4 times bigger, and fails if an operation's command count grew more than
+1.5 times faster than the scene did, or its wall time more than 3 times faster - that's a linear path that went quadratic. It also fails if the
+whole apply or delete didn't leave the scene the way it should, in any of the runs.
+
+Usage - python benchmarks/headlessBenchmark.py [--controls N] [--frames F] [--ranges K] [--check]
+'''
+
+import sys
+import time
+import argparse
+
+import fakeMaya
+
+
+CALL_GROWTH_LIMIT = 1.5
+TIME_GROWTH_LIMIT = 3.0
+SCALE = 4
+
+
+def getOperations(tool, controls, frameCount, timelineStart, timelineEnd):
+    #EVERY OPERATION RUNS ON ALL THE CONTROLS. THEY RUN IN THIS ORDER, AND EACH ONE LEAVES THE SCENE THE WAY THE NEXT ONE EXPECTS IT
+    shapes = [control + "Shape.v" for control in controls]
+
+    def plan():
+        tool.planConversion(controls, "parent", timelineStart, timelineEnd, True, False)
+
+    def setup():
+        for control in controls:
+            tempControl = tool.createControl(control + "_Petar3D_worldSpaceLocator_parent_IFS_{0}_{1}".format(timelineStart, timelineEnd))
+            tool.setup(control, tempControl, "parent", [], [])
+
+    def applySwitch():
+        for shape in shapes:
+            tool.applyInfluenceSwitch(shape, timelineStart, timelineEnd, tool.add, 0, 0)
+
+    def removeSwitch():
+        for shape in shapes:
+            tool.removeInfluence(shape, timelineStart, timelineEnd, "visibility")
+
+    def readIndex():
+        for shape in shapes:
+            tool.readInfluenceIndex(shape, 0)
+
+    def upstreamKeys():
+        for control in controls:
+            tool.getUpstreamKeyTimes(control, 1, frameCount)
+
+    channels = []
+    for control in controls:
+        keys = tool.cmds._getCurve(control + ".translateX")
+        channels.append(([key[0] for key in keys], [key[1] for key in keys]))
+
+    def keyReduction():
+        tool.keyReduction.reduceChannels(channels, [0.01] * len(channels))
+
+    #THE WHOLE APPLY AND DELETE, AS ONE SCENE OPERATION EACH, ON A RANGE OF THEIR OWN AFTER THE ONE THE OPERATIONS ABOVE USE. THE LOCATORS THEY MAKE AND DELETE SEND THE SCENE MESSAGES THE REGISTRY LISTENS TO
+    applyStart, applyEnd = timelineEnd + 10, timelineEnd + 20
+    locators = []
+
+    def hasKeys(plug, start, end, value=None):
+        return any(start <= key[0] <= end and (value == None or key[1] == value) for key in tool.cmds._getCurve(plug))
+
+    def apply():
+        with tool.SceneOperation("Benchmark Apply"):
+            plan, errors, warnings = tool.planConversion(controls, "parent", applyStart, applyEnd, True, False)
+            locators[:] = tool.convertControls(plan, "parent", applyStart, applyEnd, True, tool.DEFAULT_BAKE_SETTINGS)[0]
+        #EVERY CONTROL GETS A REGISTERED, BAKED LOCATOR AND ITS SHAPE IS SWITCHED OFF OVER THE RANGE
+        problems = []
+        if len(locators) != len(controls):
+            problems.append("apply made {0} locators for {1} controls".format(len(locators), len(controls)))
+        for locator in locators:
+            if not tool.cmds.objExists(locator) or tool.setupRegistry.getSetup(locator) == None:
+                problems.append("apply left an unregistered locator - " + locator)
+            elif not hasKeys(locator + ".translateX", applyStart, applyEnd):
+                problems.append("apply didn't bake the locator - " + locator)
+        for control in controls:
+            if not hasKeys(control + "Shape.v", applyStart, applyStart, 0.0):
+                problems.append("apply didn't switch the control's shape off - " + control)
+        return problems
+
+    def delete():
+        with tool.SceneOperation("Benchmark Delete"):
+            tool.deleteSetups(locators, tool.DEFAULT_BAKE_SETTINGS)
+        #THE LOCATORS AND THEIR SWITCHES ARE GONE AND THE RANGE IS BAKED BACK ONTO THE CONTROLS. THE FAKE DOESN'T EVALUATE CONSTRAINTS, SO THE BAKED VALUES AREN'T COMPARED
+        problems = []
+        for locator in locators:
+            if tool.cmds.objExists(locator) or tool.setupRegistry.getSetup(locator) != None:
+                problems.append("delete left the locator behind - " + locator)
+        for control in controls:
+            if hasKeys(control + "Shape.v", applyStart, applyEnd):
+                problems.append("delete left the control's influence switch - " + control)
+            if not hasKeys(control + ".translateX", applyStart, applyStart) or not hasKeys(control + ".translateX", applyEnd, applyEnd):
+                problems.append("delete didn't bake the range back onto the control - " + control)
+        return problems
+
+    return [("plan", plan), ("setup", setup), ("applySwitch", applySwitch), ("readIndex", readIndex), ("removeSwitch", removeSwitch),
+            ("upstreamKeys", upstreamKeys), ("keyReduction", keyReduction), ("apply", apply), ("delete", delete)]
+
+
+def measure(controlCount, frameCount, rangeCount):
+    #RETURNS {OPERATION: (MILLISECONDS, COMMAND COUNTER)} AND THE PROBLEMS THE OPERATIONS THAT CHECK THEIR RESULTS FOUND. EVERY OPERATION STARTS WITH AN EMPTY REGISTRY CACHE SO IT PAYS FOR ITS OWN QUERIES
+    tool, cmds = fakeMaya.loadTool()
+    controls, timelineStart = fakeMaya.buildScene(cmds, controlCount, frameCount, rangeCount)
+    results = {}
+    problems = []
+    for name, operation in getOperations(tool, controls, frameCount, timelineStart, timelineStart + 10):
+        tool.setupRegistry.invalidate()
+        cmds._resetCounts()
+        started = time.perf_counter()
+        operationProblems = operation()
+        results[name] = ((time.perf_counter() - started) * 1000.0, cmds._getCounts())
+        problems += ["{0}: {1}".format(name, problem) for problem in operationProblems or []]
+    return results, problems
+
+
+def report(title, results):
+    print(title)
+    print("{0:>14} | {1:>10} | {2:>8} | {3}".format("operation", "ms", "commands", "most called"))
+    for name, (elapsed, counts) in results.items():
+        mostCalled = ", ".join("{0} {1}".format(command, count) for command, count in counts.most_common(4))
+        print("{0:>14} | {1:>10.2f} | {2:>8} | {3}".format(name, elapsed, sum(counts.values()), mostCalled))
+    print("")
+
+
+def checkGrowth(base, scaled, dimension):
+    #A LINEAR PATH GROWS BY SCALE WHEN ITS DIMENSION DOES, ANYTHING PAST THE LIMITS IS REPORTED. VERY SHORT RUNS ARE TOO NOISY TO COMPARE ON TIME
+    failures = []
+    for name in base:
+        baseTime, baseCounts = base[name]
+        scaledTime, scaledCounts = scaled[name]
+        baseCalls, scaledCalls = sum(baseCounts.values()), sum(scaledCounts.values())
+        if baseCalls != 0 and scaledCalls > baseCalls * SCALE * CALL_GROWTH_LIMIT:
+            failures.append("{0}: {1} commands grew {2:.1f}x when {3} grew {4}x".format(name, baseCalls, scaledCalls / float(baseCalls), dimension, SCALE))
+        if baseTime > 5.0 and scaledTime > baseTime * SCALE * TIME_GROWTH_LIMIT:
+            failures.append("{0}: wall time grew {1:.1f}x when {2} grew {3}x".format(name, scaledTime / baseTime, dimension, SCALE))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmark of the World-Space Conversion apply and delete paths.")
+    parser.add_argument("--controls", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--ranges", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="fail if an operation grows faster than linear with the scene")
+    args = parser.parse_args()
+
+    base, failures = measure(args.controls, args.frames, args.ranges)
+    report("{0} controls, {1} frames, {2} ranges".format(args.controls, args.frames, args.ranges), base)
+    if not args.check:
+        return 0
+
+    for dimension, sizes in [("controls", (args.controls * SCALE, args.frames, args.ranges)), ("frames", (args.controls, args.frames * SCALE, args.ranges)),
+                             ("ranges", (args.controls, args.frames + args.ranges * (SCALE - 1) * 15, args.ranges * SCALE))]:
+        scaled, problems = measure(*sizes)
+        report("{0} controls, {1} frames, {2} ranges".format(*sizes), scaled)
+        failures += problems + checkGrowth(base, scaled, dimension)
+
+    for failure in failures:
+        print("FAILED - " + failure)
+    return 1 if len(failures) != 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
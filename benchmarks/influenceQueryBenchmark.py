@@ -0,0 +1,124 @@
+'''
+Micro-benchmark for the key query that applyInfluenceSwitch() does before it places a switch.
+
+It runs outside of Maya - a small stand-in for maya.cmds is put in sys.modules before the tool is imported. The stand-in keeps the keys
+of every curve in memory and counts every command that gets called, so we can compare how many Maya calls one apply costs with the old
+per-key query and with the bulk query, for curves with 10, 100 and 1,000 keys.
+
+Usage - python benchmarks/influenceQueryBenchmark.py
+'''
+
+import os
+import sys
+import time
+import types
+import importlib
+
+
+class CountingCommands(object):
+    #STAND-IN FOR maya.cmds. keyframe() IS SIMULATED ON TOP OF A DICTIONARY OF CURVES, EVERY OTHER COMMAND IS A NO-OP, AND ALL OF THEM GET COUNTED
+    def __init__(self):
+        self.curves = {}
+        self.calls = 0
+
+    def keyframe(self, curve, q=False, t=None, eval=False, tc=False, vc=False, **kwargs):
+        self.calls += 1
+        keys = self.curves.get(curve, [])
+        if t != None:
+            keys = [(frame, value) for frame, value in keys if t[0] <= frame <= t[1]]
+        if len(keys) == 0:
+            return None
+        if eval or (vc and not tc):
+            return [value for frame, value in keys]
+        if tc and vc:
+            return [item for key in keys for item in key]
+        return [frame for frame, value in keys]
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self.calls += 1
+        return command
+
+
+class Stub(object):
+    #STAND-IN FOR THE OPENMAYA CALLBACK API, IT ACCEPTS ANYTHING AND RETURNS ITSELF
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+def loadTool(cmds):
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+    maya.mel = Stub()
+    maya.api = types.ModuleType("maya.api")
+    maya.api.OpenMaya = Stub()
+    #THE UNDO MODULE SUBCLASSES MPxCommand, SO THAT ONE HAS TO BE A REAL CLASS
+    maya.api.OpenMaya.MPxCommand = object
+    maya.api.OpenMayaAnim = Stub()
+    sys.modules.update({"maya": maya, "maya.cmds": cmds, "maya.mel": maya.mel, "maya.api": maya.api, "maya.api.OpenMaya": maya.api.OpenMaya, "maya.api.OpenMayaAnim": maya.api.OpenMayaAnim})
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return importlib.import_module("World_Space_Conversion_UI")
+
+
+def legacyReadInfluenceIndex(tool, curve, storedFrameValue):
+    #THE QUERY AS IT WAS BEFORE - ONE keyframe() CALL TO LIST THE KEYS, AND ONE MORE PER KEY TO EVALUATE ITS VALUE
+    keyframes = tool.cmds.keyframe(curve, q=True)
+    storedFrames = []
+    if keyframes != None:
+        for keyframe in keyframes:
+            if tool.cmds.keyframe(curve, q=True, t=(keyframe, keyframe), eval=True)[0] == storedFrameValue:
+                storedFrames.append(keyframe)
+    return tool.IntervalIndex([(storedFrames[frame], storedFrames[frame + 1]) for frame in range(0, len(storedFrames) - 1, 2)])
+
+
+def buildCurve(keyCount, storedFrameValue):
+    #EVERY EXISTING RANGE TAKES 4 KEYS - THE SWITCH OFF AND ON AROUND IT, AND THE STORED VALUE ON ITS START AND END
+    keys = []
+    start = 10
+    while len(keys) < keyCount:
+        end = start + 5
+        keys += [(start - 1, 1 - storedFrameValue), (start, storedFrameValue), (end, storedFrameValue), (end + 1, 1 - storedFrameValue)]
+        start = end + 10
+    return keys[:keyCount], start
+
+
+def measure(tool, cmds, keyCount, repeats):
+    #ONE APPLY SWITCHES THE SAME 4 CURVES THAT worldSpaceConversion() DOES - SHAPE VISIBILITY, LOCATOR VISIBILITY, CONSTRAINT WEIGHT AND BLEND
+    curves = [("obj_shape.v", tool.add, 0, 0), ("locator_shape.v", tool.subtract, 1, 0), ("constraint.locatorW0", tool.subtract, 1, 0), ("obj.blendParent1", tool.subtract, 1, 1)]
+    calls = 0
+    started = time.perf_counter()
+    for repeat in range(repeats):
+        cmds.curves = {}
+        for curve, operator, value, storedFrameValue in curves:
+            cmds.curves[curve], timelineStart = buildCurve(keyCount, storedFrameValue)
+        tool.setupRegistry.invalidate()
+        cmds.calls = 0
+        for curve, operator, value, storedFrameValue in curves:
+            tool.applyInfluenceSwitch(curve, timelineStart, timelineStart + 20, operator, value, storedFrameValue)
+        calls += cmds.calls
+    elapsed = (time.perf_counter() - started) / repeats
+    return calls // repeats, elapsed * 1000.0
+
+
+def main():
+    cmds = CountingCommands()
+    tool = loadTool(cmds)
+    bulkReadInfluenceIndex = tool.readInfluenceIndex
+
+    print("{0:>6} | {1:>14} | {2:>14} | {3:>12} | {4:>12}".format("keys", "calls before", "calls after", "ms before", "ms after"))
+    for keyCount in [10, 100, 1000]:
+        repeats = max(1, 2000 // keyCount)
+        tool.readInfluenceIndex = lambda curve, storedFrameValue: legacyReadInfluenceIndex(tool, curve, storedFrameValue)
+        callsBefore, timeBefore = measure(tool, cmds, keyCount, repeats)
+        tool.readInfluenceIndex = bulkReadInfluenceIndex
+        callsAfter, timeAfter = measure(tool, cmds, keyCount, repeats)
+        print("{0:>6} | {1:>14} | {2:>14} | {3:>12.3f} | {4:>12.3f}".format(keyCount, callsBefore, callsAfter, timeBefore, timeAfter))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+'''
+Benchmark for the key reduction engine in World_Space_Conversion_KeyReduction.py. It doesn't need Maya.
+
+It reduces a set of synthetic channels (plus any recorded ones you pass in) and reports how many keys were kept, the largest error left
+against the samples, and how long it took. It fails if any channel ends up outside the tolerance. Recorded channels are a JSON file holding a
+list of {"times": [...], "values": [...]} objects, for example dumped from cmds.keyframe(plug, q=True, tc=True) / cmds.keyframe(plug, q=True, vc=True)
+after a dense bake.
+
+Usage - python benchmarks/keyReductionBenchmark.py [tolerance] [recordedChannels.json]
+'''
+
+import os
+import sys
+import json
+import math
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import World_Space_Conversion_KeyReduction as keyReduction
+
+
+def getSyntheticChannels(frameCount):
+    #A FEW SHAPES THAT SHOW UP IN BAKED ANIMATION - SMOOTH CYCLES, NOISY MOCAP, HOLDS, STEPPED POSES AND LINEAR DRIFT
+    random.seed(0)
+    times = [float(frame) for frame in range(frameCount)]
+    return [
+        ("sine", times, [10 * math.sin(frame / 20.0) for frame in range(frameCount)]),
+        ("mocapNoise", times, [5 * math.sin(frame / 30.0) + 2 * math.sin(frame / 7.0) + random.uniform(-0.02, 0.02) for frame in range(frameCount)]),
+        ("hold", times, [3.0] * frameCount),
+        ("steps", times, [float(frame // 100) * 4 for frame in range(frameCount)]),
+        ("linear", times, [frame * 0.25 for frame in range(frameCount)]),
+    ]
+
+
+def main():
+    tolerance = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    channels = getSyntheticChannels(3000)
+    if len(sys.argv) > 2:
+        with open(sys.argv[2]) as recordedFile:
+            for index, channel in enumerate(json.load(recordedFile)):
+                channels.append(("recorded{0}".format(index), channel["times"], channel["values"]))
+
+    failures = 0
+    print("{0:>12} | {1:>7} | {2:>6} | {3:>10} | {4:>8}".format("channel", "samples", "keys", "max error", "ms"))
+    for name, times, values in channels:
+        started = time.perf_counter()
+        keys, slopes = keyReduction.reduceChannels([(times, values)], [tolerance])[0]
+        elapsed = (time.perf_counter() - started) * 1000.0
+        maxError = keyReduction.getMaxError(times, values, keys, slopes)
+        print("{0:>12} | {1:>7} | {2:>6} | {3:>10.5f} | {4:>8.1f}".format(name, len(times), len(keys), maxError, elapsed))
+        if maxError > tolerance:
+            print("    ERROR: {0} is outside the tolerance".format(name))
+            failures += 1
+    return 1 if failures != 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+'''
+Benchmark and reference check for World_Space_Conversion_Matrix.py. It doesn't need Maya.
+
+For every rotate order it builds a long, continuously spinning animation (several full turns on every axis), turns it into world matrices,
+decomposes them back and reports the largest difference against the source angles, plus the time it took. It also checks the composition
+against a few known Maya matrices, so a change in the axis conventions shows up straight away.
+
+Usage - python benchmarks/matrixDecompositionBenchmark.py [frameCount]
+'''
+
+import os
+import sys
+import math
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import World_Space_Conversion_Matrix as matrixMath
+
+
+#WORLD MATRICES OF AN UNPARENTED LOCATOR, AS MAYA'S worldMatrix LAYS THEM OUT - (ROTATE ORDER, ROTATE IN DEGREES, MATRIX)
+MAYA_REFERENCES = [
+    (0, (90, 0, 0), [1, 0, 0, 0, 0, 0, 1, 0, 0, -1, 0, 0, 0, 0, 0, 1]),
+    (0, (0, 90, 0), [0, 0, -1, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+    (0, (0, 0, 90), [0, 1, 0, 0, -1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]),
+    (0, (90, 90, 0), [0, 0, -1, 0, 1, 0, 0, 0, 0, -1, 0, 0, 0, 0, 0, 1]),
+    (5, (90, 90, 0), [0, 1, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+]
+
+
+def checkReferences():
+    for rotateOrder, rotate, matrix in MAYA_REFERENCES:
+        composed = matrixMath.composeMatrix((0, 0, 0), [math.radians(angle) for angle in rotate], rotateOrder)
+        error = max(abs(composed[index] - matrix[index]) for index in range(16))
+        print("reference {0} {1}: {2}".format(matrixMath.ROTATE_ORDERS[rotateOrder], rotate, "ok" if error < 1e-9 else "MISMATCH ({0})".format(error)))
+
+
+def main():
+    frameCount = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    checkReferences()
+
+    print("{0:>5} | {1:>8} | {2:>14} | {3:>14} | {4:>8}".format("order", "matrices", "rotate error", "translate err", "ms"))
+    for rotateOrder in range(len(matrixMath.ROTATE_ORDERS)):
+        angles = [(0.021 * frame, 0.5 * math.sin(frame * 0.01) + 0.013 * frame, -0.017 * frame) for frame in range(frameCount)]
+        translates = [(frame * 0.1, math.sin(frame * 0.05) * 20.0, 5.0) for frame in range(frameCount)]
+        samples = []
+        for frame in range(frameCount):
+            samples += matrixMath.composeMatrix(translates[frame], angles[frame], rotateOrder, (1.5, 1.5, 1.5))
+
+        started = time.perf_counter()
+        translate, rotate = matrixMath.decomposeMatrices(samples, 0, 1, range(frameCount), rotateOrder)
+        elapsed = (time.perf_counter() - started) * 1000.0
+
+        rotateError = max(abs(rotate[axis][frame] - angles[frame][axis]) for frame in range(frameCount) for axis in range(3))
+        translateError = max(abs(translate[axis][frame] - translates[frame][axis]) for frame in range(frameCount) for axis in range(3))
+        print("{0:>5} | {1:>8} | {2:>14.2e} | {3:>14.2e} | {4:>8.1f}".format(matrixMath.ROTATE_ORDERS[rotateOrder], frameCount, rotateError, translateError, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+'''
+Playback benchmark for the two ways a setup can drive its original control - the reversed constraint network (constraint, weight curve and
+pairBlend) and the live matrix driver (multMatrix and blendMatrix on the offsetParentMatrix). It needs Maya 2020 or newer, run through mayapy.
+
+For 1, 10 and 50 setups it builds a fresh scene of animated controls under animated parents, applies a partial-range setup on every one of
+them with each driver, and then steps through the timeline, pulling the world matrix of every control on every frame. It reports the frames
+per second of that loop and how many DG nodes the setups added.
+
+Usage - mayapy benchmarks/playbackBenchmark.py [frameCount]
+'''
+
+import os
+import sys
+import time
+
+import maya.standalone
+maya.standalone.initialize(name="python")
+import maya.cmds as cmds
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import World_Space_Conversion_UI as tool
+
+
+def buildScene(setupCount, frameCount):
+    #EVERY CONTROL SITS UNDER ITS OWN ANIMATED PARENT, SO THE DRIVERS HAVE A REAL PARENT MATRIX TO CANCEL OUT
+    cmds.file(new=True, force=True)
+    cmds.playbackOptions(min=1, max=frameCount)
+    controls = []
+    for index in range(setupCount):
+        parent = cmds.group(empty=True, n="parent{0}".format(index))
+        control = cmds.circle(n="control{0}".format(index))[0]
+        cmds.parent(control, parent)
+        for frame, value in [(1, 0), (frameCount // 2, 45), (frameCount, 90)]:
+            cmds.setKeyframe(parent, at=["translateX", "rotateY"], t=frame, v=value + index)
+            cmds.setKeyframe(control, at=["translateY", "rotateZ"], t=frame, v=value * 0.5)
+        controls.append(control)
+    return controls
+
+
+def applySetups(controls, driver, timelineStart, timelineEnd):
+    #GOES THROUGH THE SAME STEPS worldSpaceConversion() DOES FOR A PARTIAL RANGE, WITH THE LOCATORS KEYED BY HAND INSTEAD OF BAKED
+    for control in controls:
+        tempControl = tool.createControl(control + "_Petar3D_worldSpaceLocator_parent_IFS_{0}_{1}".format(int(timelineStart), int(timelineEnd)))
+        tool.addSetupAttributes(tempControl, control, "parent", "IFS", timelineStart, timelineEnd, driver=driver)
+        record = tool.setupRegistry.register(tempControl)
+        cmds.matchTransform(tempControl, control)
+        for frame, value in [(timelineStart, 0), (timelineEnd, 30)]:
+            cmds.setKeyframe(tempControl, at=["translateZ", "rotateX"], t=frame, v=value)
+
+        selectionShapeNode = cmds.listRelatives(control, shapes=True)[0]
+        locatorShapeNode = cmds.listRelatives(tempControl, shapes=True)[0]
+        tool.applyInfluenceSwitch(selectionShapeNode + ".v", timelineStart, timelineEnd, tool.add, 0, 0)
+        tool.applyInfluenceSwitch(locatorShapeNode + ".v", timelineStart, timelineEnd, tool.subtract, 1, 0)
+        if driver == "matrix":
+            tool.setMatrixDriver(control, tempControl, timelineStart, timelineEnd, True)
+        else:
+            tool.setConstraintDriver(control, tempControl, record, [], [], timelineStart, timelineEnd, True)
+
+
+def measurePlayback(controls, frameCount, repeats):
+    #STEPS THROUGH THE TIMELINE THE WAY PLAYBACK DOES, AND ASKS FOR EVERY CONTROL'S WORLD MATRIX SO NOTHING IS LEFT UNEVALUATED
+    plugs = [control + ".worldMatrix[0]" for control in controls]
+    started = time.perf_counter()
+    for repeat in range(repeats):
+        for frame in range(1, frameCount + 1):
+            cmds.currentTime(frame, update=True)
+            for plug in plugs:
+                cmds.getAttr(plug)
+    elapsed = time.perf_counter() - started
+    return frameCount * repeats / elapsed
+
+
+def main():
+    frameCount = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print("evaluation mode - {0}".format(cmds.evaluationManager(q=True, mode=True)[0]))
+    print("{0:>7} | {1:>11} | {2:>7} | {3:>10}".format("setups", "driver", "nodes", "fps"))
+    for setupCount in [1, 10, 50]:
+        for driver in ["constraint", "matrix"]:
+            controls = buildScene(setupCount, frameCount)
+            tool.setupRegistry.invalidate()
+            nodeCount = len(cmds.ls(dependencyNodes=True))
+            applySetups(controls, driver, 10, frameCount - 10)
+            addedNodes = len(cmds.ls(dependencyNodes=True)) - nodeCount
+            fps = measurePlayback(controls, frameCount, max(1, 50 // setupCount))
+            print("{0:>7} | {1:>11} | {2:>7} | {3:>10.1f}".format(setupCount, driver, addedNodes, fps))
+
+
+if __name__ == "__main__":
+    main()
+    maya.standalone.uninitialize()